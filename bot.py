@@ -1,45 +1,244 @@
+import time
+
+STARTUP_STARTED = time.perf_counter()  # taken before the imports below so they are timed
+
 import asyncio
+import importlib
+import logging
 import os
+import sys
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
 
 from src.tasks.scheduler import ScheduledTasks
+from src.utils.cluster import shard_options, target_channel_ids
+from src.utils.dev_reload import start_reload_listener
 from src.utils.error_handler import handle_command_error
+from src.utils.gateway_profile import gateway_options, trim_guild_cache
+from src.utils.health import HealthCheck
+from src.utils.logs import new_correlation_id, setup_logging
+from src.utils.loop_monitor import LoopLagMonitor
+from src.utils.memory import start_memory_tracking_from_env
+from src.utils.metrics import instrument_bot, serve_routes, start_metrics_server
+from src.utils.profiler import start_profile_from_env
+from src.utils.send_queue import QueuedContext, SendQueue
+from src.utils.startup import StartupTimer
+from src.utils.supervisor import LoopSupervisor
+from src.utils.tracing import span, start_tracing
+
+startup = StartupTimer(STARTUP_STARTED)
+startup.mark('imports')
 
 # Load environment variables from .env file
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
 
-# Define the bot's command prefix and enable necessary intents
-intents = discord.Intents.default()
-intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
+# JSON log lines (LOG_FORMAT=text for plain ones), written by a listener thread.
+setup_logging()
+logger = logging.getLogger('bot')
+
+# Per-command and per-tick spans, written to TRACE_FILE when it is set.
+if start_tracing():
+    logger.info("Writing trace spans to %s", os.getenv('TRACE_FILE'))
+
+# `--profile-startup` prints the startup report as JSON after the first scheduler
+# tick and exits; `--profile-startup=path.json` also writes it to a file.
+PROFILE_STARTUP = next((arg for arg in sys.argv[1:] if arg.split('=')[0] == '--profile-startup'), None)
+
+# Dependencies the modules import on first use, loaded in a worker thread once
+# the bot is up so the first command or feed check doesn't pay for them.
+DEFERRED_IMPORTS = ['requests']
+
+
+class HeraldBotMixin:
+    """Bot that routes every outbound message through a shared priority send queue.
+
+    `gateway_profile` selects the intents and caches (see src.utils.gateway_profile);
+    under `lowmem` each guild's channel and role cache is trimmed as it arrives.
+    """
+
+    def __init__(self, *args, gateway_profile='default', message_content=True, **kwargs):
+        super().__init__(*args, **gateway_options(gateway_profile, message_content), **kwargs)
+        self.send_queue = SendQueue()
+        self.gateway_profile = gateway_profile
+        self.metrics_server = None
+        self.health_server = None
+        self.health = HealthCheck(self)
+        self.loop_monitor = None
+        self.loop_supervisor = LoopSupervisor()  # owns the scheduler's background loops
+        instrument_bot(self)
+
+        if gateway_profile == 'lowmem':
+            self.keep_channel_ids = set(target_channel_ids())
+            self.add_listener(self._trim_guild_cache, 'on_guild_available')
+            self.add_listener(self._trim_guild_cache, 'on_guild_join')
+            self.add_listener(self._trim_channel_cache, 'on_guild_channel_create')
+
+    async def _trim_guild_cache(self, guild):
+        trim_guild_cache(guild, self.keep_channel_ids)
+
+    async def _trim_channel_cache(self, channel):
+        trim_guild_cache(channel.guild, self.keep_channel_ids)
+
+    async def setup_hook(self):
+        self.send_queue.start()
+
+        # Prometheus scrapes are answered from a server thread, never on the event loop.
+        metrics_port = os.getenv('METRICS_PORT')
+        if metrics_port:
+            metrics_host = os.getenv('METRICS_HOST', '127.0.0.1')
+            try:
+                self.metrics_server = start_metrics_server(
+                    metrics_host, int(metrics_port), routes={'/loops': self.loop_supervisor.http_response})
+                logger.info("Serving metrics on http://%s:%s/metrics", metrics_host, metrics_port)
+            except (OSError, ValueError) as e:
+                logger.error("Could not start the metrics server on %s:%s: %s", metrics_host, metrics_port, e)
+
+        # Liveness and readiness probes for container orchestrators, also answered off the event loop.
+        health_port = os.getenv('HEALTH_PORT')
+        if health_port:
+            health_host = os.getenv('HEALTH_HOST', '127.0.0.1')
+            self.health.start()
+            try:
+                routes = {**self.health.routes(), '/loops': self.loop_supervisor.http_response}
+                self.health_server = serve_routes(health_host, int(health_port), routes, name='health-server')
+                logger.info("Serving health probes on http://%s:%s/healthz and /readyz", health_host, health_port)
+            except (OSError, ValueError) as e:
+                logger.error("Could not start the health server on %s:%s: %s", health_host, health_port, e)
+
+        # Watchdog that reports the stack of anything blocking the event loop.
+        if os.getenv('LOOP_MONITOR', 'false').lower() == 'true':
+            threshold_ms = float(os.getenv('LOOP_LAG_THRESHOLD_MS', '100'))
+            self.loop_monitor = LoopLagMonitor(threshold=threshold_ms / 1000)
+            self.loop_monitor.start()
+            logger.info("Event loop monitor reporting stalls over %.0fms", threshold_ms)
+
+        # dev_runner.py sends extension reloads over stdin instead of restarting the process.
+        if os.getenv('DEV_HOT_RELOAD') == '1':
+            start_reload_listener(self, asyncio.get_running_loop())
+            logger.info("Listening for reloads from the dev runner")
+
+        # Registering slash commands with Discord is rate limited, so only do it when asked.
+        if os.getenv('SYNC_APP_COMMANDS', 'false').lower() == 'true':
+            guild_id = os.getenv('APP_COMMANDS_GUILD_ID')
+            guild = discord.Object(id=int(guild_id)) if guild_id else None
+            if guild:
+                self.tree.copy_global_to(guild=guild)
+            synced = await self.tree.sync(guild=guild)
+            logger.info("Synced %d slash commands %s", len(synced), f"to guild {guild_id}" if guild else "globally")
+
+    async def invoke(self, ctx):
+        # Everything logged while handling this command, including the error
+        # handler task dispatched from here, shares one correlation ID.
+        name = ctx.command.qualified_name if ctx.command else 'unknown'
+        new_correlation_id(ctx.command.name if ctx.command else 'command')
+        with span(f'command.{name}', kind='prefix', guild_id=ctx.guild.id if ctx.guild else None):
+            await super().invoke(ctx)
+
+    async def get_context(self, origin, *, cls=QueuedContext):
+        return await super().get_context(origin, cls=cls)
+
+    async def close(self):
+        for server in (self.metrics_server, self.health_server):
+            if server:
+                await asyncio.to_thread(server.shutdown)
+                server.server_close()
+        self.metrics_server = self.health_server = None
+        await self.health.stop()
+        if self.loop_monitor:
+            await self.loop_monitor.stop()
+        await self.loop_supervisor.stop()
+        await self.send_queue.stop()
+        await super().close()
+
+
+class HeraldCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction):
+        # Runs in the task that handles this interaction, so the ID covers the whole command.
+        new_correlation_id(interaction.command.name if interaction.command else 'interaction')
+        return True
+
+    async def _call(self, interaction):
+        # _call runs the whole interaction (autocomplete or command) in its own task.
+        name = (interaction.data or {}).get('name', 'unknown')
+        kind = 'autocomplete' if interaction.type == discord.InteractionType.autocomplete else 'slash'
+        with span(f'command.{name}', kind=kind, guild_id=interaction.guild_id):
+            await super()._call(interaction)
+
+
+class HeraldBot(HeraldBotMixin, commands.Bot):
+    """Single-connection bot."""
+
+
+class ShardedHeraldBot(HeraldBotMixin, commands.AutoShardedBot):
+    """Bot that runs several shards in this process (all of them, or SHARD_IDS)."""
+
+
+# Define the bot's command prefix and enable necessary intents.
+# Without the message content intent, prefix commands still work when the bot is
+# mentioned (e.g. "@Azeroth Herald checklist") and slash commands are unaffected.
+# GATEWAY_PROFILE=lowmem trims intents and caches for bots in many guilds, and
+# SHARD_COUNT / SHARD_IDS split the connection into shards.
+sharded, shard_kwargs = shard_options()
+bot = (ShardedHeraldBot if sharded else HeraldBot)(
+    command_prefix=commands.when_mentioned_or('!'),
+    help_command=None,
+    tree_cls=HeraldCommandTree,
+    gateway_profile=os.getenv('GATEWAY_PROFILE', 'default').lower(),
+    message_content=os.getenv('MESSAGE_CONTENT_INTENT', 'true').lower() == 'true',
+    **shard_kwargs,
+)
 
 # Initialize scheduler
 scheduler = None
 
-async def load_commands():
-    """Load all command modules."""
-    command_modules = [
-        'src.commands.checklist',
-        'src.commands.warning',
-        'src.commands.time',
-        'src.commands.affixes',
-        'src.commands.cutoffs',
-        'src.commands.help',
-        'src.commands.test',
-        'src.commands.bluetrack',
-        'src.commands.wowhead_news'
-    ]
-
-    for module in command_modules:
+COMMAND_MODULES = [
+    'src.commands.checklist',
+    'src.commands.warning',
+    'src.commands.time',
+    'src.commands.affixes',
+    'src.commands.cutoffs',
+    'src.commands.help',
+    'src.commands.test',
+    'src.commands.bluetrack',
+    'src.commands.wowhead_news',
+    'src.commands.slash',
+    'src.commands.admin'
+]
+
+async def load_command(module):
+    """Load one command module, recording how long it took."""
+    with startup.extension(module):
         try:
             await bot.load_extension(module)
-            print(f"[OK] Loaded {module}")
+            logger.info("Loaded %s", module)
         except Exception as e:
-            print(f"[ERROR] Failed to load {module}: {e}")
+            startup.errors[module] = str(e)
+            logger.error("Failed to load %s: %s", module, e)
+
+
+async def load_commands():
+    """Load all command modules concurrently; each registers its own independent cog."""
+    await asyncio.gather(*(load_command(module) for module in COMMAND_MODULES))
+    startup.mark('extensions')
+
+
+async def finish_startup():
+    """Report startup timings once the scheduler has ticked, then warm the deferred imports."""
+    await scheduler.ticked.wait()
+    startup.mark('first_tick')
+    logger.info(startup.summary())
+
+    if PROFILE_STARTUP:
+        print(startup.dump(PROFILE_STARTUP.partition('=')[2] or None))
+        await bot.close()
+        return
+
+    for module in DEFERRED_IMPORTS:
+        await asyncio.to_thread(importlib.import_module, module)
 
 
 @bot.event
@@ -47,12 +246,26 @@ async def on_ready():
     """Event that runs when the bot has successfully connected to Discord."""
     global scheduler
 
-    print(f'Logged in as {bot.user.name} ({bot.user.id})')
-    print('Bot is online and ready.')
+    first_ready = 'ready' not in startup.phases
+    if first_ready:
+        startup.mark('ready')
+
+    logger.info("Logged in as %s (%s); bot is online and ready", bot.user.name, bot.user.id)
+
+    # on_ready fires again after every full reconnect; the scheduler started on the
+    # first one is still running (its supervisor restarts any loop that died).
+    if scheduler is None:
+        scheduler = ScheduledTasks(bot)
+        scheduler.start_tasks()
+        bot.health.feeds = {'blue_tracker': scheduler.blue_tracker, 'wowhead_news': scheduler.news_scraper}
 
-    # Initialize and start scheduled tasks
-    scheduler = ScheduledTasks(bot)
-    scheduler.start_tasks()
+    if first_ready:
+        startup.mark('on_ready')
+        asyncio.create_task(finish_startup())
+        # PROFILE_SECONDS profiles a window of the live bot without needing !admin profile.
+        start_profile_from_env()
+        # MEMORY_TRACE traces allocations and logs growth between periodic snapshots.
+        start_memory_tracking_from_env()
 
 @bot.event
 async def on_command_error(ctx, error):
@@ -66,22 +279,28 @@ async def main():
 
     # Start the bot
     if TOKEN is None:
-        print("ERROR: DISCORD_TOKEN not found. Make sure you have a .env file with the token.")
+        logger.error("DISCORD_TOKEN not found. Make sure you have a .env file with the token.")
+        if PROFILE_STARTUP:
+            print(startup.dump(PROFILE_STARTUP.partition('=')[2] or None))
         return
 
     # Check for optional API key
     raider_io_api_key = os.getenv('RAIDER_IO_API_KEY')
     if raider_io_api_key is None:
-        print("WARNING: RAIDER_IO_API_KEY not found. The !affixes and !cutoffs commands will not work.")
-        print("Add RAIDER_IO_API_KEY=your_key_here to your .env file to enable API functionality.")
+        logger.warning("RAIDER_IO_API_KEY not found. The !affixes and !cutoffs commands will not work. "
+                       "Add RAIDER_IO_API_KEY=your_key_here to your .env file to enable API functionality.")
     else:
-        print("All environment variables loaded successfully.")
+        logger.info("All environment variables loaded successfully.")
 
     try:
-        await bot.start(TOKEN)
+        await bot.login(TOKEN)
+        startup.mark('login')
+        await bot.connect()
     except KeyboardInterrupt:
-        print("Bot shutting down...")
+        logger.info("Bot shutting down...")
     finally:
+        if scheduler:
+            await scheduler.close()
         await bot.close()
 
 if __name__ == "__main__":
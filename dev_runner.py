@@ -1,46 +1,73 @@
 #!/usr/bin/env python3
 """
 Development runner for the Discord bot with auto-reload functionality.
-This script watches for file changes and automatically restarts the bot.
+This script watches for file changes and applies them to the running bot.
+
+Changes are collected into batches (an editor saving several files at once
+produces one batch). Command extensions and rendering helpers are reloaded
+inside the running bot, without reconnecting to Discord. Changes to core
+modules such as bot.py or the scheduler restart the bot process. See
+src/utils/dev_reload.py for which modules are reloadable.
 """
 
 import os
 import signal
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from src.utils.dev_reload import plan_reload
+
 
-class BotRestartHandler(FileSystemEventHandler):
-    """Handler that restarts the bot when Python files change."""
+class BotReloadHandler(FileSystemEventHandler):
+    """Handler that batches Python file changes and passes each batch on once saving goes quiet."""
 
-    def __init__(self, restart_callback):
-        self.restart_callback = restart_callback
-        self.last_restart = 0
-        self.restart_delay = 2  # Minimum seconds between restarts
+    def __init__(self, batch_callback, debounce=0.5):
+        self.batch_callback = batch_callback
+        self.debounce = debounce  # Seconds without further changes before a batch is applied
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.timer = None
 
     def on_modified(self, event):
         """Called when a file is modified."""
-        if event.is_directory:
-            return
+        self._queue(event, event.src_path)
 
-        # Only restart for Python files
-        if not event.src_path.endswith('.py'):
+    def on_created(self, event):
+        """Called when a file is created (including editors that save by replacing the file)."""
+        self._queue(event, event.src_path)
+
+    def on_moved(self, event):
+        """Called when a file is renamed; the new name is what the bot will import."""
+        self._queue(event, event.dest_path)
+
+    def _queue(self, event, path):
+        if event.is_directory:
             return
 
-        # Avoid rapid restarts
-        current_time = time.time()
-        if current_time - self.last_restart < self.restart_delay:
+        # Only Python files affect the bot
+        if not path.endswith('.py'):
             return
 
-        self.last_restart = current_time
-        print(f"\n[RELOAD] File changed: {event.src_path}")
-        print("[RELOAD] Restarting bot...")
-        self.restart_callback()
+        with self.lock:
+            self.pending.add(path)
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce, self._flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _flush(self):
+        with self.lock:
+            batch, self.pending = self.pending, set()
+            self.timer = None
+        if batch:
+            self.batch_callback(batch)
 
 class BotRunner:
     """Manages running and restarting the Discord bot."""
@@ -60,10 +87,13 @@ class BotRunner:
             print(f"[START] Starting bot: {self.script_path}")
             self.process = subprocess.Popen(
                 [sys.executable, self.script_path],
+                stdin=subprocess.PIPE,  # carries reload commands to the bot
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 universal_newlines=True,
-                bufsize=1
+                bufsize=1,
+                env={**os.environ, 'DEV_HOT_RELOAD': '1', 'PYTHONUNBUFFERED': '1',
+                     'LOG_FORMAT': os.environ.get('LOG_FORMAT', 'text')}
             )
 
             # Start a thread to read and display output
@@ -107,6 +137,32 @@ class BotRunner:
         time.sleep(1)  # Brief pause between stop and start
         self.start_bot()
 
+    def apply_changes(self, paths):
+        """Reload a batch of changed files in the running bot, or restart it if a core module changed."""
+        action, modules = plan_reload(paths)
+        if action == "ignore":
+            return
+
+        names = ", ".join(modules)
+        if action == "restart" or not self._send_reload(modules):
+            print(f"\n[RELOAD] Core module changed ({names})")
+            print("[RELOAD] Restarting bot...")
+            self.restart_bot()
+            return
+
+        print(f"\n[RELOAD] Reloading in place: {names}")
+
+    def _send_reload(self, modules):
+        """Ask the running bot to reload modules over its stdin; False if it isn't running."""
+        if not self.process or self.process.poll() is not None:
+            return False
+        try:
+            self.process.stdin.write("reload " + " ".join(modules) + "\n")
+            self.process.stdin.flush()
+            return True
+        except (BrokenPipeError, OSError):
+            return False
+
     def _read_output(self):
         """Read and display bot output in real-time."""
         if not self.process:
@@ -133,7 +189,7 @@ class BotRunner:
         print(f"[WATCH] Watching for changes in: {watch_path}")
 
         # Set up file watcher
-        handler = BotRestartHandler(self.restart_bot)
+        handler = BotReloadHandler(self.apply_changes)
         self.observer = Observer()
         self.observer.schedule(handler, str(watch_path), recursive=True)
         self.observer.start()
@@ -153,7 +209,8 @@ class BotRunner:
         print("Discord Bot Development Runner")
         print("=" * 40)
         print("Features:")
-        print("  • Auto-restart on .py file changes")
+        print("  • In-place reload of commands on .py file changes")
+        print("  • Full restart when bot.py or other core modules change")
         print("  • Real-time bot output")
         print("  • Graceful shutdown handling")
         print("=" * 40)
@@ -167,7 +224,7 @@ class BotRunner:
 
             self.running = True
             print("\nBot is running in development mode!")
-            print("Edit any .py file to automatically restart the bot")
+            print("Edit a command to reload it in place; edits to core modules restart the bot")
             print("Press Ctrl+C to stop\n")
 
             # Keep the script running
@@ -0,0 +1,105 @@
+"""
+HTTP interactions runtime for the Azeroth Herald bot.
+
+An alternative to bot.py for slash-command and announcement workloads that
+never opens a gateway connection. Discord delivers interactions to
+POST /interactions on this server (set it as the Interactions Endpoint URL in
+the Developer Portal), and scheduled announcements are posted over REST.
+
+Try it locally with scripts/interaction_client.py, which sends signed payloads.
+"""
+
+import asyncio
+import logging
+import os
+
+import discord
+from aiohttp import web
+from dotenv import load_dotenv
+
+from src.tasks.scheduler import ScheduledTasks
+from src.utils.cluster import target_channel_ids
+from src.utils.interactions import create_app
+from src.utils.logs import setup_logging
+from src.utils.send_queue import SendQueue
+
+# Load environment variables from .env file
+load_dotenv()
+TOKEN = os.getenv('DISCORD_TOKEN')
+PUBLIC_KEY = os.getenv('DISCORD_PUBLIC_KEY')
+
+setup_logging()
+logger = logging.getLogger('http_bot')
+
+
+class RestClient(discord.Client):
+    """A discord.Client that only logs in over REST.
+
+    There is no gateway cache, so the channels used for announcements are
+    fetched once at startup and served from `get_channel`, and readiness means
+    "logged in" rather than "connected".
+    """
+
+    def __init__(self):
+        super().__init__(intents=discord.Intents.none())
+        self.send_queue = SendQueue()
+        self._rest_channels = {}
+        self._rest_ready = asyncio.Event()
+
+    async def start_rest(self, token, channel_ids):
+        await self.login(token)
+        self.send_queue.start()
+        for channel_id in channel_ids:
+            self._rest_channels[channel_id] = await self.fetch_channel(channel_id)
+        self._rest_ready.set()
+
+    def get_channel(self, id, /):
+        return self._rest_channels.get(id) or super().get_channel(id)
+
+    async def wait_until_ready(self):
+        await self._rest_ready.wait()
+
+    async def close(self):
+        await self.send_queue.stop()
+        await super().close()
+
+
+async def main():
+    """Start the interactions server and the REST-only scheduler."""
+    if TOKEN is None or PUBLIC_KEY is None:
+        logger.error("DISCORD_TOKEN and DISCORD_PUBLIC_KEY are required. Make sure you have a .env file with both.")
+        return
+
+    host = os.getenv('INTERACTIONS_HOST', '0.0.0.0')
+    port = int(os.getenv('INTERACTIONS_PORT', '8080'))
+
+    client = RestClient()
+    scheduler = None
+    runner = web.AppRunner(create_app(PUBLIC_KEY))
+
+    try:
+        channel_ids = target_channel_ids()
+        await client.start_rest(TOKEN, channel_ids)
+        logger.info("Logged in over REST as %s (%s)", client.user.name, client.user.id)
+
+        if channel_ids:
+            scheduler = ScheduledTasks(client)
+            scheduler.start_tasks()
+        else:
+            logger.warning("TARGET_CHANNEL_ID not set. Scheduled announcements are disabled.")
+
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        logger.info("Serving interactions on http://%s:%s/interactions", host, port)
+
+        await asyncio.Event().wait()
+    except KeyboardInterrupt:
+        logger.info("Bot shutting down...")
+    finally:
+        if scheduler:
+            await scheduler.close()
+        await runner.cleanup()
+        await client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the feed parse, classify and render hot paths, with a regression gate.
+
+    python scripts/benchmark.py                       # run, compare with the baseline
+    python scripts/benchmark.py -k parse --sizes 5000 # a subset
+    python scripts/benchmark.py --update-baseline     # record a new baseline
+    python scripts/benchmark.py --write-fixtures      # rebuild the sized feed fixtures
+
+Feeds come from tests/fixtures/: the blue tracker and Wowhead news feeds at
+50, 500 and 5,000 items (`<feed>_<size>.xml.gz`, expanded from the recorded
+feeds with fresh IDs, titles and dates), plus recorded Raider.IO affixes and
+cutoffs. Each case is run until it fills --min-time, --repeat times, and the
+best run is reported as operations per second.
+
+Raw ops/sec depend on the machine and on whatever else it is doing, so every
+timed run is paired with a run of a fixed pure-Python calibration loop.
+Results are compared with the baseline as the median ratio to that loop's
+speed, which keeps the gate meaningful across machines (of the same Python
+version) and through bursts of background load. The script exits non-zero if any case is more than
+--threshold slower than its baseline.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import timeit
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+BASELINE = os.path.join(ROOT, "scripts", "benchmark_baseline.json")
+
+SIZES = (50, 500, 5000)
+FEEDS = {
+    # feed -> (recorded fixture, pattern for an item's ID)
+    "blue_tracker": ("blue_tracker.xml", r"-(\d+)</link>"),
+    "wowhead_news": ("wowhead_news.xml", r"news=(\d+)"),
+}
+ITEM_RE = re.compile(r"<item>.*?</item>", re.DOTALL)
+PUBDATE_RE = re.compile(r"<pubDate>(.*?)</pubDate>")
+
+
+def fixture_path(feed, size):
+    return os.path.join(FIXTURES, f"{feed}_{size}.xml.gz")
+
+
+def write_fixtures():
+    """Expand each recorded feed to every size: item N reuses template N % len with a new ID and date."""
+    for feed, (name, id_pattern) in FEEDS.items():
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+            text = f.read()
+        matches = list(ITEM_RE.finditer(text))
+        head, tail = text[:matches[0].start()], text[matches[-1].end():]
+        templates = [m.group(0) for m in matches]
+        newest = parsedate_to_datetime(PUBDATE_RE.search(templates[0]).group(1))
+
+        for size in SIZES:
+            items = []
+            for n in range(size):
+                item = templates[n % len(templates)]
+                if n >= len(templates):
+                    item = item.replace(re.search(id_pattern, item).group(1), str(80_000_000 + n))
+                    item = item.replace("</title>", f" #{n}</title>", 1)
+                when = format_datetime(newest - timedelta(minutes=30 * n))
+                items.append(PUBDATE_RE.sub(f"<pubDate>{when}</pubDate>", item, count=1))
+            body = (head + "\n".join(items) + tail).encode("utf-8")
+            with open(fixture_path(feed, size), "wb") as f:
+                f.write(gzip.compress(body, mtime=0))
+            print(f"Wrote {fixture_path(feed, size)} ({size} items, {len(body) / 1024:.0f} KiB uncompressed)")
+
+
+def load_feed(feed, size):
+    with open(fixture_path(feed, size), "rb") as f:
+        body = gzip.decompress(f.read())
+    items = ET.fromstring(body).findall(".//item")
+    if len(items) != size:
+        sys.exit(f"{fixture_path(feed, size)} has {len(items)} items, expected {size}; run --write-fixtures")
+    return body, items
+
+
+def load_json(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def in_chunks(parse, items, chunk):
+    """Parse every item; parse_posts / parse_articles only look at the first `chunk` of a feed."""
+    parsed = []
+    for start in range(0, len(items), chunk):
+        parsed.extend(parse(items[start:start + chunk]))
+    return parsed
+
+
+def build_cases(sizes):
+    """name -> zero-argument callable; one call is one operation."""
+    from src.utils import blue_tracker, wowhead_news
+    from src.utils.embeds import (
+        create_affixes_embed,
+        create_blue_tracker_embed,
+        create_checklist_embed,
+        create_monday_warning_embed,
+        create_news_embed,
+        create_news_summary_embed,
+        create_season_cutoffs_embed,
+        create_time_embed,
+    )
+
+    blue = blue_tracker.BlueTrackerScraper()
+    news = wowhead_news.WowheadNewsScraper()
+    everything = 100 * 365  # days_back that keeps every recorded item in range
+    cases = {}
+
+    for size in sizes:
+        blue_body, blue_items = load_feed("blue_tracker", size)
+        news_body, news_items = load_feed("wowhead_news", size)
+        posts = in_chunks(blue.parse_posts, blue_items, 50)
+        articles = in_chunks(news.parse_articles, news_items, 25)
+        reset_posts = [p for p in posts if blue.is_reset_relevant(p)]
+        reset_articles = [a for a in articles if news.is_reset_relevant(a)]
+
+        cases.update({
+            f"xml.blue_tracker[{size}]": lambda b=blue_body: ET.fromstring(b).findall(".//item"),
+            f"xml.wowhead_news[{size}]": lambda b=news_body: ET.fromstring(b).findall(".//item"),
+            f"parse.parse_posts[{size}]": lambda i=blue_items: blue.parse_posts(i),
+            f"parse.parse_articles[{size}]": lambda i=news_items: news.parse_articles(i),
+            f"classify.blue.is_relevant_post[{size}]": lambda p=posts: [blue.is_relevant_post(x) for x in p],
+            f"classify.blue.is_reset_relevant[{size}]": lambda p=posts: [blue.is_reset_relevant(x) for x in p],
+            f"classify.news.is_relevant_article[{size}]": lambda a=articles: [news.is_relevant_article(x) for x in a],
+            f"classify.news.is_reset_relevant[{size}]": lambda a=articles: [news.is_reset_relevant(x) for x in a],
+            f"classify.get_reset_relevant_posts[{size}]":
+                lambda i=blue_items: blue.get_reset_relevant_posts(days_back=everything, items=i),
+            f"classify.get_reset_relevant_articles[{size}]":
+                lambda i=news_items: news.get_reset_relevant_articles(days_back=everything, items=i),
+            f"classify.blue.summarize_reset_info[{size}]": lambda p=reset_posts: blue.summarize_reset_info(p),
+            f"classify.news.summarize_reset_info[{size}]": lambda a=reset_articles: news.summarize_reset_info(a),
+        })
+
+    # Size-independent cases use the recorded 50-item feeds.
+    _, blue_items = load_feed("blue_tracker", 50)
+    _, news_items = load_feed("wowhead_news", 50)
+    blue_descriptions = [item.findtext("description") or "" for item in blue_items]
+    news_descriptions = [item.findtext("description") or "" for item in news_items]
+    post = blue.parse_posts(blue_items)[0]
+    article = news.parse_articles(news_items)[0]
+    blue_summary = blue.summarize_reset_info(blue.get_reset_relevant_posts(days_back=everything, items=blue_items))
+    news_summary = news.summarize_reset_info(news.get_reset_relevant_articles(items=news_items))
+    affixes = load_json("affixes.json")
+    cutoffs = load_json("cutoffs.json")
+    now = datetime(2025, 3, 4, 15, 0, tzinfo=timezone.utc)
+
+    cases.update({
+        "clean.blue._clean_description[50]":
+            lambda: [blue_tracker._clean_description(d) for d in blue_descriptions],
+        "clean.news._clean_description[50]":
+            lambda: [wowhead_news._clean_description(d) for d in news_descriptions],
+        "render.create_checklist_embed": lambda: create_checklist_embed(blue_summary),
+        "render.create_monday_warning_embed": lambda: create_monday_warning_embed(blue_summary),
+        "render.create_news_summary_embed": lambda: create_news_summary_embed(news_summary),
+        "render.create_affixes_embed": lambda: create_affixes_embed(affixes),
+        "render.create_season_cutoffs_embed": lambda: create_season_cutoffs_embed(cutoffs),
+        "render.create_blue_tracker_embed": lambda: create_blue_tracker_embed(post),
+        "render.create_news_embed": lambda: create_news_embed(article, is_reset_relevant=True),
+        "render.create_time_embed": lambda: create_time_embed(now),
+    })
+    return cases
+
+
+_WORDS = [f"Weekly Reset {i} Mythic+ Affixes" for i in range(200)]
+
+
+def calibration():
+    """A fixed mix of string, list and dict work; the yardstick results are normalised by."""
+    counts = {}
+    for word in _WORDS:
+        lowered = word.lower()
+        counts[lowered.split()[-1]] = counts.get(lowered.split()[-1], 0) + ("reset" in lowered)
+    return sorted(counts)
+
+
+def _runner(func, min_time):
+    """A timeit.Timer for `func` and the loop count that makes one run last about `min_time`."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    return timer, max(1, int(number * min_time / max(elapsed, 1e-9)))
+
+
+def measure(func, min_time, repeat):
+    """(best ops/sec, score) for `func`.
+
+    Each of the `repeat` runs is paired with a run of the calibration loop
+    straight after it, so both see the same machine state; the score is the
+    median ratio of the two speeds.
+    """
+    timer, number = _runner(func, min_time)
+    calibration_timer, calibration_number = _runner(calibration, min_time)
+    best, ratios = 0.0, []
+    for _ in range(repeat):
+        ops = number / timer.timeit(number)
+        calibration_ops = calibration_number / calibration_timer.timeit(calibration_number)
+        best = max(best, ops)
+        ratios.append(ops / calibration_ops)
+    return best, statistics.median(ratios)
+
+
+def compare(results, baseline, threshold):
+    """Print the results table; returns the names of cases slower than the threshold allows."""
+    regressions = []
+    base = baseline.get("results", {}) if baseline else {}
+    width = max(len(name) for name in results)
+    print(f"\n{'case':<{width}}  {'ops/sec':>12}  {'vs baseline':>11}")
+    for name, result in results.items():
+        line = f"{name:<{width}}  {result['ops']:>12,.1f}"
+        if name in base:
+            change = result["score"] / base[name]["score"] - 1
+            line += f"  {change:>+10.1%}"
+            if change < -threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        elif baseline:
+            line += f"  {'new':>11}"
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", help="only run cases whose name contains this")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="feed sizes (default: 50,500,5000)")
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per timed run (default: 0.1)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case, best is kept (default: 5)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="fail if a case is this much slower than the baseline (default: 0.25)")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file (default: %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true", help="save this run as the baseline")
+    parser.add_argument("--write-fixtures", action="store_true", help="rebuild the sized feed fixtures and exit")
+    parser.add_argument("--json", help="also write this run's results to a file")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    if args.write_fixtures:
+        write_fixtures()
+        return
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    cases = build_cases(sizes)
+    if args.filter:
+        cases = {name: func for name, func in cases.items() if args.filter in name}
+    if not cases:
+        sys.exit("No benchmark cases match")
+
+    print(f"Python {platform.python_version()}; {len(cases)} cases")
+    results = {}
+    for name, func in cases.items():
+        ops, score = measure(func, args.min_time, args.repeat)
+        results[name] = {"ops": round(ops, 3), "score": float(f"{score:.6g}")}
+
+    run = {"python": platform.python_version(), "results": results}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        # A filtered run only replaces the cases it ran.
+        merged = dict(baseline.get("results", {}), **results) if args.filter else results
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(dict(run, results=dict(sorted(merged.items()))), f, indent=2)
+            f.write("\n")
+        compare(results, None, args.threshold)
+        print(f"\nSaved {len(results)} results to {args.baseline}")
+        return
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to record one")
+    elif regressions:
+        print(f"\nFAILED: {len(regressions)} case(s) more than {args.threshold:.0%} slower than the baseline")
+        sys.exit(1)
+    else:
+        print(f"\nOK: no case more than {args.threshold:.0%} slower than the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Measure the bot's resident memory with many simulated guilds, per gateway profile.
+
+    python scripts/gateway_memory.py                 # 1000 guilds, both profiles
+    python scripts/gateway_memory.py --guilds 5000 --messages 50
+
+Each profile runs in a fresh interpreter. The bot is built exactly as bot.py
+builds it, then synthetic GUILD_CREATE and MESSAGE_CREATE payloads are fed
+through discord.py's gateway parser, so the same caching rules apply as on a
+live connection (no token or network needed). The payloads are the same for
+both profiles. They contain channels of every common type, roles, emojis,
+stickers, voice members and chat messages. Reported RSS is the growth over
+the freshly built bot.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Shape of each simulated guild.
+TEXT_CHANNELS = 15
+VOICE_CHANNELS = 6
+CATEGORIES = 2
+ROLES = 40
+EMOJIS = 30
+STICKERS = 5
+VOICE_MEMBERS = 5
+
+SELF_ID = 42
+NOW = datetime.now(timezone.utc).isoformat()
+
+
+def rss_mb():
+    """Current resident set size in MiB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def user_payload(user_id):
+    return {"id": str(user_id), "username": f"user{user_id}", "discriminator": "0", "avatar": None, "global_name": None}
+
+
+def member_payload(user_id=None, role_ids=()):
+    payload = {"roles": [str(r) for r in role_ids], "joined_at": NOW, "deaf": False, "mute": False, "flags": 0}
+    if user_id is not None:
+        payload["user"] = user_payload(user_id)
+    return payload
+
+
+def guild_payload(index):
+    guild_id = 10**17 + index * 1000
+    next_id = iter(range(guild_id + 1, guild_id + 1000))
+
+    categories = [next(next_id) for _ in range(CATEGORIES)]
+    channels = [{"id": str(c), "type": 4, "name": f"category-{c}", "position": i, "permission_overwrites": []}
+                for i, c in enumerate(categories)]
+    text_ids = [next(next_id) for _ in range(TEXT_CHANNELS)]
+    channels += [{"id": str(c), "type": 0, "name": f"text-{c}", "position": i, "parent_id": str(categories[0]),
+                  "topic": "Chat about the weekly reset", "nsfw": False, "rate_limit_per_user": 0,
+                  "permission_overwrites": []}
+                 for i, c in enumerate(text_ids)]
+    voice_ids = [next(next_id) for _ in range(VOICE_CHANNELS)]
+    channels += [{"id": str(c), "type": 2, "name": f"voice-{c}", "position": i, "parent_id": str(categories[-1]),
+                  "bitrate": 64000, "user_limit": 0, "permission_overwrites": []}
+                 for i, c in enumerate(voice_ids)]
+
+    role_ids = [guild_id] + [next(next_id) for _ in range(ROLES - 1)]
+    roles = [{"id": str(r), "name": "@everyone" if r == guild_id else f"role-{r}", "color": 0, "hoist": False,
+              "position": i, "permissions": "104324673", "managed": False, "mentionable": False}
+             for i, r in enumerate(role_ids)]
+
+    emojis = [{"id": str(next(next_id)), "name": f"emoji{e}", "roles": [], "require_colons": True,
+               "managed": False, "animated": False, "available": True} for e in range(EMOJIS)]
+    stickers = [{"id": str(next(next_id)), "name": f"sticker{s}", "tags": "wow", "type": 2, "format_type": 1,
+                 "description": "", "available": True, "guild_id": str(guild_id)} for s in range(STICKERS)]
+
+    voice_users = [guild_id + 500 + v for v in range(VOICE_MEMBERS)]
+    members = [member_payload(SELF_ID, role_ids[1:3])]
+    members += [member_payload(user_id, role_ids[3:6]) for user_id in voice_users]
+    voice_states = [{"user_id": str(user_id), "channel_id": str(voice_ids[0]), "session_id": "x", "deaf": False,
+                     "mute": False, "self_deaf": False, "self_mute": False, "self_video": False, "suppress": False}
+                    for user_id in voice_users]
+
+    payload = {
+        "id": str(guild_id), "name": f"Guild {index}", "owner_id": str(voice_users[0]), "member_count": 250,
+        "large": False, "features": [], "premium_tier": 0, "channels": channels, "threads": [], "roles": roles,
+        "emojis": emojis, "stickers": stickers, "members": members, "voice_states": voice_states,
+        "presences": [], "stage_instances": [], "guild_scheduled_events": [], "soundboard_sounds": [],
+    }
+    return payload, text_ids
+
+
+def message_payload(message_id, guild_id, channel_id, author_id):
+    return {
+        "id": str(message_id), "channel_id": str(channel_id), "guild_id": str(guild_id), "type": 0,
+        "author": user_payload(author_id), "member": member_payload(),
+        "content": "anyone up for keys after reset?", "timestamp": NOW, "edited_timestamp": None, "tts": False,
+        "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [], "embeds": [],
+        "pinned": False,
+    }
+
+
+async def measure(profile, guilds, messages):
+    sys.path.insert(0, ROOT)
+    import discord
+    from discord.ext import commands
+
+    from bot import HeraldBot
+
+    bot = HeraldBot(command_prefix="!", help_command=None, gateway_profile=profile)
+    async with bot:  # binds the client to this event loop without logging in
+        state = bot._connection
+        state.user = discord.ClientUser(state=state, data={**user_payload(SELF_ID), "bot": True})
+        bot.remove_listener(commands.Bot.on_message)  # not processing commands here
+
+        gc.collect()
+        baseline = rss_mb()
+
+        message_id = 10**18
+        for index in range(guilds):
+            payload, text_ids = guild_payload(index)
+            state.parse_guild_create(payload)
+            for n in range(messages):
+                message_id += 1
+                state.parse_message_create(
+                    message_payload(message_id, payload["id"], text_ids[n % len(text_ids)], 10**16 + n)
+                )
+            if index % 100 == 0:
+                await asyncio.sleep(0)  # let guild listeners (cache trimming) run
+        await asyncio.sleep(0)
+
+        gc.collect()
+        return {
+            "profile": profile,
+            "guilds": len(bot.guilds),
+            "channels": sum(len(g.channels) for g in bot.guilds),
+            "roles": sum(len(g.roles) for g in bot.guilds),
+            "members": sum(len(g.members) for g in bot.guilds),
+            "emojis": len(bot.emojis),
+            "messages": len(bot.cached_messages),
+            "rss_mb": round(rss_mb() - baseline, 1),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--guilds", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=20, help="chat messages per guild")
+    parser.add_argument("--profile", help="measure one profile in this process and print JSON")
+    args = parser.parse_args()
+
+    if args.profile:
+        print(json.dumps(asyncio.run(measure(args.profile, args.guilds, args.messages))))
+        return
+
+    sys.path.insert(0, ROOT)
+    from src.utils.gateway_profile import GATEWAY_PROFILES
+
+    rows = []
+    for profile in GATEWAY_PROFILES:
+        output = subprocess.run(
+            [sys.executable, __file__, "--profile", profile, "--guilds", str(args.guilds),
+             "--messages", str(args.messages)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        rows.append(json.loads(output.strip().splitlines()[-1]))
+
+    columns = ["profile", "guilds", "channels", "roles", "members", "emojis", "messages", "rss_mb"]
+    print("  ".join(f"{c:>9}" for c in columns))
+    for row in rows:
+        print("  ".join(f"{row[c]:>9}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Stand-in for Discord that sends signed interaction payloads to http_bot.py.
+
+    # 1. Make a throwaway key pair and start the server with its public key
+    python scripts/interaction_client.py keygen
+    DISCORD_PUBLIC_KEY=<public key> python http_bot.py
+
+    # 2. Send interactions signed with the matching private key
+    python scripts/interaction_client.py --key <private key> ping
+    python scripts/interaction_client.py --key <private key> command affixes region=eu
+    python scripts/interaction_client.py --key <private key> autocomplete news action=la
+
+Only the immediate response is printed. Deferred commands are completed by
+the server through Discord's webhook API; point DISCORD_API_BASE at a local
+HTTP listener when starting the server to capture those calls instead.
+"""
+
+import argparse
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from nacl.signing import SigningKey
+
+
+def build_payload(kind, name=None, options=None):
+    payload = {
+        "id": "1",
+        "application_id": "1",
+        "token": "local-test-token",
+        "type": {"ping": 1, "command": 2, "autocomplete": 4}[kind],
+        "version": 1,
+    }
+    if kind != "ping":
+        option_list = []
+        for index, option in enumerate(options or []):
+            key, _, value = option.partition("=")
+            entry = {"name": key, "type": 3, "value": value}
+            if kind == "autocomplete" and index == len(options) - 1:
+                entry["focused"] = True
+            option_list.append(entry)
+        payload["data"] = {"id": "1", "name": name, "type": 1, "options": option_list}
+    return payload
+
+
+def send(url, signing_key, payload):
+    body = json.dumps(payload).encode()
+    timestamp = str(int(time.time()))
+    signature = signing_key.sign(timestamp.encode() + body).signature.hex()
+    request = urllib.request.Request(url, data=body, method="POST", headers={
+        "Content-Type": "application/json",
+        "X-Signature-Ed25519": signature,
+        "X-Signature-Timestamp": timestamp,
+    })
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8080/interactions")
+    parser.add_argument("--key", help="hex private key (seed) from `keygen`")
+    parser.add_argument("kind", choices=["keygen", "ping", "command", "autocomplete"])
+    parser.add_argument("name", nargs="?", help="command name, e.g. affixes")
+    parser.add_argument("options", nargs="*", help="options as name=value")
+    args = parser.parse_args()
+
+    if args.kind == "keygen":
+        key = SigningKey.generate()
+        print(f"private key: {key.encode().hex()}")
+        print(f"public key:  {key.verify_key.encode().hex()}")
+        return
+    if not args.key:
+        parser.error("--key is required")
+    if args.kind != "ping" and not args.name:
+        parser.error("a command name is required")
+
+    status, body = send(args.url, SigningKey(bytes.fromhex(args.key)), build_payload(args.kind, args.name, args.options))
+    print(f"HTTP {status}")
+    print(json.dumps(body, indent=2, ensure_ascii=False) if isinstance(body, dict) else body)
+    sys.exit(0 if status == 200 else 1)
+
+
+if __name__ == "__main__":
+    main()
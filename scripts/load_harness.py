@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Measure command throughput of the real bot against a fake Discord gateway and REST API.
+
+    python scripts/load_harness.py                          # 5000 commands over 200 guilds
+    python scripts/load_harness.py --messages 20000 --concurrency 200 --rest-latency-ms 100
+    python scripts/load_harness.py --commands '!affixes' --upstream-latency-ms 300 --json
+
+The bot is the module-level one from bot.py with every cog from COMMAND_MODULES
+loaded, and its setup hook run (so replies go through the send queue). Guilds
+and messages arrive as synthetic GUILD_CREATE and MESSAGE_CREATE payloads fed
+through discord.py's gateway parser, as in scripts/gateway_memory.py.
+Everything the bot would send to Discord goes to an in-process fake of the
+REST API that answers after --rest-latency-ms, and Raider.IO and Wowhead are
+the in-process stub from src/utils/stub_upstream.py. No token or network is
+needed.
+
+Commands are sent closed-loop: --concurrency users each send a command, wait
+until the bot has finished handling it, and send the next one, spread over
+the guilds, their channels and distinct authors. The report has throughput,
+latency percentiles (from MESSAGE_CREATE to the command completing, including
+every reply), the upstream requests by path and status, and the REST calls
+by route.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_COMMANDS = ["!affixes", "!checklist", "!news latest"]
+TEXT_CHANNELS = 3
+
+SELF_ID = 42
+NOW = datetime.now(timezone.utc).isoformat()
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def user_payload(user_id, bot=False):
+    return {"id": str(user_id), "username": f"user{user_id}", "discriminator": "0", "avatar": None,
+            "global_name": None, "bot": bot}
+
+
+def guild_payload(index):
+    guild_id = 10**17 + index * 1000
+    text_ids = [guild_id + 1 + n for n in range(TEXT_CHANNELS)]
+    channels = [{"id": str(c), "type": 0, "name": f"text-{c}", "position": i, "nsfw": False,
+                 "rate_limit_per_user": 0, "permission_overwrites": []}
+                for i, c in enumerate(text_ids)]
+    roles = [{"id": str(guild_id), "name": "@everyone", "color": 0, "hoist": False, "position": 0,
+              "permissions": "104324673", "managed": False, "mentionable": False}]
+    members = [{"user": user_payload(SELF_ID, bot=True), "roles": [], "joined_at": NOW, "deaf": False,
+                "mute": False, "flags": 0}]
+    payload = {
+        "id": str(guild_id), "name": f"Guild {index}", "owner_id": str(guild_id + 999), "member_count": 50,
+        "large": False, "features": [], "premium_tier": 0, "channels": channels, "threads": [], "roles": roles,
+        "emojis": [], "stickers": [], "members": members, "voice_states": [], "presences": [],
+        "stage_instances": [], "guild_scheduled_events": [], "soundboard_sounds": [],
+    }
+    return payload, text_ids
+
+
+def message_payload(message_id, channel_id, author, content, guild_id=None):
+    payload = {
+        "id": str(message_id), "channel_id": str(channel_id), "type": 0, "author": author,
+        "content": content, "timestamp": NOW, "edited_timestamp": None, "tts": False,
+        "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [], "embeds": [],
+        "pinned": False,
+    }
+    if guild_id is not None:
+        payload["guild_id"] = str(guild_id)
+        payload["member"] = {"roles": [], "joined_at": NOW, "deaf": False, "mute": False, "flags": 0}
+    return payload
+
+
+class FakeRest:
+    """Stands in for discord.py's HTTPClient.request: answers every route after `latency` seconds."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = Counter()  # "METHOD /path/{template}" -> requests
+        self.ids = itertools.count(10**18 + 10**17)
+
+    async def request(self, route, **kwargs):
+        self.calls[f"{route.method} {route.path}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if route.method == "POST" and route.path == "/channels/{channel_id}/messages":
+            body = kwargs.get("json") or {}
+            if "files" in kwargs:  # multipart sends carry the JSON in the first form field
+                body = json.loads(kwargs["form"][0]["value"])
+            payload = message_payload(next(self.ids), route.channel_id, user_payload(SELF_ID, bot=True),
+                                      body.get("content") or "")
+            payload["embeds"] = body.get("embeds") or []
+            return payload
+        return None
+
+
+async def run(args):
+    import discord
+
+    import bot as herald
+
+    bot = herald.bot
+    rest = FakeRest(args.rest_latency_ms / 1000)
+    pending = {}  # message id -> future resolved when its command finishes
+
+    def finished(ctx, error=None):
+        future = pending.pop(ctx.message.id, None)
+        if future is not None and not future.done():
+            future.set_result(error)
+
+    async def on_command_completion(ctx):
+        finished(ctx)
+
+    async def on_command_error(ctx, error):
+        finished(ctx, error)
+
+    await herald.load_commands()
+    if herald.startup.errors:
+        raise SystemExit(f"Failed to load: {herald.startup.errors}")
+    bot.add_listener(on_command_completion)
+    bot.add_listener(on_command_error)
+
+    async with bot:  # binds the client to this event loop without logging in
+        state = bot._connection
+        state.user = discord.ClientUser(state=state, data=user_payload(SELF_ID, bot=True))
+        bot.http.request = rest.request
+        await bot.setup_hook()
+
+        channels = []
+        for index in range(args.guilds):
+            payload, text_ids = guild_payload(index)
+            state.parse_guild_create(payload)
+            channels += [(payload["id"], channel_id) for channel_id in text_ids]
+        await asyncio.sleep(0)
+
+        commands = itertools.cycle(args.commands)
+        targets = itertools.cycle(channels)
+        message_ids = itertools.count(10**18)
+        remaining = iter(range(args.messages))
+        latencies = defaultdict(list)
+        errors = Counter()
+
+        async def user(number):
+            author = user_payload(10**16 + number)
+            for _ in remaining:
+                content = next(commands)
+                guild_id, channel_id = next(targets)
+                message_id = next(message_ids)
+                future = asyncio.get_running_loop().create_future()
+                pending[message_id] = future
+                started = time.perf_counter()
+                state.parse_message_create(message_payload(message_id, channel_id, author, content, guild_id))
+                try:
+                    error = await asyncio.wait_for(future, args.timeout)
+                except asyncio.TimeoutError as e:
+                    pending.pop(message_id, None)
+                    error = e
+                latencies[content].append(time.perf_counter() - started)
+                if error is not None:
+                    errors[f"{content}: {type(error).__name__}"] += 1
+
+        cpu_started, started = time.process_time(), time.perf_counter()
+        await asyncio.gather(*(user(n) for n in range(args.concurrency)))
+        elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+        queue = bot.send_queue.stats()
+
+    everything = [sample for samples in latencies.values() for sample in samples]
+    summary = lambda samples: {  # noqa: E731
+        "count": len(samples),
+        **{f"p{int(q * 100)}_ms": round(percentile(samples, q) * 1000, 1) for q in (0.5, 0.9, 0.99)},
+        "max_ms": round(max(samples, default=0) * 1000, 1),
+    }
+    return {
+        "messages": args.messages,
+        "guilds": args.guilds,
+        "concurrency": args.concurrency,
+        "rest_latency_ms": args.rest_latency_ms,
+        "upstream_latency_ms": args.upstream_latency_ms,
+        "elapsed_s": round(elapsed, 2),
+        "cpu_s": round(cpu, 2),
+        "throughput_per_s": round(len(everything) / elapsed, 1) if elapsed else 0.0,
+        "latency": {"all": summary(everything), **{name: summary(s) for name, s in latencies.items()}},
+        "errors": dict(errors),
+        "upstream_calls": {f"{path} {status}": n for (path, status), n in sorted(args.stub.stats.items())},
+        "rest_calls": dict(rest.calls.most_common()),
+        "send_queue": {"max_depth": queue["max_depth"],
+                       "interactive": queue["priorities"]["interactive"]},
+    }
+
+
+def print_report(report):
+    print(f"{report['messages']} commands, {report['guilds']} guilds, {report['concurrency']} concurrent users, "
+          f"REST {report['rest_latency_ms']:g}ms, upstream {report['upstream_latency_ms']:g}ms")
+    print(f"{report['elapsed_s']}s wall, {report['cpu_s']}s CPU, {report['throughput_per_s']} commands/s\n")
+
+    print(f"{'latency':<16}{'count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, row in report["latency"].items():
+        print(f"{name:<16}{row['count']:>8}{row['p50_ms']:>10}{row['p90_ms']:>10}{row['p99_ms']:>10}"
+              f"{row['max_ms']:>10}")
+
+    for title, rows in (("errors", report["errors"]), ("upstream calls", report["upstream_calls"]),
+                        ("REST calls", report["rest_calls"])):
+        print(f"\n{title}:" + ("" if rows else " none"))
+        for name, count in rows.items():
+            print(f"  {count:>8}  {name}")
+
+    queue = report["send_queue"]
+    interactive = queue["interactive"]
+    print(f"\nsend queue: max depth {queue['max_depth']}, {interactive['sent']} interactive sends, "
+          f"wait p50 {interactive['wait_p50'] * 1000:.1f}ms p99 {interactive['wait_p99'] * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=5000, help="commands to send in total")
+    parser.add_argument("--guilds", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=100, help="users sending commands at once")
+    parser.add_argument("--commands", nargs="+", default=DEFAULT_COMMANDS, help="sent in rotation")
+    parser.add_argument("--rest-latency-ms", type=float, default=50.0, help="fake Discord API response time")
+    parser.add_argument("--upstream-latency-ms", type=float, default=0.0, help="stub Raider.IO/Wowhead latency")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds before a command counts as lost")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from src.utils.stub_upstream import StubConfig, StubUpstream
+
+    args.stub = StubUpstream(StubConfig(latency=args.upstream_latency_ms / 1000), seed=args.seed).start()
+    # Set before bot.py is imported (and its load_dotenv, which never overrides), so
+    # a local .env can't point the run at the real services or turn on extras.
+    os.environ.update({
+        "RAIDERIO_BASE_URL": args.stub.url, "WOWHEAD_BASE_URL": args.stub.url, "RAIDER_IO_API_KEY": "stub",
+        "LOG_LEVEL": os.getenv("LOG_LEVEL", "WARNING"), "METRICS_PORT": "", "TRACE_FILE": "",
+        "SYNC_APP_COMMANDS": "false", "LOOP_MONITOR": "false", "DEV_HOT_RELOAD": "",
+        "PROFILE_SECONDS": "", "MEMORY_TRACE": "",
+    })
+
+    # Feed caches are written to the working directory; keep them out of the checkout.
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            report = asyncio.run(run(args))
+        finally:
+            os.chdir(ROOT)
+            args.stub.close()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Replay a year of the scheduler on a fake clock and check every announcement is posted exactly once.
+
+    python scripts/simulate_schedule.py                        # 2025, 40 restarts
+    python scripts/simulate_schedule.py --days 90 --restarts 100 --stall-rate 0.01
+    python scripts/simulate_schedule.py --start 2026-03-01 --json
+
+The real `ScheduledTasks` loops are called tick by tick with the clock from
+src/utils/clock.py moved forward in between, so a year runs in a couple of
+minutes. Ticks are modelled on `tasks.loop`: they are due at a fixed rate (every
+minute, 30 minutes and 2 hours), each runs up to --jitter-s late, and
+--stall-rate of them stall for 30-120 seconds. That makes some minutes see no
+tick and others two. The process is also restarted --restarts times: half at
+random, half within five minutes of an announcement slot. Each restart is down
+for 1-20 minutes and brings up a fresh scheduler, keeping only the files a real
+restart keeps.
+
+Feeds come from the in-process stub server (src/utils/stub_upstream.py). A new
+blue post and a new reset-relevant news article are published every
+--churn-hours. Announcements go to a stub channel that records every send.
+
+The run fails unless:
+- every Monday warning and Tuesday checklist slot in the run is posted exactly
+  once, within FIRE_GRACE of its slot
+- every published blue post and news article is posted exactly once
+
+Slots are in UTC, so they keep their UTC time across the US daylight saving
+changes; the report counts the periods that spanned one. CPU per tick is the
+event loop thread's CPU time (time.thread_time) for each loop.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHANNEL_ID = 1001
+LOCAL_ZONE = "America/Chicago"  # the slot comments are in US Central time
+
+# The recorded item the churned items are copied from, and the ID it carries.
+BLUE_TEMPLATE_ID = "2000000"
+NEWS_TEMPLATE_ID = "360000"
+
+# Feed items published this close to the end are not required to have been posted.
+SETTLE = timedelta(hours=3)
+
+ANNOUNCEMENT_TITLES = {
+    "WoW Weekly Checklist": "tuesday_checklist",
+    "⚠️ Weekly Reset Reminder": "monday_warning",
+}
+ITEM_RE = re.compile(r"<item>.*?</item>", re.DOTALL)
+TRAILING_ID_RE = re.compile(r"(\d+)$")
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ChurnedFeed:
+    """A recorded feed that gains one copy of its first item, with a new ID and date, per `publish`."""
+
+    def __init__(self, body, template_id, first_id):
+        text = body.decode("utf-8")
+        items = [m.group(0) for m in ITEM_RE.finditer(text)]
+        self.head = text[:text.index(items[0])]
+        self.tail = text[text.index(items[-1]) + len(items[-1]):]
+        self.items = items
+        self.template, self.template_id = items[0], template_id
+        self.next_id = first_id
+
+    def publish(self, when):
+        """Add a new item dated `when`; returns (its ID, the new feed body)."""
+        item_id = str(self.next_id)
+        self.next_id += 1
+        item = self.template.replace(self.template_id, item_id).replace("</title>", f" #{item_id}</title>", 1)
+        start, end = item.index("<pubDate>") + len("<pubDate>"), item.index("</pubDate>")
+        item = item[:start] + format_datetime(when) + item[end:]
+        self.items = [item] + self.items[:-1]
+        return item_id, (self.head + "\n".join(self.items) + self.tail).encode("utf-8")
+
+
+class StubChannel:
+    """Records what the scheduler sends, with the simulated time it was sent at."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.sent = []  # (time, content, embeds)
+
+    async def send(self, content=None, *, embed=None, embeds=None, **kwargs):
+        self.sent.append((self.clock.now, content, list(embeds or ([embed] if embed else []))))
+
+
+class StubBot:
+    def __init__(self, channel):
+        self.channel = channel
+        self.send_queue = None
+
+    def get_channel(self, channel_id):
+        return self.channel if channel_id == CHANNEL_ID else None
+
+
+def plan_restarts(rng, start, end, count, slots):
+    """Restart times: half at random, half within five minutes of a slot."""
+    span = (end - start).total_seconds()
+    restarts = [start + timedelta(seconds=rng.uniform(0, span)) for _ in range(count - count // 2)]
+    slot_times = []
+    for slot in slots:
+        at = slots[slot]
+        while at < end:
+            slot_times.append(at)
+            at += timedelta(days=7)
+    for at in rng.sample(slot_times, min(count // 2, len(slot_times))):
+        restarts.append(at + timedelta(seconds=rng.uniform(-300, 300)))
+    return sorted(t for t in restarts if start < t < end)
+
+
+async def simulate(args, stub):
+    from src.tasks import scheduler as scheduler_module
+    from src.utils import reset_digest
+    from src.utils.clock import FakeClock, set_clock
+    from src.utils.stub_upstream import BLUE_TRACKER_PATH, NEWS_PATH
+
+    rng = random.Random(args.seed)
+    start = datetime.fromisoformat(args.start).replace(tzinfo=timezone.utc)
+    end = start + timedelta(days=args.days)
+    clock = FakeClock(start)
+    set_clock(clock)
+
+    channel = StubChannel(clock)
+    blue_feed = ChurnedFeed(stub.bodies[BLUE_TRACKER_PATH][1], BLUE_TEMPLATE_ID, 90_000_000)
+    news_feed = ChurnedFeed(stub.bodies[NEWS_PATH][1], NEWS_TEMPLATE_ID, 80_000_000)
+    published = {"blue": [], "news": []}
+
+    slots = {kind: scheduler_module.next_slot_time(start, slot)
+             for kind, slot in scheduler_module.ANNOUNCEMENT_SLOTS.items()}
+    restarts = plan_restarts(rng, start, end, args.restarts, slots)
+    intervals = {
+        "scheduled_posts": timedelta(minutes=1),
+        "blue_tracker_monitor": timedelta(minutes=30),
+        "news_monitor": timedelta(hours=2),
+    }
+    cpu = defaultdict(list)  # loop -> seconds of loop-thread CPU per tick
+    restart_count = downtime = 0
+
+    def boot():
+        reset_digest._digest = None  # a new process builds its own digest
+        scheduler = scheduler_module.ScheduledTasks(StubBot(channel))
+        # tasks.loop runs the first iteration as soon as the loop is started.
+        return scheduler, {name: clock.now for name in intervals}
+
+    scheduler, due = boot()
+    last_tick = clock.now
+    next_churn = start + timedelta(hours=args.churn_hours)
+    started = time.perf_counter()
+
+    while True:
+        name = min(due, key=due.get)
+        scheduled = due[name]
+        if scheduled >= end:
+            break
+
+        if restarts and restarts[0] <= scheduled:
+            clock.now = max(clock.now, restarts.pop(0))
+            await scheduler.close()
+            down = timedelta(seconds=rng.uniform(60, 20 * 60))
+            clock.advance(down)
+            restart_count, downtime = restart_count + 1, downtime + down.total_seconds()
+            scheduler, due = boot()
+            continue
+
+        # A late tick, occasionally a stall; never earlier than the previous tick.
+        lateness = rng.uniform(0, args.jitter_s)
+        if rng.random() < args.stall_rate:
+            lateness += rng.uniform(30, 120)
+        clock.now = max(last_tick, scheduled + timedelta(seconds=lateness))
+        last_tick = clock.now
+
+        while next_churn <= clock.now:
+            for feed_name, feed, path in (("blue", blue_feed, BLUE_TRACKER_PATH), ("news", news_feed, NEWS_PATH)):
+                item_id, body = feed.publish(next_churn)
+                stub.set_body(path, body)
+                published[feed_name].append((item_id, next_churn))
+            next_churn += timedelta(hours=args.churn_hours)
+
+        loop = getattr(scheduler, name)
+        tick_started = time.thread_time()
+        await loop()
+        cpu[name].append(time.thread_time() - tick_started)
+        due[name] = scheduled + intervals[name]
+
+    await scheduler.close()
+    set_clock(None)
+    elapsed = time.perf_counter() - started
+    return check(args, channel.sent, published, start, end, scheduler_module), {
+        "restarts": restart_count,
+        "downtime_hours": round(downtime / 3600, 1),
+        "elapsed_s": round(elapsed, 1),
+        "cpu_per_tick_us": {
+            name: {
+                "ticks": len(samples),
+                "mean": round(sum(samples) / len(samples) * 1e6, 1) if samples else 0.0,
+                "p50": round(percentile(samples, 0.5) * 1e6, 1),
+                "p99": round(percentile(samples, 0.99) * 1e6, 1),
+                "max": round(max(samples, default=0) * 1e6, 1),
+                "total_s": round(sum(samples), 2),
+            }
+            for name, samples in cpu.items()
+        },
+    }
+
+
+def check(args, sent, published, start, end, scheduler_module):
+    """Compare what the stub channel received with what should have been posted."""
+    grace = scheduler_module.FIRE_GRACE
+    posts = defaultdict(list)  # kind -> send times
+    feed_posts = {"blue": Counter(), "news": Counter()}
+    for at, content, embeds in sent:
+        for embed in embeds:
+            kind = ANNOUNCEMENT_TITLES.get(embed.title)
+            if kind:
+                posts[kind].append(at)
+            elif content and content.startswith("📢") and embed.url:
+                feed_posts["blue"][TRAILING_ID_RE.search(embed.url).group(1)] += 1
+            elif content and content.startswith("📰") and embed.url:
+                feed_posts["news"][TRAILING_ID_RE.search(embed.url).group(1)] += 1
+
+    try:
+        from zoneinfo import ZoneInfo
+        local = ZoneInfo(LOCAL_ZONE)
+    except Exception:  # noqa: BLE001 - no tz database; skip the DST count
+        local = None
+
+    periods, failures = {}, []
+    for kind, slot in scheduler_module.ANNOUNCEMENT_SLOTS.items():
+        expected = []
+        at = scheduler_module.next_slot_time(start, slot)
+        while at + grace <= end:
+            expected.append(at)
+            at += timedelta(days=7)
+        minutes = [t.replace(second=0, microsecond=0) for t in posts[kind]]
+        by_slot = Counter(scheduler_module.last_slot_time(t, slot) for t in minutes)
+        late = [t for t in minutes if t - scheduler_module.last_slot_time(t, slot) > grace]
+        missed = [t for t in expected if by_slot[t] == 0]
+        doubled = [t for t in expected if by_slot[t] > 1]
+        dst = sum(1 for t in expected if local and (t - timedelta(days=7)).astimezone(local).utcoffset()
+                  != t.astimezone(local).utcoffset())
+        periods[kind] = {"periods": len(expected), "posted": len(posts[kind]), "missed": len(missed),
+                         "doubled": len(doubled), "late_beyond_grace": len(late), "dst_periods": dst}
+        for label, slots in (("missed", missed), ("posted more than once", doubled), ("posted too late", late)):
+            if slots:
+                failures.append(f"{kind} {label}: {', '.join(t.isoformat() for t in slots[:5])}"
+                                + (" ..." if len(slots) > 5 else ""))
+
+    feeds = {}
+    for feed, items in published.items():
+        counts = feed_posts[feed]
+        # Items from the last few hours may not have been picked up by a monitor yet.
+        missing = [i for i, at in items if counts[i] == 0 and at <= end - SETTLE]
+        repeated = [i for i, n in counts.items() if n > 1]
+        feeds[feed] = {"published": len(items), "posted": sum(counts.values()), "missing": len(missing),
+                       "repeated": len(repeated)}
+        if missing:
+            failures.append(f"{feed} items never posted: {', '.join(missing[:5])}")
+        if repeated:
+            failures.append(f"{feed} items posted more than once: {', '.join(repeated[:5])}")
+
+    return {"announcements": periods, "feeds": feeds, "failures": failures}
+
+
+def print_report(args, result, stats):
+    print(f"Simulated {args.days:g} days from {args.start} in {stats['elapsed_s']}s with {stats['restarts']} "
+          f"restarts ({stats['downtime_hours']}h down)\n")
+    print(f"{'announcement':<20}{'periods':>9}{'posted':>8}{'missed':>8}{'doubled':>9}{'late':>6}{'DST':>6}")
+    for kind, row in result["announcements"].items():
+        print(f"{kind:<20}{row['periods']:>9}{row['posted']:>8}{row['missed']:>8}{row['doubled']:>9}"
+              f"{row['late_beyond_grace']:>6}{row['dst_periods']:>6}")
+    print(f"\n{'feed':<20}{'published':>10}{'posted':>8}{'missing':>9}{'repeated':>10}")
+    for feed, row in result["feeds"].items():
+        print(f"{feed:<20}{row['published']:>10}{row['posted']:>8}{row['missing']:>9}{row['repeated']:>10}")
+    print(f"\n{'CPU per tick':<22}{'ticks':>8}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'max us':>10}{'total s':>9}")
+    for name, row in stats["cpu_per_tick_us"].items():
+        print(f"{name:<22}{row['ticks']:>8}{row['mean']:>10}{row['p50']:>10}{row['p99']:>10}{row['max']:>10}"
+              f"{row['total_s']:>9}")
+    print()
+    if result["failures"]:
+        print("FAILED:")
+        for failure in result["failures"]:
+            print(f"  {failure}")
+    else:
+        print("OK")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", default="2025-01-01", help="simulated start, UTC (default: 2025-01-01)")
+    parser.add_argument("--days", type=float, default=365)
+    parser.add_argument("--restarts", type=int, default=40)
+    parser.add_argument("--jitter-s", type=float, default=3.0, help="how late a tick may run (default: 3)")
+    parser.add_argument("--stall-rate", type=float, default=0.002,
+                        help="fraction of ticks stalled 30-120s (default: 0.002)")
+    parser.add_argument("--churn-hours", type=float, default=24.0,
+                        help="hours between new feed items (default: 24)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import logging
+
+    from src.utils.stub_upstream import StubUpstream
+
+    logging.basicConfig(level=logging.ERROR)
+    stub = StubUpstream(seed=args.seed).start()
+    os.environ.update({"WOWHEAD_BASE_URL": stub.url, "TARGET_CHANNEL_ID": str(CHANNEL_ID),
+                       "DELIVERY_MODE": "channel", "FEED_ROLE": "standalone", "TRACE_FILE": ""})
+
+    # Feed caches and the schedule state are written to the working directory,
+    # and survive restarts there like they would on disk.
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            result, stats = asyncio.run(simulate(args, stub))
+        finally:
+            os.chdir(ROOT)
+            stub.close()
+
+    if args.json:
+        print(json.dumps({**result, **stats}, indent=2))
+    else:
+        print_report(args, result, stats)
+    return 1 if result["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Soak test: months of simulated feed churn through the scrapers and embed builders.
+
+    python scripts/soak_memory.py                    # 90 days, 512 KiB budget
+    python scripts/soak_memory.py --days 365 --budget-kib 256
+
+The recorded feeds in tests/fixtures/ are used as templates. Every simulated
+poll the feed gains a few new items (fresh IDs, titles and dates) and drops
+its oldest, like the real feeds do. The blue tracker is polled every 30
+minutes and Wowhead news every 2 hours, through the real `get_new_posts` and
+`get_new_articles` (with `requests.get` answered locally and the caches in a
+temporary directory). New posts and articles are rendered into embeds, and
+once a simulated week the reset summaries and their embeds are built too.
+The scrapers read the simulated time through a `FakeClock`, so the weekly
+summaries see the last seven simulated days of posts.
+
+Allocations are traced with tracemalloc. After a warm-up (the first tenth of
+the run), memory still live at the end must stay within the budget, the
+seen-ID lists must stay capped and the weekly summaries must not be empty.
+Otherwise the top growing allocation sites
+are printed and the script exits non-zero.
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+BLUE_INTERVAL = timedelta(minutes=30)
+NEWS_INTERVAL = timedelta(hours=2)
+ITEM_RE = re.compile(r"<item>.*?</item>", re.DOTALL)
+
+
+class ChurningFeed:
+    """An RSS feed built from a recorded one, gaining new items and dropping old ones on every poll."""
+
+    def __init__(self, path, id_pattern, size, seed):
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        self.templates = [(m.group(0), re.search(id_pattern, m.group(0)).group(1)) for m in ITEM_RE.finditer(text)]
+        first, last = ITEM_RE.search(text), list(ITEM_RE.finditer(text))[-1]
+        self.head, self.tail = text[:first.start()], text[last.end():]
+        self.size = size
+        self.random = random.Random(seed)
+        self.items = []
+        self.generated = 0
+
+    def _new_item(self, when):
+        template, template_id = self.templates[self.generated % len(self.templates)]
+        self.generated += 1
+        item = template.replace(template_id, str(90_000_000 + self.generated))
+        item = item.replace("</title>", f" #{self.generated}</title>", 1)
+        start, end = item.index("<pubDate>") + len("<pubDate>"), item.index("</pubDate>")
+        return item[:start] + format_datetime(when) + item[end:]
+
+    def advance(self, when, max_new):
+        """Publish 0..max_new new items at `when` and return the feed body."""
+        count = self.random.randint(0, max_new) if self.items else self.size
+        new = [self._new_item(when - timedelta(minutes=i)) for i in range(count)]
+        self.items = (new + self.items)[:self.size]
+        return (self.head + "\n".join(self.items) + self.tail).encode("utf-8")
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+        self.status_code = 200
+        self.elapsed = timedelta(milliseconds=5)
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=float, default=90, help="simulated days (default: 90)")
+    parser.add_argument("--budget-kib", type=float, default=512,
+                        help="allowed growth of live memory after warm-up, in KiB (default: 512)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10, help="growth sites to list on failure")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import requests
+
+    from src.utils import blue_tracker, wowhead_news
+    from src.utils.clock import FakeClock, set_clock
+    from src.utils.embeds import (
+        create_blue_tracker_embed,
+        create_checklist_embed,
+        create_monday_warning_embed,
+        create_news_embed,
+        create_news_summary_embed,
+    )
+    from src.utils.memory import MemoryTracker, rss_bytes
+
+    blue_feed = ChurningFeed(os.path.join(FIXTURES, "blue_tracker.xml"), r"-(\d+)</link>", 50, args.seed)
+    news_feed = ChurningFeed(os.path.join(FIXTURES, "wowhead_news.xml"), r"news=(\d+)", 25, args.seed + 1)
+    bodies = {}
+
+    def fake_get(url, hooks=None, **kwargs):
+        response = FakeResponse(bodies[url])
+        for hook in (hooks or {}).values():
+            hook(response)
+        return response
+
+    requests.get = fake_get
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        blue = blue_tracker.BlueTrackerScraper()
+        news = wowhead_news.WowheadNewsScraper()
+        blue.cache_file = os.path.join(cache_dir, "blue_tracker_cache.json")
+        news.cache_file = os.path.join(cache_dir, "wowhead_news_cache.json")
+
+        end = datetime.now(timezone.utc)
+        clock = end - timedelta(days=args.days)
+        fake_clock = FakeClock(clock)
+        set_clock(fake_clock)
+        warmup_until = clock + timedelta(days=args.days / 10)
+        next_news = next_weekly = clock
+        polls = posts = articles = embeds = 0
+        summarized_posts = summarized_articles = 0
+        tracker = MemoryTracker()
+        tracker.start()
+        baseline = None
+        started = time.perf_counter()
+
+        while clock < end:
+            fake_clock.now = clock
+            bodies[blue.url] = blue_feed.advance(clock, 2)
+            for post in blue.get_new_posts():
+                create_blue_tracker_embed(post)
+                posts += 1
+                embeds += 1
+
+            if clock >= next_news:
+                next_news += NEWS_INTERVAL
+                bodies[news.url] = news_feed.advance(clock, 3)
+                for article in news.get_new_articles():
+                    create_news_embed(article, is_reset_relevant=news.is_reset_relevant(article))
+                    articles += 1
+                    embeds += 1
+
+            if clock >= next_weekly:
+                next_weekly += timedelta(days=7)
+                reset_posts = blue.get_reset_relevant_posts(items=blue.snapshot)
+                summary = blue.summarize_reset_info(reset_posts)
+                create_checklist_embed(summary)
+                create_monday_warning_embed(summary)
+                reset_articles = news.get_reset_relevant_articles(items=news.snapshot)
+                news_summary = news.summarize_reset_info(reset_articles)
+                create_news_summary_embed(news_summary)
+                embeds += 3
+                summarized_posts += len(reset_posts)
+                summarized_articles += len(reset_articles)
+
+            polls += 1
+            clock += BLUE_INTERVAL
+            if baseline is None and clock >= warmup_until:
+                gc.collect()
+                tracker.snapshot("warm-up")
+                baseline = tracker.snapshots[-1][2]
+
+        set_clock(None)
+        gc.collect()
+        tracker.snapshot("end")
+        elapsed = time.perf_counter() - started
+
+        with open(blue.cache_file, encoding="utf-8") as f:
+            seen_posts = len(json.load(f)["seen_posts"])
+        with open(news.cache_file, encoding="utf-8") as f:
+            seen_articles = len(json.load(f)["seen_articles"])
+        cache_bytes = os.path.getsize(blue.cache_file) + os.path.getsize(news.cache_file)
+
+    growth = sum(stat.size_diff for stat in tracker.snapshots[-1][2].compare_to(baseline, "filename"))
+    print(f"Simulated {args.days:g} days in {elapsed:.1f}s: {polls} blue polls, {posts} new posts, "
+          f"{articles} new articles, {embeds} embeds")
+    print(f"Weekly summaries covered {summarized_posts} reset-relevant posts and {summarized_articles} articles")
+    print(f"Seen IDs kept: {seen_posts} posts, {seen_articles} articles (cap {blue_tracker.MAX_SEEN_IDS}); "
+          f"cache files {cache_bytes / 1024:.1f} KiB")
+    print(f"Live memory growth after warm-up: {growth / 1024:.1f} KiB (budget {args.budget_kib:g} KiB); "
+          f"RSS {rss_bytes() / (1024 * 1024):.1f} MiB")
+
+    failures = []
+    if growth > args.budget_kib * 1024:
+        failures.append("live memory grew past the budget")
+    if seen_posts > blue_tracker.MAX_SEEN_IDS or seen_articles > wowhead_news.MAX_SEEN_IDS:
+        failures.append("seen-ID lists are not capped")
+    if not summarized_posts or not summarized_articles:
+        failures.append("weekly summaries were empty, so the summary path was not exercised")
+    if failures:
+        print("\nFAILED: " + "; ".join(failures))
+        print("Top growth since warm-up:")
+        for stat in tracker.growth(args.top):
+            print(f"  {stat}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Run a local stand-in for Raider.IO and Wowhead, with latency and fault injection.
+
+    python scripts/stub_server.py                              # recorded fixtures, no faults
+    python scripts/stub_server.py --latency-ms 300 --jitter-ms 100 --error-rate 0.05
+    python scripts/stub_server.py --rate-limit-rate 0.2 --not-modified-rate 0.1
+    python scripts/stub_server.py --drip-bytes 512 --drip-interval-ms 200 --feed-size 5000
+
+Then point the bot at it (Raider.IO needs a key set, any value works):
+
+    RAIDERIO_BASE_URL=http://127.0.0.1:8089 WOWHEAD_BASE_URL=http://127.0.0.1:8089 \\
+        RAIDER_IO_API_KEY=stub python bot.py
+
+Request counts by path and status are at /__stats. Faults come from --seed,
+so the same seed and request order reproduce the same run.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay before each response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="random +/- added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0, help="fraction answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429s")
+    parser.add_argument("--not-modified-rate", type=float, default=0,
+                        help="fraction answered with a bodiless 304, conditional or not")
+    parser.add_argument("--drip-bytes", type=int, default=0, help="write bodies in chunks of this many bytes")
+    parser.add_argument("--drip-interval-ms", type=float, default=100, help="pause between drip chunks")
+    parser.add_argument("--feed-size", type=int, choices=(50, 500, 5000),
+                        help="serve the sized benchmark feeds instead of the recorded ones")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures", help="directory of recorded responses (default: tests/fixtures)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from src.utils.stub_upstream import FIXTURES, StubConfig, StubUpstream
+
+    config = StubConfig(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        not_modified_rate=args.not_modified_rate,
+        drip_bytes=args.drip_bytes,
+        drip_interval=args.drip_interval_ms / 1000,
+    )
+    stub = StubUpstream(config, seed=args.seed, fixtures=args.fixtures or FIXTURES, feed_size=args.feed_size)
+    stub.start(args.host, args.port)
+    print(f"Serving Raider.IO and Wowhead stand-ins on {stub.url}")
+    print(f"  RAIDERIO_BASE_URL={stub.url} WOWHEAD_BASE_URL={stub.url} RAIDER_IO_API_KEY=stub")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.close()
+
+
+if __name__ == "__main__":
+    main()
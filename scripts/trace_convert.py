@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Convert the bot's trace spans (TRACE_FILE, JSON lines) for viewing elsewhere.
+
+    # Chrome trace: open in chrome://tracing or https://ui.perfetto.dev
+    python scripts/trace_convert.py traces.jsonl -o trace.json
+
+    # OTLP/JSON: POST to a collector, e.g. Jaeger or Tempo
+    python scripts/trace_convert.py traces.jsonl --format otlp -o otlp.json
+    curl -H 'Content-Type: application/json' --data @otlp.json http://localhost:4318/v1/traces
+
+Rotated backups (traces.jsonl.1, .2, ...) next to the file are included.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="span file written by the bot (TRACE_FILE)")
+    parser.add_argument("--format", choices=("chrome", "otlp"), default="chrome")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--service-name", default="azeroth-herald", help="service.name for OTLP output")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from src.utils.tracing import read_spans, to_chrome_trace, to_otlp
+
+    spans = read_spans(args.path)
+    if not spans:
+        sys.exit(f"No spans found in {args.path}")
+    converted = to_chrome_trace(spans) if args.format == "chrome" else to_otlp(spans, args.service_name)
+
+    text = json.dumps(converted)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"Wrote {len(spans)} spans to {args.output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Admin commands for the Azeroth Herald bot.
+Owner-only diagnostics for a running bot.
+"""
+
+import asyncio
+import io
+
+import discord
+from discord.ext import commands
+
+from src.utils.memory import DEFAULT_TOP, tracker
+from src.utils.profiler import MAX_SECONDS, ProfilerBusy, profile_for
+
+
+class AdminCommand(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_check(self, ctx):
+        # Every admin command is limited to the application owner.
+        if not await self.bot.is_owner(ctx.author):
+            raise commands.NotOwner("Admin commands are limited to the bot owner.")
+        return True
+
+    @commands.group(name='admin', hidden=True, invoke_without_command=True)
+    async def admin(self, ctx):
+        """Owner-only diagnostics."""
+        await ctx.send("Usage: `!admin profile <seconds>` or `!admin memory [top]`")
+
+    @admin.command(name='profile')
+    async def profile(self, ctx, seconds: float = 30.0):
+        """
+        Profile the live bot for a number of seconds and attach the hottest functions.
+
+        Usage:
+        !admin profile 60 - Profile for 60 seconds (max 600)
+        """
+        if not 1 <= seconds <= MAX_SECONDS:
+            await ctx.send(f"⚠️ Pick a window between 1 and {MAX_SECONDS} seconds.")
+            return
+
+        await ctx.send(f"⏱️ Profiling the bot for {seconds:g} seconds...")
+        try:
+            summary, path = await profile_for(seconds)
+        except ProfilerBusy:
+            await ctx.send("⚠️ A profile is already running, try again when it finishes.")
+            return
+
+        attachment = discord.File(io.BytesIO(summary.encode("utf-8")), filename="profile-top.txt")
+        await ctx.send(f"✅ Profile complete. Raw profile saved to `{path}`.", file=attachment)
+
+    @admin.command(name='memory')
+    async def memory(self, ctx, top: int = DEFAULT_TOP):
+        """
+        Snapshot memory and attach the top allocation sites and the growth since the last snapshot.
+
+        Usage:
+        !admin memory - Top 15 sites
+        !admin memory 40 - Top 40 sites
+        """
+        if tracker.start():
+            await ctx.send("🧠 Started tracing allocations. Run this again later to see what has grown.")
+
+        await asyncio.to_thread(tracker.snapshot, f"!admin memory by {ctx.author}")
+        report = tracker.report(max(1, min(top, 100)))
+        attachment = discord.File(io.BytesIO(report.encode("utf-8")), filename="memory-top.txt")
+        await ctx.send("✅ Memory snapshot taken.", file=attachment)
+
+
+async def setup(bot):
+    await bot.add_cog(AdminCommand(bot))
@@ -2,11 +2,20 @@
 Affixes command for the Azeroth Herald bot.
 """
 
-import discord
+import logging
+
 from discord.ext import commands
 
-from src.utils.api import fetch_affixes
-from src.utils.embeds import create_affixes_embed
+from src.utils.api import get_cached_affixes
+from src.utils.delivery import send_reply
+from src.utils.replies import (
+    VALID_REGIONS,
+    affixes_reply,
+    invalid_region_reply,
+    unexpected_error_reply,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class AffixesCommand(commands.Cog):
@@ -17,59 +26,25 @@ class AffixesCommand(commands.Cog):
     async def show_affixes(self, ctx, region='us'):
         """Command to show current Mythic+ affixes."""
         # Validate region
-        valid_regions = ['us', 'eu', 'kr', 'tw', 'cn']
-        if region.lower() not in valid_regions:
-            embed = discord.Embed(
-                title="❌ Invalid Region",
-                description=f"Invalid region `{region}`. Valid regions are: {', '.join(valid_regions)}",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+        if region.lower() not in VALID_REGIONS:
+            payload = invalid_region_reply(region)
+            await send_reply(ctx, payload)
             return
 
-        # Show loading message
-        loading_embed = discord.Embed(
-            title="⏳ Loading Affixes...",
-            description="Fetching current Mythic+ affixes from Raider.IO...",
-            color=discord.Color.orange()
-        )
-        loading_message = await ctx.send(embed=loading_embed)
-
         try:
-            # Fetch affixes data
-            affixes_data, error = await fetch_affixes(region.lower())
-
-            if error:
-                embed = discord.Embed(
-                    title="❌ Failed to Fetch Affixes",
-                    description=f"Error: {error}",
-                    color=discord.Color.red()
-                )
-                embed.add_field(
-                    name="What to do",
-                    value="Please try again later or check if the Raider.IO API is available.",
-                    inline=False
-                )
-                await loading_message.edit(embed=embed)
-                return
-
-            # Create and send the affixes embed
-            embed = create_affixes_embed(affixes_data, region.lower())
-            await loading_message.edit(embed=embed)
+            # Serve straight from memory when possible; only show a typing
+            # indicator while an upstream fetch is actually needed.
+            if get_cached_affixes(region.lower()) is None:
+                async with ctx.typing():
+                    payload = await affixes_reply(region.lower())
+            else:
+                payload = await affixes_reply(region.lower())
 
         except Exception as e:
-            embed = discord.Embed(
-                title="❗ Unexpected Error",
-                description="An unexpected error occurred while fetching affixes.",
-                color=discord.Color.red()
-            )
-            embed.add_field(
-                name="Error Details",
-                value=str(e)[:1000],  # Limit error message length
-                inline=False
-            )
-            await loading_message.edit(embed=embed)
-            print(f"Error in affixes command: {e}")
+            payload = unexpected_error_reply("affixes", e)
+            logger.exception("Error in affixes command: %s", e)
+
+        await send_reply(ctx, payload)
 
 
 async def setup(bot):
@@ -2,34 +2,32 @@
 Checklist command for the Azeroth Herald bot.
 """
 
+import logging
+
 from discord.ext import commands
 
-from src.utils.blue_tracker import BlueTrackerScraper
+from src.utils.delivery import send_reply
 from src.utils.embeds import create_checklist_embed
+from src.utils.replies import checklist_reply
+from src.utils.reset_digest import get_reset_digest
+
+logger = logging.getLogger(__name__)
 
 
 class ChecklistCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.blue_tracker = BlueTrackerScraper(region_filter='us')  # Only US posts
+        self.digest = get_reset_digest()
 
     @commands.command(name='checklist', help='Displays the WoW weekly checklist on demand with recent blue posts.')
     async def post_checklist(self, ctx):
         """Command to manually post the checklist with blue post integration."""
         try:
-            # Get reset-relevant blue posts
-            reset_posts = self.blue_tracker.get_reset_relevant_posts(days_back=7)
-            blue_post_summary = self.blue_tracker.summarize_reset_info(reset_posts)
-
-            embed = create_checklist_embed(blue_post_summary if reset_posts else None)
-
-            if reset_posts:
-                await ctx.send(f"📋 **Weekly Checklist** (with {len(reset_posts)} recent updates)", embed=embed)
-            else:
-                await ctx.send(embed=embed)
+            # Served from the shared digest; only re-fetches when the snapshot is stale
+            await send_reply(ctx, await checklist_reply(self.digest))
 
         except Exception as e:
-            print(f"Error in checklist command: {e}")
+            logger.exception("Error in checklist command: %s", e)
             # Fallback to basic embed if blue post integration fails
             embed = create_checklist_embed()
             await ctx.send(embed=embed)
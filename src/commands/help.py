@@ -39,6 +39,15 @@ class HelpCommand(commands.Cog):
                 inline=False
             )
 
+            embed.add_field(
+                name="⚡ Slash Commands",
+                value=(
+                    "`/affixes`, `/cutoffs`, `/checklist`, `/bluetrack`, `/news` and `/time` "
+                    "work the same as their `!` versions, with autocomplete for regions and actions."
+                ),
+                inline=False
+            )
+
             embed.add_field(
                 name="📅 Automatic Schedule",
                 value=(
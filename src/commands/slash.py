@@ -0,0 +1,134 @@
+"""
+Slash (application) commands for the Azeroth Herald bot.
+
+Mirrors the prefix commands for /affixes, /cutoffs, /checklist, /bluetrack,
+/news and /time using the same reply builders. Region and action options
+autocomplete from precomputed lists, and anything that needs upstream data
+defers the interaction response so Discord's 3-second deadline never applies.
+"""
+
+import logging
+from typing import List
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from src.utils.api import get_cached_affixes, get_cached_season_cutoffs
+from src.utils.delivery import batch_embeds
+from src.utils.replies import (
+    BLUETRACK_ACTIONS,
+    NEWS_ACTIONS,
+    VALID_REGIONS,
+    affixes_reply,
+    bluetrack_reply,
+    checklist_reply,
+    cutoffs_reply,
+    invalid_region_reply,
+    news_reply,
+    time_reply,
+    unexpected_error_reply,
+)
+from src.utils.reset_digest import get_reset_digest
+from src.utils.wowhead_news import WowheadNewsScraper
+
+logger = logging.getLogger(__name__)
+
+# Autocomplete choices are built once at import; Discord shows at most 25.
+REGION_CHOICES = [app_commands.Choice(name=region.upper(), value=region) for region in VALID_REGIONS]
+BLUETRACK_CHOICES = [app_commands.Choice(name=action, value=action) for action in BLUETRACK_ACTIONS]
+NEWS_CHOICES = [app_commands.Choice(name=action, value=action) for action in NEWS_ACTIONS]
+
+
+def _filter_choices(choices: List[app_commands.Choice], current: str) -> List[app_commands.Choice]:
+    current = current.lower()
+    return [choice for choice in choices if choice.value.startswith(current)][:25]
+
+
+async def region_autocomplete(interaction: discord.Interaction, current: str):
+    return _filter_choices(REGION_CHOICES, current)
+
+
+async def bluetrack_action_autocomplete(interaction: discord.Interaction, current: str):
+    return _filter_choices(BLUETRACK_CHOICES, current)
+
+
+async def news_action_autocomplete(interaction: discord.Interaction, current: str):
+    return _filter_choices(NEWS_CHOICES, current)
+
+
+async def respond(interaction: discord.Interaction, reply, ephemeral: bool = False):
+    """Send a reply dict as the interaction response, or as followups if the response was deferred."""
+    batches = batch_embeds(reply['embeds']) or [[]]
+    for index, batch in enumerate(batches):
+        content = reply['content'] if index == 0 else None
+        if index == 0 and not interaction.response.is_done():
+            await interaction.response.send_message(content, embeds=batch, ephemeral=ephemeral)
+        else:
+            await interaction.followup.send(content, embeds=batch, ephemeral=ephemeral)
+
+
+class SlashCommands(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.digest = get_reset_digest()
+        self.news_scraper = WowheadNewsScraper()
+
+    async def _reply_command(self, interaction, build_reply, what, defer=True):
+        """Build and send a reply, deferring first if asked; any error becomes an error reply."""
+        try:
+            if defer:
+                await interaction.response.defer(thinking=True)
+            reply = await build_reply()
+        except Exception as e:
+            reply = unexpected_error_reply(what, e)
+            logger.exception("Error in /%s command: %s", what, e)
+        await respond(interaction, reply)
+
+    async def _region_command(self, interaction, region, get_cached, build_reply, what):
+        region = region.lower()
+        if region not in VALID_REGIONS:
+            await respond(interaction, invalid_region_reply(region), ephemeral=True)
+            return
+
+        # Answer immediately from cache; defer only when Raider.IO must be called.
+        await self._reply_command(interaction, lambda: build_reply(region), what,
+                                  defer=get_cached(region) is None)
+
+    @app_commands.command(name='affixes', description='Shows current Mythic+ affixes for the week.')
+    @app_commands.describe(region='Region (us, eu, kr, tw, cn)')
+    @app_commands.autocomplete(region=region_autocomplete)
+    async def affixes(self, interaction: discord.Interaction, region: str = 'us'):
+        await self._region_command(interaction, region, get_cached_affixes, affixes_reply, 'affixes')
+
+    @app_commands.command(name='cutoffs', description='Shows current M+ season rating cutoffs.')
+    @app_commands.describe(region='Region (us, eu, kr, tw, cn)')
+    @app_commands.autocomplete(region=region_autocomplete)
+    async def cutoffs(self, interaction: discord.Interaction, region: str = 'us'):
+        await self._region_command(interaction, region, get_cached_season_cutoffs, cutoffs_reply, 'season cutoffs')
+
+    @app_commands.command(name='checklist', description='Displays the WoW weekly checklist with recent blue posts.')
+    async def checklist(self, interaction: discord.Interaction):
+        # The digest is usually warm; only a stale snapshot means a feed download.
+        await self._reply_command(interaction, lambda: checklist_reply(self.digest), 'checklist',
+                                  defer=self.digest.snapshot_stale())
+
+    @app_commands.command(name='bluetrack', description='Check the Wowhead Blue Tracker for Blizzard posts.')
+    @app_commands.describe(action='check, latest, test or reset')
+    @app_commands.autocomplete(action=bluetrack_action_autocomplete)
+    async def bluetrack(self, interaction: discord.Interaction, action: str = 'check'):
+        await self._reply_command(interaction, lambda: bluetrack_reply(action, self.digest.blue_tracker), 'bluetrack')
+
+    @app_commands.command(name='news', description='Check Wowhead for WoW news articles.')
+    @app_commands.describe(action='check, latest, reset, test or clear')
+    @app_commands.autocomplete(action=news_action_autocomplete)
+    async def news(self, interaction: discord.Interaction, action: str = 'check'):
+        await self._reply_command(interaction, lambda: news_reply(action, self.news_scraper), 'news')
+
+    @app_commands.command(name='time', description='Shows current UTC time and next scheduled posts.')
+    async def time(self, interaction: discord.Interaction):
+        await respond(interaction, time_reply())
+
+
+async def setup(bot):
+    await bot.add_cog(SlashCommands(bot))
@@ -1,120 +1,320 @@
 """
 Scheduled tasks for the Azeroth Herald bot.
 Contains the scheduled posting functionality and blue tracker monitoring.
+
+Each process posts only to the announcement channels on its own shards. In a
+multi-process cluster only the feed leader fetches the feeds; followers receive
+snapshots and new posts from it (see src.utils.cluster).
 """
 
+import asyncio
+import json
+import logging
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 
-import discord
 from discord.ext import tasks
 
-from src.utils.blue_tracker import BlueTrackerScraper
+from src.utils.clock import utc_now
+from src.utils.cluster import (
+    FeedHub,
+    FeedSubscriber,
+    decode_items,
+    encode_items,
+    feed_ipc_address,
+    owned_channel_ids,
+    target_channel_ids,
+)
+from src.utils.delivery import create_delivery
 from src.utils.embeds import (
     create_blue_tracker_embed,
-    create_checklist_embed,
-    create_monday_warning_embed,
     create_news_embed,
+    create_news_summary_embed,
 )
+from src.utils.logs import correlated
+from src.utils.metrics import instrument_loop
+from src.utils.parse_pool import run_parse
+from src.utils.reset_digest import SNAPSHOT_TTL, get_reset_digest, summary_signature
+from src.utils.send_queue import PRIORITY_FEED
+from src.utils.supervisor import LoopSupervisor
+from src.utils.tracing import traced
 from src.utils.wowhead_news import WowheadNewsScraper
 
+logger = logging.getLogger(__name__)
+
+# Weekly announcement slots as (weekday, hour, minute) in UTC.
+# Monday Warning: 1:00 PM CDT (18:00 UTC), Tuesday Checklist: 11:00 AM CDT (16:00 UTC)
+ANNOUNCEMENT_SLOTS = {
+    'monday_warning': (0, 18, 0),
+    'tuesday_checklist': (1, 16, 0),
+}
+
+# Announcements are assembled this far ahead of their slot so that only the send
+# is left at fire time, and re-checked against the feeds at this interval until then.
+PRERENDER_LEAD = timedelta(minutes=10)
+PRERENDER_REFRESH = timedelta(minutes=2)
+
+# A slot missed because the bot was restarting or the loop slipped past its minute
+# is still posted if it is at most this late. Each slot is posted once: the last
+# slot fired per announcement is kept in a state file across restarts.
+FIRE_GRACE = timedelta(minutes=30)
+SCHEDULE_STATE_FILE = "schedule_state.json"
+
+
+def schedule_state_file(bot):
+    """Where this process keeps its last fired slots.
+
+    SCHEDULE_STATE_FILE overrides it. Otherwise a process running some of the
+    shards gets its own file, e.g. `schedule_state.0-1.json`, so processes of a
+    cluster sharing a working directory never read each other's slots.
+    """
+    override = os.getenv('SCHEDULE_STATE_FILE', '').strip()
+    if override:
+        return override
+    shard_ids = getattr(bot, 'shard_ids', None)
+    if shard_ids is None:
+        return SCHEDULE_STATE_FILE
+    return f"schedule_state.{'-'.join(str(shard_id) for shard_id in sorted(shard_ids))}.json"
+
+
+def next_slot_time(now, slot):
+    """Return the first occurrence of a (weekday, hour, minute) slot at or after `now`."""
+    weekday, hour, minute = slot
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    candidate += timedelta(days=(weekday - now.weekday()) % 7)
+    if candidate < now:
+        candidate += timedelta(days=7)
+    return candidate
+
+
+def last_slot_time(now, slot):
+    """Return the latest occurrence of a (weekday, hour, minute) slot at or before `now`."""
+    candidate = next_slot_time(now, slot)
+    return candidate if candidate == now else candidate - timedelta(days=7)
+
 
 class ScheduledTasks:
     def __init__(self, bot):
         self.bot = bot
-        self.target_channel_id = int(os.getenv('TARGET_CHANNEL_ID'))
-        self.blue_tracker = BlueTrackerScraper(region_filter='us')  # Only US posts
+        self.target_channel_ids = target_channel_ids()
+        self.feed_role = os.getenv('FEED_ROLE', 'standalone').lower()
+        self.feed_hub = None  # set on the feed leader
+        self.feed_subscriber = None  # set on feed followers
+        self._shared_at = {}  # feed -> snapshot_at last published to followers
+        self.digest = get_reset_digest()
+        self.blue_tracker = self.digest.blue_tracker  # Shared so monitor fetches refresh the digest
         self.news_scraper = WowheadNewsScraper()
+        self.delivery = create_delivery(bot)
+        # The bot's supervisor restarts a loop that dies and serves their health.
+        self.supervisor = getattr(bot, 'loop_supervisor', None) or LoopSupervisor()
+        self.prepared = {}  # kind -> pre-rendered announcement awaiting its slot
+        self.state_file = schedule_state_file(bot)
+        self.fired = self._load_fired()  # kind -> slot time last posted
+        self.ticked = asyncio.Event()  # set after the first scheduled_posts tick
+        self._announcement_builders = {
+            'monday_warning': self._build_monday_warning,
+            'tuesday_checklist': self._build_tuesday_checklist,
+        }
 
     def start_tasks(self):
         """Start all scheduled tasks."""
-        self.scheduled_posts.start()
-        self.blue_tracker_monitor.start()
-        self.news_monitor.start()
-        print("Scheduled tasks started - Bot will post Monday warnings at 1:00 PM CDT and Tuesday checklists at 11:00 AM CDT")
-        print("Blue tracker monitoring started - Checking for new Blizzard posts every 30 minutes (US region only)")
-        print("Wowhead news monitoring started - Checking for new articles every 2 hours")
+        loops = self.loops()
+        if self.feed_role == 'follower':
+            # Followers get the feeds from the leader instead of polling them.
+            del loops['blue_tracker_monitor'], loops['news_monitor']
+        for name, loop in loops.items():
+            instrument_loop(loop, name)
+            self.supervisor.add(name, loop)
+        self.supervisor.start()
+
+        logger.info("Scheduled tasks started - Bot will post Monday warnings at 1:00 PM CDT and Tuesday checklists at 11:00 AM CDT")
+
+        host, port = feed_ipc_address()
+        if self.feed_role == 'follower':
+            self.feed_subscriber = FeedSubscriber(host, port, self._on_feed_message)
+            self.feed_subscriber.start()
+            logger.info("Following the feed leader at %s:%s for blue tracker and Wowhead news updates", host, port)
+            return
+
+        if self.feed_role == 'leader':
+            self.feed_hub = FeedHub(host, port)
+            asyncio.create_task(self._start_feed_hub())
+        logger.info("Blue tracker monitoring started - Checking for new Blizzard posts every 30 minutes (US region only)")
+        logger.info("Wowhead news monitoring started - Checking for new articles every 2 hours")
+
+    def loops(self):
+        """The background loops by name, as used in metrics."""
+        return {
+            'scheduled_posts': self.scheduled_posts,
+            'blue_tracker_monitor': self.blue_tracker_monitor,
+            'news_monitor': self.news_monitor,
+        }
+
+    async def close(self):
+        """Stop all scheduled tasks and release the delivery backend."""
+        await self.supervisor.stop()
+        if self.feed_hub:
+            await self.feed_hub.close()
+        if self.feed_subscriber:
+            await self.feed_subscriber.close()
+        await self.delivery.close()
+
+    async def _start_feed_hub(self):
+        try:
+            await self.feed_hub.start()
+            logger.info("Sharing feed updates with followers on %s:%s", self.feed_hub.host, self.feed_hub.port)
+        except OSError as e:
+            logger.error("Could not start the feed hub on %s:%s: %s", self.feed_hub.host, self.feed_hub.port, e)
+
+    async def _broadcast(self, content, embeds, key=None, **kwargs):
+        """Send to every announcement channel this process owns; returns False if none could be reached."""
+        sent = False
+        for channel_id in owned_channel_ids(self.bot, self.target_channel_ids):
+            channel_key = f"{key}:{channel_id}" if key else None
+            if await self.delivery.send(channel_id, content, embeds, key=channel_key, **kwargs):
+                sent = True
+            else:
+                logger.warning("Could not find channel with ID %s", channel_id)
+        return sent
+
+    async def _share_snapshots(self):
+        """Publish any feed snapshot fetched since the last call to the cluster's followers."""
+        if self.feed_hub is None:
+            return
+        for feed, scraper in (('blue', self.blue_tracker), ('news', self.news_scraper)):
+            if scraper.snapshot_at is not None and scraper.snapshot_at != self._shared_at.get(feed):
+                self._shared_at[feed] = scraper.snapshot_at
+                await self.feed_hub.publish({
+                    'type': 'snapshot',
+                    'feed': feed,
+                    'at': scraper.snapshot_at.isoformat(),
+                    'items': await run_parse(encode_items, scraper.snapshot),
+                })
+
+    async def _on_feed_message(self, message):
+        """Apply a snapshot or post a batch of new items received from the feed leader."""
+        feed = message.get('feed')
+        scraper = self.blue_tracker if feed == 'blue' else self.news_scraper
+        if message['type'] == 'snapshot':
+            scraper.snapshot = await run_parse(decode_items, message['items'])
+            scraper.snapshot_at = datetime.fromisoformat(message['at'])
+        elif message['type'] == 'posts' and feed == 'blue':
+            await self._post_blue_updates(message['items'])
+        elif message['type'] == 'posts' and feed == 'news':
+            await self._post_news_updates(message['items'])
 
     @tasks.loop(minutes=1)
+    @correlated('scheduled_posts')
+    @traced('tick')
     async def scheduled_posts(self):
-        """Scheduled task that runs every minute to check if it's time to post."""
+        """Scheduled task that runs every minute to pre-render and post the weekly announcements."""
+        try:
+            now = utc_now().replace(second=0, microsecond=0)
+
+            for kind, slot in ANNOUNCEMENT_SLOTS.items():
+                due_at = last_slot_time(now, slot)
+                fired = self.fired.get(kind)
+                fire_at = due_at + timedelta(days=7)
+
+                if now - due_at <= FIRE_GRACE and (fired is None or fired < due_at):
+                    await self._fire_announcement(kind, due_at, now)
+                elif fire_at - now <= PRERENDER_LEAD:
+                    await self._prepare_announcement(kind, fire_at, now)
+
+        finally:
+            self.ticked.set()
+
+    async def _prepare_announcement(self, kind, fire_at, now):
+        """Assemble an announcement ahead of its slot, refreshing it if the feeds have changed."""
+        prepared = self.prepared.get(kind)
+        if prepared and prepared['fire_at'] == fire_at and now - prepared['prepared_at'] < PRERENDER_REFRESH:
+            return
+
+        signature, messages, summary = await self._announcement_builders[kind]()
+        await self._share_snapshots()
+
+        if prepared and prepared['fire_at'] == fire_at and prepared['signature'] == signature:
+            prepared['prepared_at'] = now
+            return
+
+        self.prepared[kind] = {
+            'fire_at': fire_at,
+            'prepared_at': now,
+            'signature': signature,
+            'messages': messages,
+            'summary': summary,
+        }
+        action = "Refreshed" if prepared and prepared['fire_at'] == fire_at else "Prepared"
+        logger.info("%s %s for %s %s", action, kind, fire_at, summary)
+
+    async def _fire_announcement(self, kind, fire_at, now):
+        """Send a pre-rendered announcement, building it on the spot only if preparation was missed."""
+        prepared = self.prepared.pop(kind, None)
+        if not prepared or prepared['fire_at'] != fire_at:
+            _, messages, summary = await self._announcement_builders[kind]()
+        else:
+            messages, summary = prepared['messages'], prepared['summary']
+
+        # Recorded before sending, so a restart mid-send can't post the slot twice.
+        self.fired[kind] = fire_at
+        self._save_fired()
+        if now > fire_at:
+            logger.warning("Posting %s for %s late, at %s", kind, fire_at, now)
+
+        for message in messages:
+            if not await self._broadcast(message['content'], [message['embed']]):
+                return
+
+        logger.info("Posted %s at %s %s", kind, fire_at, summary)
+
+    async def _build_monday_warning(self, max_age=PRERENDER_REFRESH):
+        """Build the Monday warning messages from the reset digest plus this week's news."""
+        # Reset-relevant blue posts come from the shared digest
+        await self.digest.refresh(max_age=self._snapshot_max_age(max_age))
+
+        # Also get reset-relevant news articles; followers use the leader's snapshot
+        shared_news = self.news_scraper.snapshot if self.feed_subscriber else None
+        reset_news = await self.news_scraper.find_reset_relevant_articles(days_back=7, items=shared_news)
+        news_summary = self.news_scraper.summarize_reset_info(reset_news)
+
+        messages = [{'content': None, 'embed': self.digest.warning_embed()}]
+
+        # Post news summary if there are relevant articles
+        if reset_news and any(news_summary.values()):
+            messages.append({'content': None, 'embed': create_news_summary_embed(news_summary)})
+
+        signature = summary_signature(self.digest.version, news_summary)
+        summary = f"with {len(self.digest.reset_posts)} relevant US blue posts and {len(reset_news)} news articles"
+        return signature, messages, summary
+
+    async def _build_tuesday_checklist(self, max_age=PRERENDER_REFRESH):
+        """Build the Tuesday checklist message from the reset digest."""
+        await self.digest.refresh(max_age=self._snapshot_max_age(max_age))
+
+        messages = [{'content': "🎉 **Weekly Reset is Here!** 🎉", 'embed': self.digest.checklist_embed()}]
+
+        summary = f"with {len(self.digest.reset_posts)} relevant US blue posts"
+        return self.digest.version, messages, summary
+
+    def _load_fired(self):
         try:
-            now = datetime.now(timezone.utc)
-
-            # Monday Warning: 1:00 PM CDT (18:00 UTC)
-            if (now.weekday() == 0 and  # Monday (0=Monday, 6=Sunday)
-                now.hour == 18 and
-                now.minute == 0):
-
-                channel = self.bot.get_channel(self.target_channel_id)
-                if channel:
-                    # Get reset-relevant blue posts for Monday warning
-                    reset_posts = self.blue_tracker.get_reset_relevant_posts(days_back=7)
-                    blue_post_summary = self.blue_tracker.summarize_reset_info(reset_posts)
-
-                    # Also get reset-relevant news articles
-                    reset_news = self.news_scraper.get_reset_relevant_articles(days_back=7)
-                    news_summary = self.news_scraper.summarize_reset_info(reset_news)
-
-                    embed = create_monday_warning_embed(blue_post_summary if reset_posts else None)
-                    await channel.send(embed=embed)
-
-                    # Post news summary if there are relevant articles
-                    if reset_news:
-                        news_embed = discord.Embed(
-                            title="📰 Recent Reset-Relevant News",
-                            description="Important Wowhead articles from this week",
-                            color=0x264653
-                        )
-
-                        for category, articles in news_summary.items():
-                            if articles:
-                                article_list = []
-                                for article in articles[:2]:  # Limit to 2 per category for Monday
-                                    title = article['title'][:40] + "..." if len(article['title']) > 40 else article['title']
-                                    article_list.append(f"• [{title}]({article['url']})")
-
-                                category_names = {
-                                    'mythic_plus': '⚔️ Mythic+ & Dungeons',
-                                    'raids': '🏛️ Raids',
-                                    'patches': '🔧 Patches & Hotfixes',
-                                    'events': '🎊 Events',
-                                    'general': '📰 General'
-                                }
-
-                                news_embed.add_field(
-                                    name=category_names.get(category, category.title()),
-                                    value="\n".join(article_list),
-                                    inline=True
-                                )
-
-                        if any(news_summary.values()):
-                            news_embed.set_footer(text="Wowhead News Summary | Azeroth Herald")
-                            await channel.send(embed=news_embed)
-
-                    print(f"Monday warning posted at {now} with {len(reset_posts)} relevant US blue posts and {len(reset_news)} news articles")
-                else:
-                    print(f"Could not find channel with ID {self.target_channel_id}")
-
-            # Tuesday Checklist: 11:00 AM CDT (16:00 UTC)
-            elif (now.weekday() == 1 and  # Tuesday
-                  now.hour == 16 and
-                  now.minute == 0):
-
-                channel = self.bot.get_channel(self.target_channel_id)
-                if channel:
-                    # Get reset-relevant blue posts for Tuesday checklist
-                    reset_posts = self.blue_tracker.get_reset_relevant_posts(days_back=7)
-                    blue_post_summary = self.blue_tracker.summarize_reset_info(reset_posts)
-
-                    embed = create_checklist_embed(blue_post_summary if reset_posts else None)
-                    await channel.send("🎉 **Weekly Reset is Here!** 🎉", embed=embed)
-                    print(f"Tuesday checklist posted at {now} with {len(reset_posts)} relevant US blue posts")
-                else:
-                    print(f"Could not find channel with ID {self.target_channel_id}")
-
-        except Exception as e:
-            print(f"Error in scheduled_posts: {e}")
+            if os.path.exists(self.state_file):
+                with open(self.state_file, encoding='utf-8') as f:
+                    return {kind: datetime.fromisoformat(at) for kind, at in json.load(f).get('fired', {}).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Error loading schedule state: %s", e)
+        return {}
+
+    def _save_fired(self):
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump({'fired': {kind: at.isoformat() for kind, at in self.fired.items()}}, f, indent=2)
+        except OSError as e:
+            logger.warning("Error saving schedule state: %s", e)
+
+    def _snapshot_max_age(self, max_age):
+        # Followers rely on the leader's snapshots and only fetch themselves if it goes quiet.
+        return SNAPSHOT_TTL if self.feed_subscriber else max_age
 
     @scheduled_posts.before_loop
     async def before_scheduled_posts(self):
@@ -122,31 +322,33 @@ class ScheduledTasks:
         await self.bot.wait_until_ready()
 
     @tasks.loop(minutes=30)
+    @correlated('blue_tracker_monitor')
+    @traced('tick')
     async def blue_tracker_monitor(self):
         """Monitor blue tracker for new posts every 30 minutes."""
-        try:
-            # Check if this is the first automated run
-            cache = self.blue_tracker.load_cache()
-            is_first_run = len(cache.get('seen_posts', [])) == 0 and cache.get('last_check') is None
-
-            new_posts = self.blue_tracker.get_new_posts()
-
-            if new_posts:
-                channel = self.bot.get_channel(self.target_channel_id)
-                if channel:
-                    if is_first_run:
-                        # Don't spam on first automated run, just log
-                        print(f"Blue tracker first run: found {len(new_posts)} US posts, marked as seen but not posting to avoid spam")
-                    else:
-                        for post in new_posts:
-                            embed = create_blue_tracker_embed(post)
-                            await channel.send("📢 **New Blizzard Post!**", embed=embed)
-                            print(f"Posted US blue tracker update: {post['title']}")
-                else:
-                    print(f"Could not find channel with ID {self.target_channel_id}")
-
-        except Exception as e:
-            print(f"Error in blue_tracker_monitor: {e}")
+        # Check if this is the first automated run
+        cache = self.blue_tracker.load_cache()
+        is_first_run = len(cache.get('seen_posts', [])) == 0 and cache.get('last_check') is None
+
+        new_posts = await self.blue_tracker.check_new_posts()
+        await self._share_snapshots()
+
+        if new_posts:
+            if is_first_run:
+                # Don't spam on first automated run, just log
+                logger.info("Blue tracker first run: found %d US posts, marked as seen but not posting to avoid spam", len(new_posts))
+            else:
+                if self.feed_hub:
+                    await self.feed_hub.publish({'type': 'posts', 'feed': 'blue', 'items': new_posts})
+                await self._post_blue_updates(new_posts)
+
+    async def _post_blue_updates(self, new_posts):
+        header = "📢 **New Blizzard Post!**" if len(new_posts) == 1 else f"📢 **{len(new_posts)} New Blizzard Posts!**"
+        embeds = [create_blue_tracker_embed(post) for post in new_posts]
+        key = "blue:" + ",".join(str(post.get('post_id')) for post in new_posts)
+        if await self._broadcast(header, embeds, identity='blizzard', priority=PRIORITY_FEED, key=key):
+            for post in new_posts:
+                logger.info("Posted US blue tracker update: %s", post['title'])
 
     @blue_tracker_monitor.before_loop
     async def before_blue_tracker_monitor(self):
@@ -154,39 +356,42 @@ class ScheduledTasks:
         await self.bot.wait_until_ready()
 
     @tasks.loop(hours=2)
+    @correlated('news_monitor')
+    @traced('tick')
     async def news_monitor(self):
         """Monitor Wowhead news for new articles every 2 hours."""
-        try:
-            # Check if this is the first automated run
-            cache = self.news_scraper.load_cache()
-            is_first_run = len(cache.get('seen_articles', [])) == 0 and cache.get('last_check') is None
-
-            new_articles = self.news_scraper.get_new_articles()
-
-            if new_articles:
-                channel = self.bot.get_channel(self.target_channel_id)
-                if channel:
-                    if is_first_run:
-                        # Don't spam on first automated run, just log
-                        print(f"Wowhead news first run: found {len(new_articles)} articles, marked as seen but not posting to avoid spam")
-                    else:
-                        # Only post reset-relevant articles automatically to avoid spam
-                        reset_relevant_articles = [article for article in new_articles if self.news_scraper.is_reset_relevant(article)]
-
-                        for article in reset_relevant_articles:
-                            embed = create_news_embed(article, is_reset_relevant=True)
-                            await channel.send("📰 **New Reset-Relevant News!**", embed=embed)
-                            print(f"Posted Wowhead news update: {article['title']}")
-
-                        # Log other articles but don't post them
-                        other_articles = len(new_articles) - len(reset_relevant_articles)
-                        if other_articles > 0:
-                            print(f"Found {other_articles} other new articles (not reset-relevant, not posting automatically)")
-                else:
-                    print(f"Could not find channel with ID {self.target_channel_id}")
-
-        except Exception as e:
-            print(f"Error in news_monitor: {e}")
+        # Check if this is the first automated run
+        cache = self.news_scraper.load_cache()
+        is_first_run = len(cache.get('seen_articles', [])) == 0 and cache.get('last_check') is None
+
+        new_articles = await self.news_scraper.check_new_articles()
+        await self._share_snapshots()
+
+        if new_articles:
+            if is_first_run:
+                # Don't spam on first automated run, just log
+                logger.info("Wowhead news first run: found %d articles, marked as seen but not posting to avoid spam", len(new_articles))
+            else:
+                # Only post reset-relevant articles automatically to avoid spam
+                reset_relevant_articles = [article for article in new_articles if self.news_scraper.is_reset_relevant(article)]
+
+                if reset_relevant_articles:
+                    if self.feed_hub:
+                        await self.feed_hub.publish({'type': 'posts', 'feed': 'news', 'items': reset_relevant_articles})
+                    await self._post_news_updates(reset_relevant_articles)
+
+                # Log other articles but don't post them
+                other_articles = len(new_articles) - len(reset_relevant_articles)
+                if other_articles > 0:
+                    logger.info("Found %d other new articles (not reset-relevant, not posting automatically)", other_articles)
+
+    async def _post_news_updates(self, reset_relevant_articles):
+        header = "📰 **New Reset-Relevant News!**"
+        embeds = [create_news_embed(article, is_reset_relevant=True) for article in reset_relevant_articles]
+        key = "news:" + ",".join(str(article.get('article_id')) for article in reset_relevant_articles)
+        if await self._broadcast(header, embeds, identity='wowhead', priority=PRIORITY_FEED, key=key):
+            for article in reset_relevant_articles:
+                logger.info("Posted Wowhead news update: %s", article['title'])
 
     @news_monitor.before_loop
     async def before_news_monitor(self):
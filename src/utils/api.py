@@ -1,59 +1,176 @@
 """
 API utilities for the Azeroth Herald bot.
 Contains functions to interact with external APIs like Raider.IO.
+
+Successful responses are kept in memory per region so repeat commands can be
+answered without another upstream request. Requests run in a worker thread so
+they never block the event loop, and concurrent cache misses for the same
+endpoint and region share one request.
 """
 
+import asyncio
 import os
+import time
+
+from src.utils.metrics import fetch_hooks, record_cache, record_fetch_error
+from src.utils.tracing import traced
+
+# How long cached Raider.IO responses stay fresh, in seconds. Affixes only change
+# at the weekly reset and cutoffs move slowly, so these can be generous.
+AFFIXES_TTL = 15 * 60
+CUTOFFS_TTL = 30 * 60
+
+# Overridden with RAIDERIO_BASE_URL, e.g. to point at the local stub server.
+DEFAULT_BASE_URL = "https://raider.io"
+
+# (endpoint, region) -> (fetched_at, data)
+_cache = {}
+
+# (endpoint, region) -> task of the request currently fetching it
+_inflight = {}
+
+_TTLS = {'affixes': AFFIXES_TTL, 'season-cutoffs': CUTOFFS_TTL}
+
+
+def _api_url(path):
+    return f"{(os.getenv('RAIDERIO_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')}/api/v1/{path}"
+
+
+def _cache_peek(endpoint, region, ttl):
+    entry = _cache.get((endpoint, region))
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def _cache_get(endpoint, region, ttl):
+    data = _cache_peek(endpoint, region, ttl)
+    record_cache("raiderio", data is not None)
+    return data
+
+
+def _cache_put(endpoint, region, data):
+    _cache[(endpoint, region)] = (time.monotonic(), data)
+
+
+def cache_ages():
+    """Age in seconds and freshness of every cached response, keyed "endpoint/region".
 
-import requests
+    Only reads the cache, so the health server can call it from its own thread.
+    """
+    now = time.monotonic()
+    return {
+        f"{endpoint}/{region}": {'age_seconds': round(now - fetched_at, 1),
+                                 'fresh': now - fetched_at < _TTLS[endpoint]}
+        for (endpoint, region), (fetched_at, _) in list(_cache.items())
+    }
 
 
+def get_cached_affixes(region='us'):
+    """Return cached affixes for a region if still fresh, otherwise None.
+
+    Never hits the network and is not counted as a cache lookup, so callers can
+    peek before calling fetch_affixes.
+    """
+    return _cache_peek('affixes', region, AFFIXES_TTL)
+
+
+def get_cached_season_cutoffs(region='us'):
+    """Return cached season cutoffs for a region if still fresh, otherwise None.
+
+    Never hits the network and is not counted as a cache lookup, so callers can
+    peek before calling fetch_season_cutoffs.
+    """
+    return _cache_peek('season-cutoffs', region, CUTOFFS_TTL)
+
+
+async def _single_flight(endpoint, region, request):
+    """Await `request()`, sharing one call between concurrent callers for the same endpoint and region."""
+    key = (endpoint, region)
+    task = _inflight.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = _inflight[key] = asyncio.ensure_future(request())
+
+        def forget(done):
+            if _inflight.get(key) is done:
+                del _inflight[key]
+
+        task.add_done_callback(forget)
+    return await asyncio.shield(task)
+
+
+@traced("fetch")
 async def fetch_affixes(region='us'):
     """Fetches current Mythic+ affixes from Raider.IO API."""
+    cached = _cache_get('affixes', region, AFFIXES_TTL)
+    if cached is not None:
+        return cached, None
+    return await _single_flight('affixes', region, lambda: _request_affixes(region))
+
+
+async def _request_affixes(region):
+    import requests  # deferred: only needed once Raider.IO is called
+
     try:
         raider_io_api_key = os.getenv('RAIDER_IO_API_KEY')
         if not raider_io_api_key:
             return None, "API key not configured"
 
-        url = "https://raider.io/api/v1/mythic-plus/affixes"
+        url = _api_url("mythic-plus/affixes")
         params = {
             'access_key': raider_io_api_key,
             'region': region,
             'locale': 'en'
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        response = await asyncio.to_thread(requests.get, url, params=params, timeout=10,
+                                           hooks=fetch_hooks("raiderio"))
         response.raise_for_status()
 
         data = response.json()
+        _cache_put('affixes', region, data)
         return data, None
 
     except requests.exceptions.RequestException as e:
+        record_fetch_error("raiderio", e)
         return None, f"API request failed: {str(e)}"
     except Exception as e:
         return None, f"Unexpected error: {str(e)}"
 
 
+@traced("fetch")
 async def fetch_season_cutoffs(region='us'):
     """Fetches current season cutoffs from Raider.IO API."""
+    cached = _cache_get('season-cutoffs', region, CUTOFFS_TTL)
+    if cached is not None:
+        return cached, None
+    return await _single_flight('season-cutoffs', region, lambda: _request_season_cutoffs(region))
+
+
+async def _request_season_cutoffs(region):
+    import requests  # deferred: only needed once Raider.IO is called
+
     try:
         raider_io_api_key = os.getenv('RAIDER_IO_API_KEY')
         if not raider_io_api_key:
             return None, "API key not configured"
 
-        url = "https://raider.io/api/v1/mythic-plus/season-cutoffs"
+        url = _api_url("mythic-plus/season-cutoffs")
         params = {
             'access_key': raider_io_api_key,
             'region': region
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        response = await asyncio.to_thread(requests.get, url, params=params, timeout=10,
+                                           hooks=fetch_hooks("raiderio"))
         response.raise_for_status()
 
         data = response.json()
+        _cache_put('season-cutoffs', region, data)
         return data, None
 
     except requests.exceptions.RequestException as e:
+        record_fetch_error("raiderio", e)
         return None, f"API request failed: {str(e)}"
     except Exception as e:
         return None, f"Unexpected error: {str(e)}"
@@ -6,6 +6,7 @@ Uses Wowhead's public Blue Tracker RSS feed
 which sits behind Cloudflare bot protection.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -15,20 +16,39 @@ from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional
 
-import requests
+from src.utils.clock import utc_now
+from src.utils.metrics import fetch_hooks, record_fetch_error
+from src.utils.parse_pool import run_parse
+from src.utils.tracing import span, traced
 
 logger = logging.getLogger(__name__)
 
+# Seen post IDs kept in the cache. The feed holds 50 items, so anything older
+# than the last few hundred can never come back round.
+MAX_SEEN_IDS = 500
+
+# Overridden with WOWHEAD_BASE_URL, e.g. to point at the local stub server.
+DEFAULT_BASE_URL = "https://www.wowhead.com"
+
+# Response validator -> request header for conditional fetches.
+_VALIDATORS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
 
 class BlueTrackerScraper:
-    def __init__(self, region_filter: Optional[str] = "us") -> None:
-        self.url = "https://www.wowhead.com/blue-tracker?rss"
+    def __init__(self, region_filter: Optional[str] = "us", base_url: Optional[str] = None) -> None:
+        base_url = (base_url or os.getenv("WOWHEAD_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+        self.url = f"{base_url}/blue-tracker?rss"
         self.cache_file = "blue_tracker_cache.json"
         self.region_filter = region_filter.lower() if region_filter else None
         self.headers = {
             "User-Agent": "AzerothHerald/1.0 (+https://github.com/Deetss/AzerothHerald)",
             "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
         }
+        # Items from the most recent successful fetch, shared with ResetDigest.
+        self.snapshot: Optional[List[ET.Element]] = None
+        self.snapshot_at: Optional[datetime] = None
+        # Validators of the snapshot, sent back so an unchanged feed is a bodiless 304.
+        self.validators: Dict[str, str] = {}
 
     def load_cache(self) -> Dict:
         try:
@@ -46,24 +66,39 @@ class BlueTrackerScraper:
         except OSError as e:
             logger.warning("Error saving cache: %s", e)
 
+    @traced("fetch")
     def fetch_blue_tracker_page(self) -> Optional[List[ET.Element]]:
         """Fetch the Blue Tracker RSS feed and return its <item> elements."""
+        import requests  # deferred: only needed once a feed is fetched
+
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=10)
+            headers = dict(self.headers, **self.validators) if self.snapshot is not None else self.headers
+            response = requests.get(self.url, headers=headers, timeout=10, hooks=fetch_hooks("blue_tracker"))
             response.raise_for_status()
-            root = ET.fromstring(response.content)
-            return root.findall(".//item")
+            if response.status_code == 304 and self.snapshot is not None:
+                self.snapshot_at = utc_now()
+                return self.snapshot
+            with span("parse.xml", bytes=len(response.content)):
+                root = ET.fromstring(response.content)
+            items = root.findall(".//item")
+            self.snapshot, self.snapshot_at = items, utc_now()
+            self.validators = {
+                header: response.headers[name] for name, header in _VALIDATORS.items() if name in response.headers
+            }
+            return items
         except (requests.RequestException, ET.ParseError) as e:
+            record_fetch_error("blue_tracker", e)
             logger.error("Error fetching blue tracker feed: %s", e)
             return None
 
+    @traced("parse")
     def parse_posts(self, items: Optional[List[ET.Element]]) -> List[Dict]:
         """Normalize RSS <item> elements into post dicts (filters by region only)."""
         if not items:
             return []
 
         posts: List[Dict] = []
-        now_iso = datetime.now(timezone.utc).isoformat()
+        now_iso = utc_now().isoformat()
 
         for item in items[:50]:
             try:
@@ -113,21 +148,36 @@ class BlueTrackerScraper:
         ]
         return not any(k in title for k in exclude_keywords)
 
-    def get_new_posts(self) -> List[Dict]:
-        cache = self.load_cache()
-        seen_posts = set(cache.get("seen_posts", []))
-        is_first_run = len(seen_posts) == 0 and cache.get("last_check") is None
+    def relevant_posts(self, items: Optional[List[ET.Element]]) -> List[Dict]:
+        return [p for p in self.parse_posts(items) if self.is_relevant_post(p)]
 
+    def get_new_posts(self) -> List[Dict]:
         items = self.fetch_blue_tracker_page()
         if items is None:
             return []
+        return self.record_new_posts(self.relevant_posts(items))
+
+    async def check_new_posts(self) -> List[Dict]:
+        """`get_new_posts` from the event loop: fetches in a worker thread and parses on the parse pool."""
+        items = await asyncio.to_thread(self.fetch_blue_tracker_page)
+        if items is None:
+            return []
+        return self.record_new_posts(await run_parse(self.relevant_posts, items))
+
+    def record_new_posts(self, all_posts: List[Dict]) -> List[Dict]:
+        """Mark freshly parsed posts as seen and return the ones not reported before."""
+        cache = self.load_cache()
+        seen_order = cache.get("seen_posts", [])
+        seen_posts = set(seen_order)
+        is_first_run = len(seen_posts) == 0 and cache.get("last_check") is None
 
-        all_posts = [p for p in self.parse_posts(items) if self.is_relevant_post(p)]
         new_posts: List[Dict] = []
+        in_feed: Dict[str, None] = {}
         for post in all_posts:
             unique_id = f"id_{post['post_id']}" if post.get("post_id") else (
                 f"{post['title']}_{post['author']}_{post.get('time_posted', '')}"
             )
+            in_feed[unique_id] = None
             if unique_id not in seen_posts:
                 new_posts.append(post)
                 seen_posts.add(unique_id)
@@ -136,8 +186,11 @@ class BlueTrackerScraper:
             logger.info("First run detected - returning %d most recent posts", min(3, len(new_posts)))
             new_posts = new_posts[:3]
 
-        cache["seen_posts"] = list(seen_posts)
-        cache["last_check"] = datetime.now(timezone.utc).isoformat()
+        # Oldest first, with IDs still in the feed moved to the end so trimming
+        # never forgets a post that could be reported again.
+        seen_order = [i for i in seen_order if i not in in_feed] + list(in_feed)
+        cache["seen_posts"] = seen_order[-MAX_SEEN_IDS:]
+        cache["last_check"] = utc_now().isoformat()
         self.save_cache(cache)
 
         return new_posts
@@ -173,12 +226,16 @@ class BlueTrackerScraper:
             embed_data["image"] = {"url": image_url}
         return embed_data
 
-    def get_reset_relevant_posts(self, days_back: int = 7) -> List[Dict]:
-        items = self.fetch_blue_tracker_page()
+    @traced("classify")
+    def get_reset_relevant_posts(self, days_back: int = 7,
+                                 items: Optional[List[ET.Element]] = None) -> List[Dict]:
+        """Reset-relevant posts from the last `days_back` days; fetches the feed unless `items` is given."""
+        if items is None:
+            items = self.fetch_blue_tracker_page()
         if items is None:
             return []
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+        cutoff = utc_now() - timedelta(days=days_back)
         relevant: List[Dict] = []
         for post in self.parse_posts(items):
             if not self.is_relevant_post(post):
@@ -233,6 +290,7 @@ class BlueTrackerScraper:
         is_high_priority = any(k in combined for k in high_priority)
         return has_reset or (has_timing and is_high_priority)
 
+    @traced("classify")
     def summarize_reset_info(self, posts: List[Dict]) -> Dict:
         if not posts:
             return {}
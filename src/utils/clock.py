@@ -0,0 +1,40 @@
+"""
+Clock for the Azeroth Herald bot.
+
+The scheduler, the reset digest and the feed scrapers read the time through
+`utc_now()` instead of calling `datetime.now` themselves, so a test or
+`scripts/simulate_schedule.py` can swap in a `FakeClock` with `set_clock()` and
+replay weeks of schedule in seconds.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+_source: Optional[Callable[[], datetime]] = None
+
+
+def utc_now() -> datetime:
+    """The current time as an aware UTC datetime, from the installed clock if any."""
+    return _source() if _source is not None else datetime.now(timezone.utc)
+
+
+def set_clock(source: Optional[Callable[[], datetime]]) -> None:
+    """Read the time from `source` (any callable returning an aware datetime); None restores the real clock."""
+    global _source
+    _source = source
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, start: datetime) -> None:
+        if start.tzinfo is None:
+            raise ValueError("FakeClock needs an aware datetime")
+        self.now = start.astimezone(timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, delta: timedelta) -> datetime:
+        self.now += delta
+        return self.now
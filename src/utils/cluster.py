@@ -0,0 +1,232 @@
+"""
+Sharding and cluster coordination for the Azeroth Herald bot.
+
+A bot in many guilds can run as one auto-sharded process, or as several
+processes that each run some of the shards (`SHARD_COUNT` / `SHARD_IDS`).
+Every process runs its own scheduler and only posts to announcement channels
+in guilds on its own shards.
+
+Feeds are still fetched once per cluster. The process started with
+`FEED_ROLE=leader` runs the feed monitors. It publishes each feed snapshot and
+each batch of new posts over a local socket as newline-delimited JSON.
+Processes started with `FEED_ROLE=follower` subscribe to it, keep their feed
+snapshots from what they receive, and post the new items to their own
+channels. A single process (`FEED_ROLE=standalone`, the default) fetches for
+itself.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import xml.etree.ElementTree as ET
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FEED_ROLES = ("standalone", "leader", "follower")
+DEFAULT_FEED_IPC_ADDRESS = "127.0.0.1:8765"
+
+# Largest single message a follower will accept (a full feed snapshot is ~100 KB).
+MAX_MESSAGE_BYTES = 8 * 1024 * 1024
+
+# How long a follower waits before reconnecting to the leader.
+RECONNECT_DELAY = 5
+
+
+def parse_ids(value: Optional[str]) -> List[int]:
+    """Parse a comma-separated list of IDs, e.g. TARGET_CHANNEL_ID or SHARD_IDS."""
+    return [int(part) for part in (value or "").split(",") if part.strip()]
+
+
+def target_channel_ids() -> List[int]:
+    """Announcement channels from TARGET_CHANNEL_ID (one ID, or several separated by commas)."""
+    return parse_ids(os.getenv("TARGET_CHANNEL_ID"))
+
+
+def shard_options() -> Tuple[bool, Dict]:
+    """Read SHARD_COUNT / SHARD_IDS and return (sharded, client keyword arguments).
+
+    SHARD_COUNT unset runs a single unsharded connection. `auto` lets Discord pick
+    the shard count and runs every shard in this process. A number fixes the
+    count, and SHARD_IDS (e.g. `0,1`) then limits this process to those shards.
+    """
+    shard_count = os.getenv("SHARD_COUNT", "").strip().lower()
+    shard_ids = os.getenv("SHARD_IDS", "").strip()
+
+    if not shard_count:
+        if shard_ids:
+            raise ValueError("SHARD_IDS requires SHARD_COUNT")
+        return False, {}
+    if shard_count == "auto":
+        if shard_ids:
+            raise ValueError("SHARD_IDS requires a numeric SHARD_COUNT")
+        return True, {"shard_count": None}
+
+    options = {"shard_count": int(shard_count)}
+    if shard_ids:
+        options["shard_ids"] = parse_ids(shard_ids)
+    return True, options
+
+
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    """The shard Discord routes a guild to."""
+    return (guild_id >> 22) % shard_count
+
+
+def owns_guild(bot, guild_id: int) -> bool:
+    """Whether this process runs the shard for `guild_id`."""
+    shard_ids = getattr(bot, "shard_ids", None)
+    if not bot.shard_count or shard_ids is None:
+        return True  # unsharded, or every shard runs here
+    return shard_for_guild(guild_id, bot.shard_count) in shard_ids
+
+
+def owned_channel_ids(bot, channel_ids: Iterable[int]) -> List[int]:
+    """The subset of `channel_ids` in guilds on this process's shards."""
+    if getattr(bot, "shard_ids", None) is None:
+        return list(channel_ids)
+
+    owned = []
+    for channel_id in channel_ids:
+        guild = getattr(bot.get_channel(channel_id), "guild", None)
+        if guild is not None and owns_guild(bot, guild.id):
+            owned.append(channel_id)
+    return owned
+
+
+def feed_ipc_address() -> Tuple[str, int]:
+    """(host, port) of the leader's feed socket, from FEED_IPC_ADDRESS."""
+    host, _, port = os.getenv("FEED_IPC_ADDRESS", DEFAULT_FEED_IPC_ADDRESS).rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def encode_items(items: List[ET.Element]) -> List[str]:
+    """Serialize RSS <item> elements so a feed snapshot can be sent to followers."""
+    return [ET.tostring(item, encoding="unicode") for item in items]
+
+
+def decode_items(encoded: List[str]) -> List[ET.Element]:
+    return [ET.fromstring(item) for item in encoded]
+
+
+def _encode_message(message: Dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class FeedHub:
+    """Leader side: accepts follower connections and broadcasts feed messages to all of them.
+
+    The latest snapshot of each feed is replayed to followers when they connect,
+    so a shard that starts (or restarts) late is never left without feed data.
+    Post batches are not replayed; they are only posted by shards connected at
+    the time.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._writers = set()
+        self._connections = set()  # one handler task per follower
+        self._latest: Dict[str, Dict] = {}  # feed -> last snapshot message
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._on_connect, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]  # resolves port 0 to the bound port
+        logger.info("Feed hub listening on %s:%s", self.host, self.port)
+
+    @property
+    def followers(self) -> int:
+        return len(self._writers)
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        self._connections.add(asyncio.current_task())
+        try:
+            for message in self._latest.values():
+                writer.write(_encode_message(message))
+            await writer.drain()
+            await reader.read()  # followers never send; this returns when they disconnect
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._connections.discard(asyncio.current_task())
+            writer.close()
+
+    async def publish(self, message: Dict) -> None:
+        """Send a message to every connected follower."""
+        if message.get("type") == "snapshot":
+            self._latest[message["feed"]] = message
+
+        line = _encode_message(message)
+        for writer in list(self._writers):
+            try:
+                writer.write(line)
+                await writer.drain()
+            except ConnectionError as e:
+                logger.warning("Dropping feed follower: %s", e)
+                self._writers.discard(writer)
+                writer.close()
+
+    async def close(self) -> None:
+        for writer in list(self._writers):
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+
+class FeedSubscriber:
+    """Follower side: stays connected to the leader's hub and hands each message to `handler`."""
+
+    def __init__(self, host: str, port: int, handler: Callable[[Dict], Awaitable[None]],
+                 reconnect_delay: float = RECONNECT_DELAY) -> None:
+        self.host = host
+        self.port = port
+        self.handler = handler
+        self.reconnect_delay = reconnect_delay
+        self.connected = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port, limit=MAX_MESSAGE_BYTES)
+            except OSError as e:
+                logger.warning("Feed leader at %s:%s unavailable (%s), retrying", self.host, self.port, e)
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            logger.info("Connected to feed leader at %s:%s", self.host, self.port)
+            self.connected.set()
+            try:
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    try:
+                        await self.handler(json.loads(line))
+                    except Exception as e:  # noqa: BLE001 - one bad message must not drop the connection
+                        logger.error("Error handling feed message: %s", e)
+            except (ConnectionError, ValueError) as e:
+                logger.warning("Lost connection to feed leader: %s", e)
+            finally:
+                self.connected.clear()
+                writer.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,244 @@
+"""
+Message delivery utilities for the Azeroth Herald bot.
+Packs embeds into as few Discord messages as the API limits allow, and provides
+the backends automated posts go through (bot channel sends or per-channel webhooks).
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+import discord
+
+from src.utils.metrics import record_cache
+from src.utils.send_queue import QueuedDelivery, SendQueue
+
+logger = logging.getLogger(__name__)
+
+# Discord API limits for a single message.
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+def batch_embeds(embeds: List[discord.Embed],
+                 max_embeds: int = MAX_EMBEDS_PER_MESSAGE,
+                 max_chars: int = MAX_EMBED_CHARS_PER_MESSAGE) -> List[List[discord.Embed]]:
+    """Group embeds in order into batches that each fit in one message.
+
+    A batch holds at most `max_embeds` embeds whose combined character count
+    (as counted by Discord: titles, descriptions, fields, footers, author names)
+    stays within `max_chars`. An embed that is too large on its own still gets
+    a batch to itself so nothing is silently dropped.
+    """
+    batches: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    current_chars = 0
+
+    for embed in embeds:
+        size = len(embed)
+        if current and (len(current) >= max_embeds or current_chars + size > max_chars):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(embed)
+        current_chars += size
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def send_embed_batches(destination, embeds: List[discord.Embed], content: Optional[str] = None):
+    """Send embeds to a channel or context using as few messages as possible.
+
+    `content` is attached to the first message only. Returns the sent messages.
+    """
+    if not embeds:
+        return [await destination.send(content)]
+
+    messages = []
+    for index, batch in enumerate(batch_embeds(embeds)):
+        messages.append(await destination.send(content if index == 0 else None, embeds=batch))
+    return messages
+
+
+async def send_reply(destination, reply):
+    """Send a reply dict (`content` and `embeds`, see src/utils/replies.py) to a channel or context."""
+    return await send_embed_batches(destination, reply['embeds'], content=reply['content'])
+
+
+# Name given to the webhooks the bot creates, so it can find and reuse its own.
+WEBHOOK_NAME = "Azeroth Herald"
+
+# How long a channel whose webhook could not be created posts through the
+# fallback before creation is tried again (seconds).
+WEBHOOK_RETRY_AFTER = 3600
+
+# Display identities for webhook posts, keyed by the `identity` passed to `send`.
+WEBHOOK_IDENTITIES: Dict[str, Dict[str, Optional[str]]] = {
+    "herald": {
+        "username": "Azeroth Herald",
+        "avatar_url": None,
+    },
+    "blizzard": {
+        "username": "Blizzard Blue Tracker",
+        "avatar_url": "https://images.blz-contentstack.com/v3/assets/blt95b381df7c12c15c/blt2477dceb7fdcaa86/5f0f9a41baa6c218a505c97d/wow-circle-blue.png",
+    },
+    "wowhead": {
+        "username": "Wowhead News",
+        "avatar_url": "https://wow.zamimg.com/images/wow/icons/large/achievement_general_stayclassy.jpg",
+    },
+}
+
+
+class ChannelDelivery:
+    """Posts through the bot's own `channel.send` (the default backend)."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def send(self, channel_id: int, content: Optional[str] = None,
+                   embeds: Optional[List[discord.Embed]] = None, identity: str = "herald") -> bool:
+        """Send to a channel. Returns False if the channel could not be found."""
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            return False
+
+        if embeds:
+            await send_embed_batches(channel, embeds, content=content)
+        else:
+            await channel.send(content)
+        return True
+
+    async def close(self) -> None:
+        pass
+
+
+class WebhookDelivery:
+    """Posts through one webhook per channel, with a distinct name and avatar per feed.
+
+    Webhooks are created on first use (this needs the Manage Webhooks permission)
+    and their URLs are cached in `webhook_cache.json` so they are reused across
+    restarts. All webhook requests share one pooled HTTP session. If a webhook
+    cannot be created, the channel falls back to normal channel sends for
+    WEBHOOK_RETRY_AFTER seconds before creation is tried again.
+    """
+
+    def __init__(self, bot, cache_file: str = "webhook_cache.json") -> None:
+        self.bot = bot
+        self.cache_file = cache_file
+        self.fallback = ChannelDelivery(bot)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.webhooks: Dict[int, discord.Webhook] = {}
+        self.fallback_until: Dict[int, float] = {}  # channel -> monotonic time to retry webhook creation
+
+    def load_cache(self) -> Dict:
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, encoding="utf-8") as f:
+                    return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Error loading webhook cache: %s", e)
+        return {"webhooks": {}}
+
+    def save_cache(self, cache_data: Dict) -> None:
+        try:
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(cache_data, f, indent=2)
+        except OSError as e:
+            logger.warning("Error saving webhook cache: %s", e)
+
+    def _session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10))
+        return self.session
+
+    async def _get_webhook(self, channel_id: int) -> Optional[discord.Webhook]:
+        webhook = self.webhooks.get(channel_id)
+        record_cache("webhooks", webhook is not None)
+        if webhook:
+            return webhook
+        if time.monotonic() < self.fallback_until.get(channel_id, 0):
+            return None
+
+        cache = self.load_cache()
+        url = cache.get("webhooks", {}).get(str(channel_id))
+        if not url:
+            channel = self.bot.get_channel(channel_id)
+            if not channel:
+                return None
+            try:
+                existing = [w for w in await channel.webhooks()
+                            if w.name == WEBHOOK_NAME and w.user == self.bot.user and w.url]
+                created = existing[0] if existing else await channel.create_webhook(name=WEBHOOK_NAME)
+            except discord.HTTPException as e:
+                logger.warning("Could not create webhook for channel %s, using channel sends for %ds: %s",
+                               channel_id, WEBHOOK_RETRY_AFTER, e)
+                self.fallback_until[channel_id] = time.monotonic() + WEBHOOK_RETRY_AFTER
+                return None
+            url = created.url
+            cache.setdefault("webhooks", {})[str(channel_id)] = url
+            self.save_cache(cache)
+
+        webhook = discord.Webhook.from_url(url, session=self._session())
+        self.webhooks[channel_id] = webhook
+        return webhook
+
+    def _forget_webhook(self, channel_id: int) -> None:
+        self.webhooks.pop(channel_id, None)
+        cache = self.load_cache()
+        if cache.get("webhooks", {}).pop(str(channel_id), None):
+            self.save_cache(cache)
+
+    async def send(self, channel_id: int, content: Optional[str] = None,
+                   embeds: Optional[List[discord.Embed]] = None, identity: str = "herald") -> bool:
+        """Send to a channel via its webhook. Returns False if the channel could not be found."""
+        profile = WEBHOOK_IDENTITIES.get(identity, WEBHOOK_IDENTITIES["herald"])
+        kwargs = {"username": profile["username"]}
+        if profile["avatar_url"]:
+            kwargs["avatar_url"] = profile["avatar_url"]
+
+        batches = batch_embeds(embeds) if embeds else [None]
+        sent = 0  # batches already posted; a retry resumes after them
+        for attempt in range(2):
+            webhook = await self._get_webhook(channel_id)
+            if webhook is None:
+                remaining = [embed for batch in batches[sent:] if batch for embed in batch]
+                return await self.fallback.send(channel_id, content if sent == 0 else None, remaining, identity)
+            try:
+                for batch in batches[sent:]:
+                    text = content if sent == 0 else None
+                    if batch is None:
+                        await webhook.send(text, **kwargs)
+                    else:
+                        await webhook.send(text, embeds=batch, **kwargs)
+                    sent += 1
+                return True
+            except discord.NotFound:
+                # Webhook was deleted from the channel; create a fresh one once.
+                logger.warning("Webhook for channel %s no longer exists, recreating", channel_id)
+                self._forget_webhook(channel_id)
+                if attempt:
+                    raise
+        return False
+
+    async def close(self) -> None:
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+
+def create_delivery(bot):
+    """Build the delivery backend selected by the DELIVERY_MODE env var ("channel" or "webhook").
+
+    The backend is wrapped so its sends go through the bot's send queue.
+    """
+    mode = os.getenv("DELIVERY_MODE", "channel").lower()
+    if mode == "webhook":
+        backend = WebhookDelivery(bot)
+    else:
+        if mode != "channel":
+            logger.warning("Unknown DELIVERY_MODE %r, using channel delivery", mode)
+        backend = ChannelDelivery(bot)
+    return QueuedDelivery(backend, getattr(bot, "send_queue", None) or SendQueue())
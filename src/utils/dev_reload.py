@@ -0,0 +1,144 @@
+"""
+Development hot reload for the Azeroth Herald bot.
+
+dev_runner.py watches the source tree and decides, for each batch of changed
+files, whether the running bot can pick the change up in place or needs a full
+restart. In-place reloads are sent to the bot as `reload <module> ...` lines on
+its stdin. The bot listens for them only when started with DEV_HOT_RELOAD=1.
+
+Reloadable in place:
+
+- command extensions (`src/commands/*.py`), through `reload_extension`
+- stateless rendering helpers (HELPER_MODULES), re-imported with
+  importlib.reload together with every helper that imports from them, and
+  followed by a reload of every loaded extension so the cogs pick up the new
+  functions. The reset digest calls the embed builders through the module and
+  has its rendered embeds dropped, so `!checklist` and `!warning` re-render.
+
+Anything else (bot.py, the scheduler, modules holding state such as the send
+queue or the reset digest) needs a full restart. The scheduler keeps the helper
+functions it imported at startup until then.
+"""
+
+import asyncio
+import importlib
+import logging
+import sys
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from discord.ext import commands
+
+from src.utils.reset_digest import get_reset_digest
+
+COMMANDS_PACKAGE = "src.commands"
+
+logger = logging.getLogger(__name__)
+
+# Helpers with no module-level state, in dependency order (replies imports embeds).
+HELPER_MODULES = ("src.utils.embeds", "src.utils.replies")
+
+# Helper -> helpers holding `from <helper> import ...` bindings, which go stale
+# unless they are reloaded after it.
+HELPER_DEPENDENTS = {"src.utils.embeds": ("src.utils.replies",)}
+
+# Paths that never affect the running bot.
+IGNORED_DIRS = ("tests", "scripts", "docs", ".git", "__pycache__")
+
+
+def module_for_path(path: str, root: str = ".") -> Optional[str]:
+    """Dotted module name for a .py file under `root`, or None if it is outside the tree."""
+    try:
+        relative = Path(path).resolve().relative_to(Path(root).resolve())
+    except ValueError:
+        return None
+    if relative.suffix != ".py":
+        return None
+    parts = list(relative.with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts) or None
+
+
+def _with_dependents(helpers: Iterable[str]) -> List[str]:
+    """`helpers` plus every helper that depends on them, in HELPER_MODULES order."""
+    pending, selected = list(helpers), set()
+    while pending:
+        module = pending.pop()
+        if module not in selected:
+            selected.add(module)
+            pending.extend(HELPER_DEPENDENTS.get(module, ()))
+    return [module for module in HELPER_MODULES if module in selected]
+
+
+def plan_reload(paths: Iterable[str], root: str = ".") -> Tuple[str, List[str]]:
+    """Decide how to apply a batch of changed files.
+
+    Returns ("reload", modules) when every change can be reloaded in place,
+    ("restart", modules) when at least one needs a full restart (the modules
+    listed are the ones that forced it), or ("ignore", []) when nothing the bot
+    runs has changed.
+    """
+    reload_modules, restart_modules = set(), set()
+    for path in paths:
+        module = module_for_path(path, root)
+        if module is None or module.split(".")[0] in IGNORED_DIRS:
+            continue
+        if module in HELPER_MODULES or module.startswith(COMMANDS_PACKAGE + "."):
+            reload_modules.add(module)
+        else:
+            restart_modules.add(module)
+
+    if restart_modules:
+        return "restart", sorted(restart_modules)
+    if reload_modules:
+        helpers = _with_dependents(module for module in HELPER_MODULES if module in reload_modules)
+        return "reload", helpers + sorted(reload_modules - set(helpers))
+    return "ignore", []
+
+
+async def apply_reload(bot: commands.Bot, modules: List[str]) -> None:
+    """Reload the given helpers and extensions inside the running bot."""
+    helpers = _with_dependents(module for module in modules if module in HELPER_MODULES)
+    extensions = [module for module in modules if module not in HELPER_MODULES]
+
+    try:
+        for module in helpers:
+            if module in sys.modules:
+                importlib.reload(sys.modules[module])
+            else:
+                importlib.import_module(module)
+            logger.info("Reloaded helper %s", module)
+    except Exception as e:
+        logger.error("Failed to reload %s: %s", module, e)
+        return
+
+    if helpers:
+        get_reset_digest().clear_rendered()
+        # Every cog may use the helpers, so re-execute all of them against the new code.
+        extensions = sorted(set(extensions) | set(bot.extensions))
+
+    for extension in extensions:
+        try:
+            try:
+                await bot.reload_extension(extension)
+            except commands.ExtensionNotLoaded:
+                await bot.load_extension(extension)  # a newly added command module
+            logger.info("Reloaded %s", extension)
+        except Exception as e:
+            logger.error("Failed to reload %s: %s", extension, e)
+
+
+def start_reload_listener(bot: commands.Bot, loop: asyncio.AbstractEventLoop) -> threading.Thread:
+    """Read `reload <module> ...` lines from stdin on a daemon thread and apply them on `loop`."""
+
+    def listen():
+        for line in sys.stdin:
+            command, *modules = line.split() or [""]
+            if command == "reload" and modules:
+                asyncio.run_coroutine_threadsafe(apply_reload(bot, modules), loop)
+
+    thread = threading.Thread(target=listen, name="dev-reload", daemon=True)
+    thread.start()
+    return thread
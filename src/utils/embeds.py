@@ -3,11 +3,15 @@ Embed creation utilities for the Azeroth Herald bot.
 Contains functions to create various Discord embeds.
 """
 
+from datetime import datetime, timedelta
 from typing import Dict, Optional
 
 import discord
 
+from src.utils.tracing import traced
 
+
+@traced("render")
 def create_checklist_embed(blue_post_summary: Optional[Dict] = None):
     """Creates and returns the weekly checklist Discord embed with optional blue post integration."""
     embed = discord.Embed(
@@ -71,6 +75,7 @@ def create_checklist_embed(blue_post_summary: Optional[Dict] = None):
     return embed
 
 
+@traced("render")
 def create_monday_warning_embed(blue_post_summary: Optional[Dict] = None):
     """Creates and returns the Monday warning embed with optional blue post integration."""
     embed = discord.Embed(
@@ -105,6 +110,40 @@ def create_monday_warning_embed(blue_post_summary: Optional[Dict] = None):
     return embed
 
 
+@traced("render")
+def create_news_summary_embed(news_summary: Dict, per_category: int = 2):
+    """Creates and returns the reset-relevant news summary embed posted alongside the Monday warning."""
+    news_embed = discord.Embed(
+        title="📰 Recent Reset-Relevant News",
+        description="Important Wowhead articles from this week",
+        color=0x264653
+    )
+
+    category_names = {
+        'mythic_plus': '⚔️ Mythic+ & Dungeons',
+        'raids': '🏛️ Raids',
+        'patches': '🔧 Patches & Hotfixes',
+        'events': '🎊 Events',
+        'general': '📰 General'
+    }
+
+    for category, articles in news_summary.items():
+        if articles:
+            article_list = []
+            for article in articles[:per_category]:
+                title = article['title'][:40] + "..." if len(article['title']) > 40 else article['title']
+                article_list.append(f"• [{title}]({article['url']})")
+
+            news_embed.add_field(
+                name=category_names.get(category, category.title()),
+                value="\n".join(article_list),
+                inline=True
+            )
+
+    news_embed.set_footer(text="Wowhead News Summary | Azeroth Herald")
+    return news_embed
+
+
 def _add_blue_post_fields_to_embed(embed: discord.Embed, blue_post_summary: Dict, is_weekly_checklist: bool = True):
     """Helper function to add blue post information to embeds."""
     if not blue_post_summary:
@@ -263,6 +302,7 @@ def _get_thematic_image_for_article(article_data: Dict) -> Optional[str]:
     return None
 
 
+@traced("render")
 def create_affixes_embed(affixes_data, region='us'):
     """Creates and returns the affixes embed."""
     embed = discord.Embed(
@@ -296,6 +336,7 @@ def create_affixes_embed(affixes_data, region='us'):
     return embed
 
 
+@traced("render")
 def create_season_cutoffs_embed(cutoffs_data, region='us'):
     """Creates and returns the season cutoffs embed."""
     embed = discord.Embed(
@@ -368,6 +409,7 @@ def create_season_cutoffs_embed(cutoffs_data, region='us'):
     return embed
 
 
+@traced("render")
 def create_blue_tracker_embed(post_data):
     """Creates and returns a Discord embed for a blue tracker post."""
     title = post_data['title'][:256]  # Discord title limit
@@ -425,6 +467,7 @@ def create_blue_tracker_embed(post_data):
     return embed
 
 
+@traced("render")
 def create_news_embed(article_data, is_reset_relevant=False):
     """Creates and returns a Discord embed for a Wowhead news article."""
     title = article_data['title'][:256]  # Discord title limit
@@ -481,3 +524,44 @@ def create_news_embed(article_data, is_reset_relevant=False):
     embed.set_footer(text=footer_text)
 
     return embed
+
+
+@traced("render")
+def create_time_embed(now: datetime):
+    """Creates and returns the schedule information embed for the given current time (UTC)."""
+    # Calculate next Monday 18:00 UTC
+    days_until_monday = (7 - now.weekday()) % 7 if now.weekday() != 0 else 0
+    if now.weekday() == 0 and now.hour >= 18:  # Past Monday posting time
+        days_until_monday = 7
+    next_monday = now.replace(hour=18, minute=0, second=0, microsecond=0) + timedelta(days=days_until_monday)
+
+    # Calculate next Tuesday 16:00 UTC
+    days_until_tuesday = (8 - now.weekday()) % 7 if now.weekday() != 1 else 0
+    if now.weekday() == 1 and now.hour >= 16:  # Past Tuesday posting time
+        days_until_tuesday = 7
+    next_tuesday = now.replace(hour=16, minute=0, second=0, microsecond=0) + timedelta(days=days_until_tuesday)
+
+    embed = discord.Embed(
+        title="🕐 Bot Schedule Information",
+        color=discord.Color.green()
+    )
+
+    embed.add_field(
+        name="Current Time (UTC)",
+        value=f"{now.strftime('%A, %B %d, %Y at %H:%M:%S')}",
+        inline=False
+    )
+
+    embed.add_field(
+        name="Next Monday Warning",
+        value=f"{next_monday.strftime('%A, %B %d, %Y at %H:%M')} UTC\n(1:00 PM CDT)",
+        inline=True
+    )
+
+    embed.add_field(
+        name="Next Tuesday Checklist",
+        value=f"{next_tuesday.strftime('%A, %B %d, %Y at %H:%M')} UTC\n(11:00 AM CDT)",
+        inline=True
+    )
+
+    return embed
@@ -2,12 +2,20 @@
 Error handling utilities for the Azeroth Herald bot.
 """
 
+import logging
+
 import discord
 from discord.ext import commands
 
+logger = logging.getLogger(__name__)
+
+
+async def handle_command_error(ctx, error, action=None):
+    """Centralized command error handling.
 
-async def handle_command_error(ctx, error):
-    """Centralized command error handling."""
+    `action` describes what the command was doing (e.g. "checking blue tracker")
+    and is included in the log line for unexpected errors.
+    """
     # Command not found
     if isinstance(error, commands.CommandNotFound):
         embed = discord.Embed(
@@ -69,6 +77,16 @@ async def handle_command_error(ctx, error):
         await ctx.send(embed=embed)
         return
 
+    # Owner-only command used by someone else
+    elif isinstance(error, commands.NotOwner):
+        embed = discord.Embed(
+            title="🚫 Owner Only",
+            description="This command can only be used by the bot's owner.",
+            color=discord.Color.red()
+        )
+        await ctx.send(embed=embed)
+        return
+
     # Bot lacks permissions
     elif isinstance(error, commands.BotMissingPermissions):
         embed = discord.Embed(
@@ -99,8 +117,9 @@ async def handle_command_error(ctx, error):
         await ctx.send(embed=embed)
 
         # Log the error for debugging
-        print(f"Unhandled command error: {error}")
-        print(f"Command: {ctx.command}")
-        print(f"User: {ctx.author}")
-        print(f"Channel: {ctx.channel}")
+        logger.error(
+            "Unhandled command error%s: %s", f" while {action}" if action else "", error,
+            exc_info=error if error.__traceback__ else None,
+            extra={"command": str(ctx.command), "user": str(ctx.author), "channel": str(ctx.channel)},
+        )
         return
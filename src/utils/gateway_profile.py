@@ -0,0 +1,65 @@
+"""
+Gateway profiles for the Azeroth Herald bot.
+
+The bot only reads the messages that invoke its commands and only posts to text
+channels, so most of what discord.py caches by default is never used. The
+`lowmem` profile is meant for large guild counts:
+
+- subscribes only to the guild and message intents
+- keeps no message cache and no member list
+- skips member chunking at startup
+- trims each guild's cached channels and roles down to what the bot touches
+
+Commands sent from a channel that is not cached still work; discord.py hands
+them a partial channel that can be replied to.
+"""
+
+from typing import Dict, Iterable
+
+import discord
+
+GATEWAY_PROFILES = ('default', 'lowmem')
+
+
+def gateway_options(profile: str = 'default', message_content: bool = True) -> Dict:
+    """Client keyword arguments (intents and cache settings) for a gateway profile."""
+    if profile not in GATEWAY_PROFILES:
+        raise ValueError(f"Unknown gateway profile {profile!r}; expected one of: {', '.join(GATEWAY_PROFILES)}")
+
+    if profile == 'default':
+        intents = discord.Intents.default()
+        intents.message_content = message_content
+        return {'intents': intents}
+
+    intents = discord.Intents.none()
+    intents.guilds = True  # channel cache, needed to resolve the announcement channel
+    intents.guild_messages = True  # prefix commands
+    intents.dm_messages = True
+    intents.message_content = message_content
+    return {
+        'intents': intents,
+        'max_messages': None,
+        'chunk_guilds_at_startup': False,
+        'member_cache_flags': discord.MemberCacheFlags.none(),
+    }
+
+
+def trim_guild_cache(guild: discord.Guild, keep_channel_ids: Iterable[int] = ()) -> None:
+    """Drop cached channels and roles the bot never uses.
+
+    Text channels (and any channel in `keep_channel_ids`) stay cached, as do
+    @everyone and the bot's own roles. Everything else, such as voice channels,
+    categories and other members' roles, is removed from the guild's cache.
+    """
+    keep_channel_ids = set(keep_channel_ids)
+    for channel in list(guild.channels):
+        if not isinstance(channel, discord.TextChannel) and channel.id not in keep_channel_ids:
+            guild._remove_channel(channel)
+
+    me = guild.me
+    keep_role_ids = {guild.id}  # @everyone shares the guild's ID
+    if me is not None:
+        keep_role_ids.update(role.id for role in me.roles)
+    for role in list(guild.roles):
+        if role.id not in keep_role_ids:
+            guild._remove_role(role.id)
@@ -0,0 +1,120 @@
+"""
+Liveness and readiness probes for the Azeroth Herald bot.
+
+`HEALTH_PORT` starts a small HTTP server (on its own threads, like the metrics
+server) for container orchestration:
+
+- `/healthz` is the liveness probe. It answers 200 while the event loop is
+  responsive: a heartbeat task on the loop stamps the time every second, and
+  the probe fails once that stamp is older than `LIVENESS_TIMEOUT`.
+- `/readyz` is the readiness probe. It answers 200 when the gateway is
+  connected and the last successful blue tracker and Wowhead news fetches are
+  within their SLOs (`READY_BLUE_MAX_AGE_MINUTES`, `READY_NEWS_MAX_AGE_MINUTES`).
+  The age of every cached Raider.IO response is reported too. Raider.IO is only
+  fetched when a command asks, and a stale entry is simply re-fetched then, so
+  cache age does not affect readiness.
+
+Probe handlers only read attributes the bot already keeps, so they never wait
+on the event loop or contend with command handling. Both return a JSON body
+describing each check.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+
+from src.utils import api
+from src.utils.clock import utc_now
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 1.0
+LIVENESS_TIMEOUT = 30.0
+
+# Twice-and-a-bit the monitor intervals (30 minutes and 2 hours), so one failed
+# poll does not make the bot unready but two in a row do.
+DEFAULT_BLUE_MAX_AGE = timedelta(minutes=75)
+DEFAULT_NEWS_MAX_AGE = timedelta(minutes=270)
+
+JSON_TYPE = "application/json"
+
+
+def _minutes(name: str, default: timedelta) -> timedelta:
+    value = os.getenv(name)
+    try:
+        return timedelta(minutes=float(value)) if value else default
+    except ValueError:
+        logger.warning("Ignoring %s=%r, not a number of minutes", name, value)
+        return default
+
+
+class HealthCheck:
+    """Liveness and readiness of one bot, computed from state readable off the event loop."""
+
+    def __init__(self, bot, blue_max_age: Optional[timedelta] = None,
+                 news_max_age: Optional[timedelta] = None) -> None:
+        self.bot = bot
+        self.max_ages = {
+            "blue_tracker": blue_max_age or _minutes("READY_BLUE_MAX_AGE_MINUTES", DEFAULT_BLUE_MAX_AGE),
+            "wowhead_news": news_max_age or _minutes("READY_NEWS_MAX_AGE_MINUTES", DEFAULT_NEWS_MAX_AGE),
+        }
+        self.feeds: Dict[str, object] = {}  # name -> scraper whose snapshot_at is its last good fetch
+        self.beat: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the heartbeat. Must be called from inside the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._heartbeat())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            self.beat = time.monotonic()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    def liveness(self) -> Tuple[bool, Dict]:
+        silent = None if self.beat is None else time.monotonic() - self.beat
+        ok = silent is not None and silent < LIVENESS_TIMEOUT
+        return ok, {"ok": ok, "event_loop_silent_seconds": None if silent is None else round(silent, 2),
+                    "timeout_seconds": LIVENESS_TIMEOUT}
+
+    def readiness(self) -> Tuple[bool, Dict]:
+        checks = {"gateway": self._gateway()}
+        now = utc_now()
+        for name, max_age in self.max_ages.items():
+            scraper = self.feeds.get(name)
+            fetched_at = getattr(scraper, "snapshot_at", None)
+            age = None if fetched_at is None else (now - fetched_at).total_seconds()
+            checks[name] = {
+                "ok": age is not None and age <= max_age.total_seconds(),
+                "last_fetch": fetched_at.isoformat() if fetched_at else None,
+                "age_seconds": None if age is None else round(age, 1),
+                "max_age_seconds": max_age.total_seconds(),
+            }
+        ready = all(check["ok"] for check in checks.values())
+        checks["raiderio_cache"] = api.cache_ages()  # informational, see the module docstring
+        return ready, {"ready": ready, "checks": checks}
+
+    def _gateway(self) -> Dict:
+        latency = self.bot.latency  # nan without a websocket, inf before the first heartbeat ack
+        connected = self.bot.is_ready() and not self.bot.is_closed() and math.isfinite(latency)
+        return {"ok": connected, "latency_ms": round(latency * 1000, 1) if math.isfinite(latency) else None}
+
+    def routes(self) -> Dict:
+        """`/healthz` and `/readyz` for `serve_routes`: 200 when passing, 503 otherwise."""
+        def respond(probe):
+            ok, body = probe()
+            return 200 if ok else 503, JSON_TYPE, json.dumps(body, indent=2) + "\n"
+
+        return {"/healthz": lambda: respond(self.liveness), "/readyz": lambda: respond(self.readiness)}
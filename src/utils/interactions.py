@@ -0,0 +1,245 @@
+"""
+HTTP interactions endpoint for the Azeroth Herald bot.
+
+Serves Discord interactions (slash commands and autocomplete) over plain HTTP,
+with no gateway connection. Requests are verified with the application's
+Ed25519 public key, routed to the same reply builders the cogs use, and
+answered inline. Commands that need upstream data are acknowledged with a
+deferred response and completed through the interaction webhook over REST.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+from aiohttp import web
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+
+from src.utils.api import get_cached_affixes, get_cached_season_cutoffs
+from src.utils.delivery import batch_embeds
+from src.utils.logs import new_correlation_id
+from src.utils.replies import (
+    BLUETRACK_ACTIONS,
+    NEWS_ACTIONS,
+    VALID_REGIONS,
+    affixes_reply,
+    bluetrack_reply,
+    checklist_reply,
+    cutoffs_reply,
+    invalid_region_reply,
+    news_reply,
+    time_reply,
+    unexpected_error_reply,
+)
+from src.utils.reset_digest import get_reset_digest
+from src.utils.wowhead_news import WowheadNewsScraper
+
+logger = logging.getLogger(__name__)
+
+# Overridable so deferred completions can be pointed at a local stand-in.
+DISCORD_API_BASE = os.getenv("DISCORD_API_BASE", "https://discord.com/api/v10")
+
+# Interaction and response types from the Discord API.
+PING = 1
+APPLICATION_COMMAND = 2
+APPLICATION_COMMAND_AUTOCOMPLETE = 4
+PONG = 1
+CHANNEL_MESSAGE_WITH_SOURCE = 4
+DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE = 5
+APPLICATION_COMMAND_AUTOCOMPLETE_RESULT = 8
+EPHEMERAL_FLAG = 1 << 6
+
+# Reject signed requests older than this, to limit replays.
+MAX_TIMESTAMP_SKEW = 5 * 60
+
+# Autocomplete choices per (command, option), built once at import.
+AUTOCOMPLETE_CHOICES: Dict[tuple, List[Dict[str, str]]] = {
+    ("affixes", "region"): [{"name": region.upper(), "value": region} for region in VALID_REGIONS],
+    ("cutoffs", "region"): [{"name": region.upper(), "value": region} for region in VALID_REGIONS],
+    ("bluetrack", "action"): [{"name": action, "value": action} for action in BLUETRACK_ACTIONS],
+    ("news", "action"): [{"name": action, "value": action} for action in NEWS_ACTIONS],
+}
+
+
+def verify_signature(public_key: VerifyKey, signature: str, timestamp: str, body: bytes) -> bool:
+    """Check Discord's X-Signature-Ed25519 over timestamp + body."""
+    try:
+        if abs(time.time() - int(timestamp)) > MAX_TIMESTAMP_SKEW:
+            return False
+        public_key.verify(timestamp.encode() + body, bytes.fromhex(signature))
+        return True
+    except (BadSignatureError, ValueError, TypeError):
+        return False
+
+
+def _options(data: Dict) -> Dict:
+    return {option["name"]: option.get("value") for option in data.get("options", [])}
+
+
+def _command_name(payload: Dict) -> str:
+    return (payload.get("data") or {}).get("name", "")
+
+
+def _message_data(content: Optional[str], embeds, ephemeral: bool = False) -> Dict:
+    data = {"content": content, "embeds": [embed.to_dict() for embed in embeds]}
+    if ephemeral:
+        data["flags"] = EPHEMERAL_FLAG
+    return data
+
+
+class InteractionRouter:
+    """Turns interaction payloads into responses using the shared reply builders."""
+
+    def __init__(self, api_base: str = DISCORD_API_BASE) -> None:
+        self.api_base = api_base.rstrip("/")
+        self.digest = get_reset_digest()
+        self.news_scraper = WowheadNewsScraper()
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._background = set()
+
+    async def close(self) -> None:
+        for task in list(self._background):
+            task.cancel()
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+    def _command(self, name: str, options: Dict):
+        """Return (needs_defer, reply coroutine factory, ephemeral) for a command, or None if unknown."""
+        if name in ("affixes", "cutoffs"):
+            region = str(options.get("region") or "us").lower()
+            if region not in VALID_REGIONS:
+                return False, lambda: _ready(invalid_region_reply(region)), True
+            if name == "affixes":
+                return get_cached_affixes(region) is None, lambda: affixes_reply(region), False
+            return get_cached_season_cutoffs(region) is None, lambda: cutoffs_reply(region), False
+        if name == "checklist":
+            return self.digest.snapshot_stale(), lambda: checklist_reply(self.digest), False
+        if name == "bluetrack":
+            action = str(options.get("action") or "check")
+            return True, lambda: bluetrack_reply(action, self.digest.blue_tracker), False
+        if name == "news":
+            action = str(options.get("action") or "check")
+            return True, lambda: news_reply(action, self.news_scraper), False
+        if name == "time":
+            return False, lambda: _ready(time_reply()), False
+        return None
+
+    async def handle(self, payload: Dict) -> Dict:
+        """Return the immediate HTTP response body for an interaction payload."""
+        kind = payload.get("type")
+        data = payload.get("data") or {}
+
+        if kind == PING:
+            return {"type": PONG}
+
+        if kind == APPLICATION_COMMAND_AUTOCOMPLETE:
+            focused = next((o for o in data.get("options", []) if o.get("focused")), None)
+            choices = []
+            if focused:
+                current = str(focused.get("value") or "").lower()
+                choices = [c for c in AUTOCOMPLETE_CHOICES.get((data.get("name"), focused["name"]), [])
+                           if c["value"].startswith(current)][:25]
+            return {"type": APPLICATION_COMMAND_AUTOCOMPLETE_RESULT, "data": {"choices": choices}}
+
+        if kind == APPLICATION_COMMAND:
+            # Deferred completions inherit the ID, so their REST failures can be traced to the command.
+            new_correlation_id(data.get("name") or "interaction")
+            command = self._command(data.get("name", ""), _options(data))
+            if command is None:
+                return {"type": CHANNEL_MESSAGE_WITH_SOURCE,
+                        "data": {"content": "❌ Unknown command.", "flags": EPHEMERAL_FLAG}}
+            needs_defer, build_reply, ephemeral = command
+
+            if needs_defer:
+                self._spawn(self._complete_deferred(payload, build_reply))
+                return {"type": DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE}
+
+            reply = await build_reply()
+            batches = batch_embeds(reply["embeds"]) or [[]]
+            if len(batches) > 1:
+                self._spawn(self._send_followups(payload, batches[1:]))
+            return {"type": CHANNEL_MESSAGE_WITH_SOURCE,
+                    "data": _message_data(reply["content"], batches[0], ephemeral)}
+
+        return {"type": CHANNEL_MESSAGE_WITH_SOURCE,
+                "data": {"content": "❌ Unsupported interaction.", "flags": EPHEMERAL_FLAG}}
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    def _webhook_url(self, payload: Dict) -> str:
+        return f"{self.api_base}/webhooks/{payload['application_id']}/{payload['token']}"
+
+    async def _complete_deferred(self, payload: Dict, build_reply) -> None:
+        name = _command_name(payload)
+        try:
+            reply = await build_reply()
+        except Exception as e:  # noqa: BLE001 - always answer the deferred interaction
+            logger.error("Error in /%s interaction: %s", name, e)
+            reply = unexpected_error_reply(name, e)
+
+        batches = batch_embeds(reply["embeds"]) or [[]]
+        url = f"{self._webhook_url(payload)}/messages/@original"
+        try:
+            async with self._session().patch(url, json=_message_data(reply["content"], batches[0])) as response:
+                if response.status >= 400:
+                    logger.error("Failed to complete /%s interaction: HTTP %s", name, response.status)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            logger.exception("Failed to complete /%s interaction", name)
+            return
+        await self._send_followups(payload, batches[1:])
+
+    async def _send_followups(self, payload: Dict, batches) -> None:
+        name = _command_name(payload)
+        for batch in batches:
+            try:
+                async with self._session().post(self._webhook_url(payload),
+                                                json=_message_data(None, batch)) as response:
+                    if response.status >= 400:
+                        logger.error("Failed to send /%s interaction followup: HTTP %s", name, response.status)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                logger.exception("Failed to send /%s interaction followup", name)
+                return
+
+
+async def _ready(reply: Dict) -> Dict:
+    return reply
+
+
+def create_app(public_key: str, router: Optional[InteractionRouter] = None) -> web.Application:
+    """Build the aiohttp application serving POST /interactions."""
+    verify_key = VerifyKey(bytes.fromhex(public_key))
+    router = router or InteractionRouter()
+
+    async def interactions(request: web.Request) -> web.Response:
+        body = await request.read()
+        signature = request.headers.get("X-Signature-Ed25519", "")
+        timestamp = request.headers.get("X-Signature-Timestamp", "")
+        if not verify_signature(verify_key, signature, timestamp, body):
+            return web.Response(status=401, text="invalid request signature")
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.Response(status=400, text="invalid JSON")
+        return web.json_response(await router.handle(payload))
+
+    async def on_cleanup(app: web.Application) -> None:
+        await router.close()
+
+    app = web.Application()
+    app.router.add_post("/interactions", interactions)
+    app.on_cleanup.append(on_cleanup)
+    return app
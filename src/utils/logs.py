@@ -0,0 +1,178 @@
+"""
+Logging pipeline for the Azeroth Herald bot.
+
+Every log record goes through a QueueHandler on the root logger. Only a queue
+put happens on the calling thread (usually the event loop); a QueueListener
+thread does the formatting and the stdout write, so a slow pipe under Docker
+can't stall the loop.
+
+- Output is one JSON object per line by default (LOG_FORMAT=json), or plain
+  text for local development (LOG_FORMAT=text). LOG_LEVEL sets the level.
+- Records carry the correlation ID of the command invocation or scheduler tick
+  they were logged from (see `correlated` and `new_correlation_id`). IDs are
+  held in a context variable, so they follow tasks spawned from that context.
+- Repeated identical warnings and errors (e.g. a missing channel hit on every
+  tick) are logged once per window; the next one that gets through reports
+  how many were suppressed.
+"""
+
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import secrets
+import sys
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
+# Identical warning/error lines are let through once per this many seconds.
+RATE_LIMIT_WINDOW = 300
+
+# LogRecord attributes that are not user-supplied `extra` fields.
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "correlation_id", "suppressed"}
+
+
+def new_correlation_id(kind: str) -> str:
+    """Start a new correlation ID for the current task and return it."""
+    value = f"{kind}-{secrets.token_hex(4)}"
+    correlation_id.set(value)
+    return value
+
+
+def correlated(kind: str):
+    """Decorator giving every call of a coroutine function its own correlation ID."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            token = correlation_id.set(f"{kind}-{secrets.token_hex(4)}")
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                correlation_id.reset(token)
+        return wrapper
+    return decorator
+
+
+class CorrelationFilter(logging.Filter):
+    """Stamp records with the correlation ID of the context they were logged from."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop repeats of the same warning or error line within `window` seconds."""
+
+    def __init__(self, window: float = RATE_LIMIT_WINDOW, level: int = logging.WARNING) -> None:
+        super().__init__()
+        self.window = window
+        self.level = level
+        self._seen: Dict[Tuple[str, int, str], list] = {}  # key -> [last emitted, suppressed count]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level:
+            return True
+        key = (record.name, record.levelno, record.getMessage())
+        now = time.monotonic()
+        state = self._seen.get(key)
+        if state is not None and now - state[0] < self.window:
+            state[1] += 1
+            return False
+        if state is not None and state[1]:
+            record.suppressed = state[1]
+        self._seen[key] = [now, 0]
+        if len(self._seen) > 1000:
+            self._seen = {k: v for k, v in self._seen.items() if now - v[0] < self.window}
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "correlation_id", None):
+            entry["correlation_id"] = record.correlation_id
+        if getattr(record, "suppressed", None):
+            entry["suppressed"] = record.suppressed
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self) -> None:
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s", "%H:%M:%S")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        line = super().formatMessage(record)
+        if getattr(record, "correlation_id", None):
+            line += f" [{record.correlation_id}]"
+        if getattr(record, "suppressed", None):
+            line += f" (+{record.suppressed} suppressed)"
+        return line
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render the message and traceback now, while the arguments are still
+        # live, but keep the record's fields so the listener can format it.
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(level: Optional[str] = None, fmt: Optional[str] = None, stream=None) -> QueueListener:
+    """Route all logging through a queue to a listener thread writing to `stream` (stdout).
+
+    Replaces any handlers on the root logger and returns the started listener,
+    which is also stopped (and flushed) at interpreter exit.
+    """
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    fmt = (fmt or os.getenv("LOG_FORMAT", "json")).lower()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(TextFormatter() if fmt == "text" else JsonFormatter())
+
+    records = queue.SimpleQueue()
+    handler = _QueueHandler(records)
+    handler.addFilter(CorrelationFilter())
+    handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    listener = QueueListener(records, output)
+    listener.start()
+    atexit.register(stop_logging, listener)
+    return listener
+
+
+def stop_logging(listener: QueueListener) -> None:
+    """Flush the queue and stop the listener thread; safe to call more than once."""
+    if listener._thread is not None:
+        listener.stop()
@@ -0,0 +1,133 @@
+"""
+Event-loop lag monitor for the Azeroth Herald bot.
+
+A heartbeat task sleeps for a short interval and records how late it wakes up;
+that delay is the time the loop spent running something else without yielding.
+A watchdog thread checks the heartbeat, and once it has been silent for longer
+than the threshold it captures the event loop thread's stack with
+`sys._current_frames()`, while the blocking call is still running. The report
+names the innermost frame in the bot's own code (the function that made the
+blocking call) along with the full stack.
+
+Enabled with LOOP_MONITOR=true. When the loop is idle the cost is one short
+sleep per interval and one thread wake-up per interval.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+LOOP_LAG = REGISTRY.histogram(
+    "herald_event_loop_lag_seconds", "How late the event loop heartbeat woke up.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0))
+LOOP_STALLS = REGISTRY.counter(
+    "herald_event_loop_stalls_total", "Event loop stalls over the threshold, by blocking function.",
+    ("function",))
+
+
+def culprit(stack: traceback.StackSummary, root: Path = PROJECT_ROOT) -> traceback.FrameSummary:
+    """The innermost frame from the bot's own code, or the innermost frame if none is."""
+    for frame in reversed(stack):
+        path = Path(frame.filename).resolve()
+        if path != Path(__file__).resolve() and root in path.parents and "site-packages" not in path.parts:
+            return frame
+    return stack[-1]
+
+
+class LoopLagMonitor:
+    def __init__(self, threshold: float = 0.1, interval: Optional[float] = None) -> None:
+        self.threshold = threshold
+        self.interval = interval if interval is not None else min(threshold / 2, 0.1)
+        self.max_lag = 0.0
+        self.stalls = deque(maxlen=20)  # most recent stall reports, newest last
+        self._beat = 0.0
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start the heartbeat and the watchdog. Must be called from inside the running event loop."""
+        if self._task:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self._beat = now = time.monotonic()
+            lag = max(now - expected, 0.0)
+            LOOP_LAG.observe(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+            stall = self.stalls[-1] if self.stalls else None
+            if stall is not None and stall["blocked_for"] is None:
+                stall["blocked_for"] = lag
+                logger.warning("Event loop was blocked for %.0f ms in %s (%s)",
+                               lag * 1000, stall["function"], stall["location"])
+
+    def _watch(self) -> None:
+        reported = None
+        while not self._stop.wait(self.interval):
+            beat = self._beat
+            if beat == reported or time.monotonic() - beat <= self.threshold:
+                continue
+            reported = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._report(traceback.extract_stack(frame))
+
+    def _report(self, stack: traceback.StackSummary) -> None:
+        frame = culprit(stack)
+        location = f"{frame.filename}:{frame.lineno}"
+        self.stalls.append({
+            "detected_at": time.time(),
+            "function": frame.name,
+            "location": location,
+            "stack": "".join(stack.format()),
+            "blocked_for": None,  # filled in by the heartbeat once the loop resumes
+        })
+        LOOP_STALLS.inc(function=frame.name)
+        logger.warning("Event loop blocked for over %.0f ms in %s (%s). Stack:\n%s",
+                       self.threshold * 1000, frame.name, location, "".join(stack.format()))
+
+    def report(self) -> Dict:
+        return {
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "max_lag_ms": round(self.max_lag * 1000, 1),
+            "stalls": [self._summary(stall) for stall in self.stalls],
+        }
+
+    @staticmethod
+    def _summary(stall: Dict) -> Dict:
+        blocked_for = stall["blocked_for"]
+        return {
+            "function": stall["function"],
+            "location": stall["location"],
+            "blocked_ms": round(blocked_for * 1000, 1) if blocked_for is not None else None,
+        }
@@ -0,0 +1,162 @@
+"""
+Memory introspection for the Azeroth Herald bot.
+
+Built on tracemalloc, which records where every allocation was made once it is
+started. A snapshot lists the live allocations grouped by source line; diffing
+two snapshots shows which lines are holding on to more memory than before,
+which is what a slow leak looks like from the inside.
+
+tracemalloc slows allocation down noticeably, so it only runs when asked for:
+- `!admin memory` starts it if needed, takes a snapshot and replies with the
+  top allocation sites and the growth since the previous snapshot.
+- MEMORY_TRACE=true starts it at boot and takes a snapshot every
+  MEMORY_SNAPSHOT_MINUTES, logging the top growth each time.
+
+Process RSS is exported as a metric whether tracing is on or not.
+"""
+
+import asyncio
+import logging
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from src.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP = 15
+DEFAULT_FRAMES = 1
+DEFAULT_INTERVAL_MINUTES = 60
+MAX_SNAPSHOTS = 4
+
+# Allocations made by the tracing machinery itself are noise in every report.
+_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _traced_memory():
+    if not tracemalloc.is_tracing():
+        return {}
+    current, peak = tracemalloc.get_traced_memory()
+    return {("current",): current, ("peak",): peak}
+
+
+REGISTRY.gauge("herald_process_rss_bytes", "Resident set size of the bot process.", callback=rss_bytes)
+REGISTRY.gauge("herald_traced_memory_bytes", "Memory traced by tracemalloc, while it is running.",
+               ("kind",), callback=_traced_memory)
+
+
+def _size(n: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+class MemoryTracker:
+    """Takes tracemalloc snapshots and reports top allocation sites and growth between them."""
+
+    def __init__(self, frames: int = DEFAULT_FRAMES, keep: int = MAX_SNAPSHOTS) -> None:
+        self.frames = frames
+        # (label, taken at, snapshot); the oldest are dropped, each one holds every live trace.
+        self.snapshots: Deque[Tuple[str, float, tracemalloc.Snapshot]] = deque(maxlen=keep)
+
+    def start(self) -> bool:
+        """Start tracemalloc; returns False if it was already running."""
+        if tracemalloc.is_tracing():
+            return False
+        tracemalloc.start(self.frames)
+        return True
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self.snapshots.clear()
+
+    def snapshot(self, label: str = "manual") -> tracemalloc.Snapshot:
+        """Take and keep a snapshot. Blocks for a while on a large heap; run it in a thread."""
+        snap = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        self.snapshots.append((label, time.time(), snap))
+        return snap
+
+    def top(self, limit: int = DEFAULT_TOP, key: str = "lineno") -> List[tracemalloc.Statistic]:
+        """The largest allocation sites in the latest snapshot."""
+        if not self.snapshots:
+            return []
+        return self.snapshots[-1][2].statistics(key)[:limit]
+
+    def growth(self, limit: int = DEFAULT_TOP, key: str = "lineno") -> List[tracemalloc.StatisticDiff]:
+        """Allocation sites that grew the most between the last two snapshots."""
+        if len(self.snapshots) < 2:
+            return []
+        diff = self.snapshots[-1][2].compare_to(self.snapshots[-2][2], key)
+        return [stat for stat in diff if stat.size_diff > 0][:limit]
+
+    def report(self, limit: int = DEFAULT_TOP) -> str:
+        """Plain-text summary of the latest snapshot and its diff against the previous one."""
+        lines = [f"Process RSS: {_size(rss_bytes())}"]
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"Traced: {_size(current)} now, {_size(peak)} peak")
+        if not self.snapshots:
+            lines.append("No snapshots yet.")
+            return "\n".join(lines) + "\n"
+
+        label, taken, snap = self.snapshots[-1]
+        total = sum(stat.size for stat in snap.statistics("filename"))
+        lines.append(f"\n=== Top {limit} allocation sites ({label}, {_size(total)} live) ===")
+        lines.extend(str(stat) for stat in self.top(limit))
+
+        if len(self.snapshots) >= 2:
+            before_label, before_taken, _ = self.snapshots[-2]
+            minutes = (taken - before_taken) / 60
+            lines.append(f"\n=== Top {limit} growth since {before_label} ({minutes:.1f} min earlier) ===")
+            growth = self.growth(limit)
+            lines.extend(str(stat) for stat in growth)
+            if not growth:
+                lines.append("No growth.")
+        return "\n".join(lines) + "\n"
+
+    async def run_periodic(self, interval: float, limit: int = DEFAULT_TOP) -> None:
+        """Take a snapshot every `interval` seconds and log the top growth."""
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.snapshot, "periodic")
+            growth = self.growth(5)
+            if growth:
+                logger.info("Memory growth since the last snapshot:\n%s", "\n".join(str(stat) for stat in growth))
+            logger.debug("Memory snapshot\n%s", self.report(limit))
+
+
+tracker = MemoryTracker()
+
+
+def start_memory_tracking_from_env() -> Optional[asyncio.Task]:
+    """Start tracemalloc and periodic snapshots if MEMORY_TRACE=true."""
+    if os.getenv("MEMORY_TRACE", "false").lower() != "true":
+        return None
+    tracker.frames = int(os.getenv("MEMORY_TRACE_FRAMES", DEFAULT_FRAMES))
+    tracker.start()
+    tracker.snapshot("startup")
+    minutes = float(os.getenv("MEMORY_SNAPSHOT_MINUTES", DEFAULT_INTERVAL_MINUTES))
+    logger.info("Tracing allocations; snapshots every %g minutes", minutes)
+    return asyncio.create_task(tracker.run_periodic(minutes * 60))
@@ -0,0 +1,381 @@
+"""
+Prometheus metrics for the Azeroth Herald bot.
+
+Metrics live in one process-wide registry and are rendered in the Prometheus
+text exposition format by a small HTTP server running in its own thread, so a
+scrape never waits on the event loop. The server is started by bot.py when
+METRICS_PORT is set.
+
+Instrumentation is attached through hooks rather than at every call site:
+
+- commands: `instrument_bot` listens for `on_command`, `on_command_completion`,
+  `on_command_error` and `on_app_command_completion`, and wraps the command
+  tree's `on_error` for slash command failures
+- task loops: `instrument_loop` wraps a `tasks.Loop` body to time each tick and
+  measure how late it started against its schedule
+- upstream fetches: `fetch_hooks` returns a `requests` response hook recording
+  latency, status and body size per upstream
+- caches: `record_cache` counts hits and misses
+- send queue: depth and per-priority totals are read from the queue at scrape time
+"""
+
+import functools
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds. Wide enough for both a cached command reply and a slow feed download.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def header(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> Iterable[str]:
+        yield from self.header()
+        for key, value in sorted(self.samples().items()):
+            yield f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """A value that can go up and down, or one read from `callback` at scrape time.
+
+    `callback` returns a number for an unlabelled gauge, or a dict of label
+    values tuple -> number.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, *args, callback: Optional[Callable] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.callback = callback
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self) -> Dict[LabelValues, float]:
+        if self.callback is None:
+            return super().samples()
+        try:
+            result = self.callback()
+        except Exception as e:
+            logger.warning("Metric callback for %s failed: %s", self.name, e)
+            return {}
+        if isinstance(result, dict):
+            return result
+        return {(): result} if result is not None else {}
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._values: Dict[LabelValues, list] = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[-1] if state else 0
+
+    def render(self) -> Iterable[str]:
+        yield from self.header()
+        with self._lock:
+            values = {key: list(state) for key, state in self._values.items()}
+        for key, state in sorted(values.items()):
+            for bound, count in zip(self.buckets, state):
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, key, le)} {count}"
+            yield f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(state[-2])}"
+            yield f"{self.name}_count{_format_labels(self.labels, key)} {state[-1]}"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _add(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = (),
+              callback: Optional[Callable] = None) -> Gauge:
+        return self._add(Gauge(name, help_text, labels, callback=callback))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help_text, labels, buckets=buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+COMMANDS = REGISTRY.counter(
+    "herald_commands_total", "Command invocations by outcome.", ("command", "kind", "status"))
+COMMAND_LATENCY = REGISTRY.histogram(
+    "herald_command_duration_seconds", "Time from invocation to completion.", ("command", "kind"))
+
+FETCHES = REGISTRY.counter(
+    "herald_fetches_total", "Upstream HTTP requests by status code (or 'error' with no response).",
+    ("upstream", "status"))
+FETCH_LATENCY = REGISTRY.histogram(
+    "herald_fetch_duration_seconds", "Upstream response time, up to the response headers.", ("upstream",))
+FETCH_BYTES = REGISTRY.counter(
+    "herald_fetch_bytes_total", "Upstream response body bytes.", ("upstream",))
+
+LOOP_TICKS = REGISTRY.counter(
+    "herald_loop_ticks_total", "Task loop iterations by outcome.", ("loop", "status"))
+LOOP_DURATION = REGISTRY.histogram(
+    "herald_loop_tick_duration_seconds", "Time spent in one task loop iteration.", ("loop",))
+LOOP_DRIFT = REGISTRY.histogram(
+    "herald_loop_drift_seconds", "How late a task loop iteration started against its schedule.", ("loop",),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0))
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    "herald_cache_lookups_total", "Cache lookups by result (hit or miss).", ("cache", "result"))
+
+
+def _cache_hit_ratio() -> Dict[LabelValues, float]:
+    totals: Dict[str, list] = {}
+    for (cache, result), count in CACHE_LOOKUPS.samples().items():
+        hits_and_total = totals.setdefault(cache, [0, 0])
+        hits_and_total[1] += count
+        if result == "hit":
+            hits_and_total[0] += count
+    return {(cache,): hits / total for cache, (hits, total) in totals.items() if total}
+
+
+REGISTRY.gauge("herald_cache_hit_ratio", "Share of cache lookups served from the cache.", ("cache",),
+               callback=_cache_hit_ratio)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count one lookup against a named cache."""
+    CACHE_LOOKUPS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_fetch_error(upstream: str, error: Exception) -> None:
+    """Count a request that failed before a response arrived (timeout, connection error).
+
+    Failures that did get a response, such as `raise_for_status`, were already
+    counted under their status code by the response hook, and parse errors are
+    not fetch failures, so both are ignored here.
+    """
+    if hasattr(error, "request") and getattr(error, "response", None) is None:
+        FETCHES.inc(upstream=upstream, status="error")
+
+
+def fetch_hooks(upstream: str) -> Dict[str, Callable]:
+    """`hooks=` argument for `requests.get` recording latency, status and size per upstream."""
+
+    def record(response, *args, **kwargs):
+        FETCHES.inc(upstream=upstream, status=str(response.status_code))
+        FETCH_LATENCY.observe(response.elapsed.total_seconds(), upstream=upstream)
+        FETCH_BYTES.inc(len(response.content), upstream=upstream)
+        return response
+
+    return {"response": record}
+
+
+def instrument_loop(loop, name: str) -> None:
+    """Time every iteration of a `tasks.Loop` and record how late it started.
+
+    The loop's body is replaced on this instance only; calling it again is a no-op.
+    """
+    coro = loop.coro
+    if getattr(coro, "_herald_metrics", False):
+        return
+
+    @functools.wraps(coro)
+    async def timed(*args, **kwargs):
+        # Loop sets _last_iteration to the time this iteration was scheduled for.
+        scheduled = getattr(loop, "_last_iteration", None)
+        if scheduled is not None:
+            drift = (datetime.now(timezone.utc) - scheduled).total_seconds()
+            LOOP_DRIFT.observe(max(drift, 0.0), loop=name)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            await coro(*args, **kwargs)
+            status = "ok"
+        finally:
+            LOOP_DURATION.observe(time.perf_counter() - started, loop=name)
+            LOOP_TICKS.inc(loop=name, status=status)
+
+    timed._herald_metrics = True
+    loop.coro = timed
+
+
+def instrument_bot(bot) -> None:
+    """Record every prefix and slash command, and expose the bot's send queue."""
+    started: Dict[int, float] = {}  # id(ctx) -> perf_counter at invocation
+
+    def finish(ctx, status):
+        name = ctx.command.qualified_name if ctx.command else "unknown"
+        began = started.pop(id(ctx), None)
+        if began is not None:
+            COMMAND_LATENCY.observe(time.perf_counter() - began, command=name, kind="prefix")
+        COMMANDS.inc(command=name, kind="prefix", status=status)
+
+    async def on_command(ctx):
+        started[id(ctx)] = time.perf_counter()
+
+    async def on_command_completion(ctx):
+        finish(ctx, "ok")
+
+    async def on_command_error(ctx, error):
+        if ctx.command is not None:
+            finish(ctx, "error")
+
+    def finish_slash(interaction, command, status):
+        # Slash commands have no start hook; the interaction's creation time stands in.
+        elapsed = (datetime.now(timezone.utc) - interaction.created_at).total_seconds()
+        COMMAND_LATENCY.observe(max(elapsed, 0.0), command=command.qualified_name, kind="slash")
+        COMMANDS.inc(command=command.qualified_name, kind="slash", status=status)
+
+    async def on_app_command_completion(interaction, command):
+        finish_slash(interaction, command, "ok")
+
+    for listener in (on_command, on_command_completion, on_command_error, on_app_command_completion):
+        bot.add_listener(listener)
+
+    # A failing slash command never dispatches an event; the tree hands it to on_error instead.
+    tree_on_error = bot.tree.on_error
+
+    async def on_app_command_error(interaction, error):
+        if interaction.command is not None:
+            finish_slash(interaction, interaction.command, "error")
+        await tree_on_error(interaction, error)
+
+    bot.tree.on_error = on_app_command_error
+
+    queue = bot.send_queue
+    REGISTRY.gauge("herald_send_queue_depth", "Sends waiting in the outbound queue.",
+                   callback=lambda: queue.depth)
+    REGISTRY.gauge("herald_send_queue_max_depth", "Highest outbound queue depth seen.",
+                   callback=lambda: queue.max_depth)
+    REGISTRY.gauge("herald_send_queue_messages", "Outbound sends by priority and outcome since startup.",
+                   ("priority", "result"),
+                   callback=lambda: {(priority, result): count
+                                     for priority, counts in queue.counts.items()
+                                     for result, count in counts.items()})
+
+
+def start_metrics_server(host: str, port: int, routes: Optional[Dict[str, Callable]] = None):
+    """Serve `/metrics` (plus any extra `routes`) from a daemon thread; returns the server.
+
+    Handlers run on the server's threads and only read from the registry.
+    """
+    routes = {"/metrics": lambda: (200, CONTENT_TYPE, REGISTRY.render()), **(routes or {})}
+    return serve_routes(host, port, routes, name="metrics-server")
+
+
+def serve_routes(host: str, port: int, routes: Dict[str, Callable], name: str = "http-server"):
+    """Serve GET `routes` from daemon threads, never the event loop; returns the server.
+
+    Each route is a callable returning (status, content type, body).
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            route = routes.get(self.path.split("?", 1)[0])
+            if route is None:
+                status, content_type, body = 404, "text/plain; charset=utf-8", "not found\n"
+            else:
+                status, content_type, body = route()
+            payload = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass  # scrapes and probes every few seconds would drown the bot's own output
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name=name, daemon=True).start()
+    return server
@@ -0,0 +1,103 @@
+"""
+Feed parsing pool for the Azeroth Herald bot.
+
+Parsing, cleaning and classifying a feed — walking the RSS items, stripping
+HTML out of the descriptions with regexes and matching keywords — is pure CPU.
+`run_parse()` runs those stages on a small thread pool instead of the event
+loop thread, and hands back only the compact post and article dicts, so the
+element trees of a large feed are never walked on the loop.
+
+The pool has `PARSE_WORKERS` threads (default 2) and accepts at most
+`PARSE_QUEUE_SIZE` jobs at once (default 8), running ones included. Callers
+past that wait for a free slot without blocking the event loop, so a burst of
+feed refreshes queues up in front of the pool rather than inside it.
+
+Threads rather than processes: a job takes a few milliseconds, and pickling
+the item elements over to another process costs more than parsing them.
+
+Jobs started during an `!admin profile` window are profiled too (see
+src/utils/profiler.py).
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from src.utils import profiler
+from src.utils.metrics import REGISTRY
+
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 8
+
+PARSE_JOBS = REGISTRY.counter("herald_parse_jobs_total", "Jobs run on the feed parsing pool, by function.", ("job",))
+PARSE_WAIT = REGISTRY.histogram(
+    "herald_parse_wait_seconds", "Time parse jobs waited for a free slot in the feed parsing pool.")
+
+
+class ParsePool:
+    """A bounded thread pool for the parse and classify stages of the feed scrapers."""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        if workers < 1 or queue_size < workers:
+            raise ValueError("need at least one worker and a queue at least as large as the pool")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.pending = 0  # jobs waiting in the executor or running
+        self.max_pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def run(self, func, *args, **kwargs):
+        """Run `func(*args, **kwargs)` on the pool once a slot is free, and return its result."""
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:  # a semaphore only works on the loop it was first used on
+            self._slots, self._slots_loop = asyncio.Semaphore(self.queue_size), loop
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="parse")
+
+        queued = time.perf_counter()
+        async with self._slots:
+            PARSE_WAIT.observe(time.perf_counter() - queued)
+            PARSE_JOBS.inc(job=getattr(func, "__name__", "unknown"))
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+            try:
+                if profiler.profiling() and not profiler.PER_THREAD_PROFILERS:
+                    return func(*args, **kwargs)  # where the event loop's profiler can see it
+                # Run in a copy of the caller's context, as asyncio.to_thread does, so trace spans nest.
+                call = functools.partial(contextvars.copy_context().run, profiler.run_profiled, func, *args, **kwargs)
+                return await loop.run_in_executor(self._executor, call)
+            finally:
+                self.pending -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once their current jobs finish; the pool starts new ones if used again."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_pool: Optional[ParsePool] = None
+
+
+def get_parse_pool() -> ParsePool:
+    """Return the process-wide pool, sized from `PARSE_WORKERS` and `PARSE_QUEUE_SIZE`."""
+    global _pool
+    if _pool is None:
+        _pool = ParsePool(int(os.getenv("PARSE_WORKERS", DEFAULT_WORKERS)),
+                          int(os.getenv("PARSE_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)))
+    return _pool
+
+
+async def run_parse(func, *args, **kwargs):
+    """Run `func(*args, **kwargs)` on the process-wide parse pool."""
+    return await get_parse_pool().run(func, *args, **kwargs)
+
+
+REGISTRY.gauge("herald_parse_queue_depth", "Jobs waiting in or running on the feed parsing pool.",
+               callback=lambda: _pool.pending if _pool is not None else 0)
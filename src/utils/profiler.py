@@ -0,0 +1,131 @@
+"""
+On-demand profiling for the Azeroth Herald bot.
+
+Runs cProfile over the live event loop thread for a fixed window, which covers
+the scheduler loops and every command handler. Feed parsing and classification
+run on the parse pool (src/utils/parse_pool.py), which joins the profile too:
+each job started during the window runs under its own profiler and the results
+are merged into the dump. From Python 3.12 cProfile allows only one profiler
+per process, so there the pool runs its jobs on the event loop thread for the
+length of the window instead. Other work handed to `asyncio.to_thread`, such as
+the feed and Raider.IO requests, is not included.
+
+The raw profile is saved under PROFILE_DIR for snakeviz / pstats, and a top-N
+text summary (by own time and by cumulative time) is returned for posting as
+an attachment. Started by the owner-only `!admin profile <seconds>` command, or
+at startup with PROFILE_SECONDS (after PROFILE_DELAY seconds).
+"""
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_SECONDS = 600
+DEFAULT_TOP = 25
+DEFAULT_DIR = "profiles"
+
+# cProfile only sees the thread that enabled it, and from Python 3.12 only one
+# profiler can be enabled per process.
+PER_THREAD_PROFILERS = sys.version_info < (3, 12)
+
+_active = False
+_worker_profiles: Optional[List[cProfile.Profile]] = None  # parse pool jobs profiled in the current window
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def profiling() -> bool:
+    """True while a profile window is running."""
+    return _active
+
+
+def run_profiled(func, *args, **kwargs):
+    """Run `func` on a worker thread, under its own profiler if a profile window is running."""
+    collected = _worker_profiles
+    if collected is None:
+        return func(*args, **kwargs)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        collected.append(profiler)
+
+
+def summarize(stats: pstats.Stats, top: int = DEFAULT_TOP) -> str:
+    """Top-N functions by own time and by cumulative time, as plain text."""
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.strip_dirs()
+    stream.write(f"=== Top {top} by own time ===\n")
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    stream.write(f"\n=== Top {top} by cumulative time ===\n")
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue()
+
+
+async def profile_for(seconds: float, top: int = DEFAULT_TOP,
+                      directory: Optional[str] = None) -> Tuple[str, str]:
+    """Profile the event loop thread and the parse pool for `seconds`; returns (summary text, raw profile path)."""
+    global _active, _worker_profiles
+    if _active:
+        raise ProfilerBusy("A profile is already running")
+    seconds = max(0.0, min(float(seconds), MAX_SECONDS))
+    directory = directory or os.getenv("PROFILE_DIR", DEFAULT_DIR)
+
+    _active = True
+    workers: List[cProfile.Profile] = []
+    if PER_THREAD_PROFILERS:
+        _worker_profiles = workers
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    try:
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+    finally:
+        _active = False
+        _worker_profiles = None
+    elapsed = time.perf_counter() - started
+
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = os.path.join(directory, f"profile-{stamp}.prof")
+    stats = pstats.Stats(profiler)
+    for worker in list(workers):
+        stats.add(worker)
+    stats.dump_stats(path)
+
+    pool = f" and {len(workers)} parse pool jobs" if workers else ""
+    header = (f"Profiled the event loop{pool} for {elapsed:.1f}s: {stats.total_calls} calls, "
+              f"{stats.total_tt:.3f}s of CPU in profiled code\nRaw profile: {path}\n\n")
+    return header + summarize(stats, top), path
+
+
+def start_profile_from_env() -> Optional[asyncio.Task]:
+    """Profile a window of the live bot if PROFILE_SECONDS is set; the summary goes to the log."""
+    seconds = os.getenv("PROFILE_SECONDS")
+    if not seconds:
+        return None
+
+    async def run():
+        await asyncio.sleep(float(os.getenv("PROFILE_DELAY", "0")))
+        logger.info("Profiling the event loop for %ss", seconds)
+        summary, path = await profile_for(float(seconds), int(os.getenv("PROFILE_TOP", DEFAULT_TOP)))
+        logger.info("Profile saved to %s\n%s", path, summary)
+
+    return asyncio.create_task(run())
@@ -0,0 +1,253 @@
+"""
+Reply builders for the Azeroth Herald bot.
+
+Each function returns the final reply to a command as a dict with `content` and
+`embeds`, independent of how it is delivered. The prefix cogs and the slash
+commands both build their answers here, so the two front ends stay in step.
+Blocking feed work runs in a worker thread.
+"""
+
+import asyncio
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import discord
+
+from src.utils.api import fetch_affixes, fetch_season_cutoffs
+from src.utils.embeds import (
+    create_affixes_embed,
+    create_blue_tracker_embed,
+    create_news_embed,
+    create_season_cutoffs_embed,
+    create_time_embed,
+)
+from src.utils.parse_pool import run_parse
+
+VALID_REGIONS = ['us', 'eu', 'kr', 'tw', 'cn']
+BLUETRACK_ACTIONS = ['check', 'latest', 'test', 'reset']
+NEWS_ACTIONS = ['check', 'latest', 'reset', 'test', 'clear']
+
+
+def make_reply(content: Optional[str] = None, embeds: Optional[List[discord.Embed]] = None) -> Dict:
+    return {'content': content, 'embeds': list(embeds or [])}
+
+
+def invalid_region_reply(region: str) -> Dict:
+    embed = discord.Embed(
+        title="❌ Invalid Region",
+        description=f"Invalid region `{region}`. Valid regions are: {', '.join(VALID_REGIONS)}",
+        color=discord.Color.red()
+    )
+    return make_reply(embeds=[embed])
+
+
+def _fetch_failed_reply(title: str, error: str) -> Dict:
+    embed = discord.Embed(
+        title=title,
+        description=f"Error: {error}",
+        color=discord.Color.red()
+    )
+    embed.add_field(
+        name="What to do",
+        value="Please try again later or check if the Raider.IO API is available.",
+        inline=False
+    )
+    return make_reply(embeds=[embed])
+
+
+def unexpected_error_reply(what: str, error: Exception) -> Dict:
+    embed = discord.Embed(
+        title="❗ Unexpected Error",
+        description=f"An unexpected error occurred while fetching {what}.",
+        color=discord.Color.red()
+    )
+    embed.add_field(
+        name="Error Details",
+        value=str(error)[:1000],  # Limit error message length
+        inline=False
+    )
+    return make_reply(embeds=[embed])
+
+
+async def affixes_reply(region: str = 'us') -> Dict:
+    """Current Mythic+ affixes; served from the Raider.IO cache when fresh."""
+    affixes_data, error = await fetch_affixes(region)
+    if error:
+        return _fetch_failed_reply("❌ Failed to Fetch Affixes", error)
+    return make_reply(embeds=[create_affixes_embed(affixes_data, region)])
+
+
+async def cutoffs_reply(region: str = 'us') -> Dict:
+    """Current season cutoffs; served from the Raider.IO cache when fresh."""
+    cutoffs_data, error = await fetch_season_cutoffs(region)
+    if error:
+        return _fetch_failed_reply("❌ Failed to Fetch Cutoffs", error)
+    return make_reply(embeds=[create_season_cutoffs_embed(cutoffs_data, region)])
+
+
+async def checklist_reply(digest) -> Dict:
+    """Weekly checklist from the shared reset digest."""
+    await digest.refresh()
+    content = None
+    if digest.reset_posts:
+        content = f"📋 **Weekly Checklist** (with {len(digest.reset_posts)} recent updates)"
+    return make_reply(content, [digest.checklist_embed()])
+
+
+async def warning_reply(digest) -> Dict:
+    """Monday reset warning from the shared reset digest."""
+    await digest.refresh()
+    content = None
+    if digest.reset_posts:
+        content = f"⚠️ **Reset Warning** (with {len(digest.reset_posts)} recent updates)"
+    return make_reply(content, [digest.warning_embed()])
+
+
+def time_reply(now: Optional[datetime] = None) -> Dict:
+    return make_reply(embeds=[create_time_embed(now or datetime.now(timezone.utc))])
+
+
+def _remove_cache_file(cache_file: str, removed: str, missing: str) -> Dict:
+    try:
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+            return make_reply(removed)
+        return make_reply(missing)
+    except OSError as e:
+        return make_reply(f"❌ Error resetting cache: {e}")
+
+
+async def bluetrack_reply(action: str, blue_tracker) -> Dict:
+    """Final reply for `bluetrack <action>`; one of BLUETRACK_ACTIONS, anything else means check."""
+    action = action.lower()
+
+    if action == "reset":
+        return _remove_cache_file(
+            blue_tracker.cache_file,
+            "🗑️ Blue Tracker cache has been reset. Next check will be treated as first run.",
+            "ℹ️ No cache file found - already in first run state.",
+        )
+
+    if action in ("test", "latest"):
+        items = await asyncio.to_thread(blue_tracker.fetch_blue_tracker_page)
+        if not items:
+            return make_reply("❌ Failed to fetch Blue Tracker page.")
+
+        posts = await run_parse(blue_tracker.parse_posts, items)
+        relevant_posts = [post for post in posts if blue_tracker.is_relevant_post(post)]
+
+        if action == "test":
+            embed = discord.Embed(
+                title="🧪 Blue Tracker Test Results",
+                color=0x00b4d8
+            )
+            embed.add_field(
+                name="📊 Parsing Results",
+                value=f"Total posts found: {len(posts)}\nRelevant posts: {len(relevant_posts)}",
+                inline=False
+            )
+            if relevant_posts:
+                latest_post = relevant_posts[0]
+                embed.add_field(
+                    name="📝 Latest Relevant Post",
+                    value=f"**Title:** {latest_post['title'][:100]}...\n**Author:** {latest_post.get('author', 'Unknown')}",
+                    inline=False
+                )
+            embed.set_footer(text="Test completed | Azeroth Herald")
+            return make_reply(embeds=[embed])
+
+        relevant_posts = relevant_posts[:5]  # Limit to 5
+        if not relevant_posts:
+            return make_reply("📭 No relevant posts found.")
+        return make_reply(
+            f"📢 Found {len(relevant_posts)} relevant post(s):",
+            [create_blue_tracker_embed(post) for post in relevant_posts],
+        )
+
+    cache = blue_tracker.load_cache()
+    is_first_run = len(cache.get('seen_posts', [])) == 0 and cache.get('last_check') is None
+    new_posts = await blue_tracker.check_new_posts()
+
+    if not new_posts:
+        if is_first_run:
+            return make_reply("📭 No relevant posts found on the Blue Tracker at this time.")
+        return make_reply("📭 No new posts found since last check.")
+
+    if is_first_run:
+        header = f"📢 Found {len(new_posts)} recent relevant post(s) (showing up to 3 to avoid spam):"
+    else:
+        header = f"📢 Found {len(new_posts)} new post(s):"
+    return make_reply(header, [create_blue_tracker_embed(post) for post in new_posts])
+
+
+async def news_reply(action: str, news_scraper) -> Dict:
+    """Final reply for `news <action>`; one of NEWS_ACTIONS, anything else means check."""
+    action = action.lower()
+
+    if action == "clear":
+        return _remove_cache_file(
+            news_scraper.cache_file,
+            "🗑️ Wowhead news cache has been cleared. Next check will be treated as first run.",
+            "ℹ️ No cache file found - already in first run state.",
+        )
+
+    if action == "reset":
+        articles = await news_scraper.find_reset_relevant_articles()
+        if not articles:
+            return make_reply("📭 No reset-relevant articles found.")
+        return make_reply(
+            f"📢 Found {len(articles)} reset-relevant article(s):",
+            [create_news_embed(article, is_reset_relevant=True) for article in articles],
+        )
+
+    if action in ("test", "latest"):
+        items = await asyncio.to_thread(news_scraper.fetch_news_page)
+        if not items:
+            return make_reply("❌ Failed to fetch Wowhead news page.")
+
+        articles = await run_parse(news_scraper.parse_articles, items)
+
+        if action == "test":
+            reset_relevant = [article for article in articles if news_scraper.is_reset_relevant(article)]
+            embed = discord.Embed(
+                title="🧪 Wowhead News Test Results",
+                color=0xf4a261
+            )
+            embed.add_field(
+                name="📊 Parsing Results",
+                value=f"Total relevant articles: {len(articles)}\nReset-relevant articles: {len(reset_relevant)}",
+                inline=False
+            )
+            if articles:
+                latest_article = articles[0]
+                embed.add_field(
+                    name="📰 Latest Article",
+                    value=f"**Title:** {latest_article['title'][:100]}...\n**Author:** {latest_article.get('author', 'Unknown')}",
+                    inline=False
+                )
+            embed.set_footer(text="Test completed | Azeroth Herald")
+            return make_reply(embeds=[embed])
+
+        articles = articles[:5]  # Limit to 5
+        if not articles:
+            return make_reply("📭 No relevant articles found.")
+        return make_reply(
+            f"📢 Found {len(articles)} relevant article(s):",
+            [create_news_embed(article) for article in articles],
+        )
+
+    cache = news_scraper.load_cache()
+    is_first_run = len(cache.get('seen_articles', [])) == 0 and cache.get('last_check') is None
+    new_articles = await news_scraper.check_new_articles()
+
+    if not new_articles:
+        if is_first_run:
+            return make_reply("📭 No relevant articles found on Wowhead at this time.")
+        return make_reply("📭 No new articles found since last check.")
+
+    if is_first_run:
+        header = f"📢 Found {len(new_articles)} recent relevant article(s) (showing up to 3 to avoid spam):"
+    else:
+        header = f"📢 Found {len(new_articles)} new article(s):"
+    return make_reply(header, [create_news_embed(article) for article in new_articles])
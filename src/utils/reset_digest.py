@@ -0,0 +1,133 @@
+"""
+Reset digest for the Azeroth Herald bot.
+
+Keeps one shared snapshot of the reset-relevant blue posts and renders the
+checklist and Monday warning embeds once per change, so `!checklist`,
+`!warning` and the scheduled announcements are served from memory.
+
+Rendered embeds are keyed by a hash of the blue post summary. They are
+invalidated when the feed snapshot produces a different summary, or when the
+reset week rolls over.
+"""
+
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.utils import embeds
+from src.utils.blue_tracker import BlueTrackerScraper
+from src.utils.clock import utc_now
+from src.utils.metrics import record_cache
+from src.utils.parse_pool import run_parse
+
+# How old the blue tracker snapshot may get before a command triggers a re-fetch.
+# The blue tracker monitor refreshes the shared snapshot every 30 minutes, so
+# commands normally never hit the network themselves.
+SNAPSHOT_TTL = timedelta(minutes=35)
+
+# US weekly reset: Tuesday 15:00 UTC. Used to decide when the week rolls over.
+RESET_WEEKDAY = 1
+RESET_HOUR = 15
+
+
+def summary_signature(*summaries) -> str:
+    """Stable hash of feed summaries, used to tell whether rendered output is stale."""
+    payload = json.dumps(summaries, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def reset_week(now: datetime) -> Tuple[int, int]:
+    """ISO (year, week) of the reset week containing `now`; changes at each weekly reset."""
+    shifted = now - timedelta(days=RESET_WEEKDAY, hours=RESET_HOUR)
+    year, week, _ = shifted.isocalendar()
+    return year, week
+
+
+class ResetDigest:
+    def __init__(self, blue_tracker: Optional[BlueTrackerScraper] = None) -> None:
+        self.blue_tracker = blue_tracker or BlueTrackerScraper(region_filter="us")  # Only US posts
+        self.reset_posts: List[Dict] = []
+        self.summary: Dict = {}
+        self.version: Optional[str] = None
+        self.built_from: Optional[datetime] = None  # snapshot_at of the items the summary came from
+        self.week: Optional[Tuple[int, int]] = None
+        self._rendered: Dict[Tuple[str, str], object] = {}
+        self._lock = asyncio.Lock()
+
+    def snapshot_stale(self, now: Optional[datetime] = None, max_age: timedelta = SNAPSHOT_TTL) -> bool:
+        """Whether the blue tracker snapshot is missing, older than `max_age`, or from before this reset week."""
+        now = now or utc_now()
+        snapshot_at = self.blue_tracker.snapshot_at
+        return snapshot_at is None or now - snapshot_at > max_age or reset_week(snapshot_at) != reset_week(now)
+
+    async def refresh(self, max_age: timedelta = SNAPSHOT_TTL) -> None:
+        """Bring the digest up to date with the blue tracker snapshot.
+
+        Re-fetches the feed (in a worker thread) only if the shared snapshot is
+        missing, older than `max_age`, or from before the current reset week.
+        The posts are classified on the parse pool.
+        If another caller already refreshed the snapshot, the summary is rebuilt
+        from it without touching the network.
+        """
+        async with self._lock:
+            now = utc_now()
+            week = reset_week(now)
+            if week != self.week:
+                self.week = week
+                self._rendered.clear()
+
+            stale = self.snapshot_stale(now, max_age)
+            record_cache("blue_snapshot", not stale)
+            if stale:
+                await asyncio.to_thread(self.blue_tracker.fetch_blue_tracker_page)
+            snapshot_at = self.blue_tracker.snapshot_at
+
+            if snapshot_at is not None and snapshot_at != self.built_from:
+                posts = await run_parse(self.blue_tracker.get_reset_relevant_posts,
+                                        days_back=7, items=self.blue_tracker.snapshot)
+                self._update(posts, snapshot_at)
+
+    def _update(self, reset_posts: List[Dict], snapshot_at: datetime) -> None:
+        summary = self.blue_tracker.summarize_reset_info(reset_posts)
+        version = summary_signature(summary)
+        self.reset_posts = reset_posts
+        self.built_from = snapshot_at
+        if version != self.version:
+            self.summary = summary
+            self.version = version
+            self._rendered.clear()
+
+    def _render(self, kind: str, builder: str):
+        key = (kind, self.version)
+        embed = self._rendered.get(key)
+        record_cache("reset_embeds", embed is not None)
+        if embed is None:
+            # Looked up at call time so a hot-reloaded embeds module takes effect.
+            embed = getattr(embeds, builder)(self.summary if self.reset_posts else None)
+            self._rendered[key] = embed
+        return embed
+
+    def clear_rendered(self) -> None:
+        """Drop the rendered embeds, e.g. after the embed builders were reloaded."""
+        self._rendered.clear()
+
+    def checklist_embed(self):
+        """The weekly checklist embed for the current summary, rendered at most once per change."""
+        return self._render("checklist", "create_checklist_embed")
+
+    def warning_embed(self):
+        """The Monday warning embed for the current summary, rendered at most once per change."""
+        return self._render("warning", "create_monday_warning_embed")
+
+
+_digest: Optional[ResetDigest] = None
+
+
+def get_reset_digest() -> ResetDigest:
+    """Return the process-wide digest shared by the commands and the scheduler."""
+    global _digest
+    if _digest is None:
+        _digest = ResetDigest()
+    return _digest
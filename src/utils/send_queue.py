@@ -0,0 +1,233 @@
+"""
+Outbound send queue for the Azeroth Herald bot.
+
+Background sends go through one priority queue served by a few worker tasks,
+so a burst of feed updates can't crowd out the weekly announcements:
+
+- scheduled announcements are sent first,
+- feed updates next.
+
+Background sends are bounded: once `maxsize` of them are waiting, further
+producers block until there is room. Feed items submitted with a `key` that is
+already waiting are coalesced into the pending send instead of being queued
+twice.
+
+Interactive command replies skip the workers entirely. They are sent straight
+away, serialized only per channel so the replies to one command still arrive in
+order, and are never held back by background sends or by the bound.
+"""
+
+import asyncio
+import functools
+import itertools
+import logging
+import time
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, Dict, Optional
+
+from discord.ext import commands
+
+from src.utils.metrics import REGISTRY
+from src.utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_SCHEDULED = 1
+PRIORITY_FEED = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_SCHEDULED: "scheduled",
+    PRIORITY_FEED: "feed",
+}
+
+SEND_WAIT = REGISTRY.histogram(
+    "herald_send_queue_wait_seconds", "Time sends waited in the outbound queue before going out, by priority.",
+    ("priority",))
+
+
+def _percentile(samples, fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class SendQueue:
+    def __init__(self, maxsize: int = 50, workers: int = 3) -> None:
+        self.maxsize = maxsize
+        self.worker_count = workers
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._capacity: Optional[asyncio.Semaphore] = None
+        self._workers = []
+        self._sequence = itertools.count()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._channel_locks: Dict[object, asyncio.Lock] = {}
+        self._channel_users: Dict[object, int] = defaultdict(int)
+        self._blocked = 0  # producers waiting for room in the bounded queue
+
+        # Metrics
+        self.max_depth = 0
+        self.counts = {name: {"enqueued": 0, "sent": 0, "failed": 0, "coalesced": 0}
+                       for name in PRIORITY_NAMES.values()}
+        self.wait_times = {name: deque(maxlen=1000) for name in PRIORITY_NAMES.values()}
+
+    def start(self) -> None:
+        """Start the worker tasks. Must be called from inside the running event loop."""
+        if self._workers:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._capacity = asyncio.Semaphore(self.maxsize)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+
+    async def stop(self) -> None:
+        """Cancel the workers and fail every send still waiting in the queue."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        stopped = RuntimeError("send queue stopped before the message was sent")
+        while self._queue is not None and not self._queue.empty():
+            future = self._queue.get_nowait()[4]
+            if not future.done():
+                future.set_exception(stopped)
+        self._pending.clear()
+        # Wake producers waiting for room; they see the queue is stopped and fail too.
+        for _ in range(self._blocked):
+            self._capacity.release()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    async def submit(self, send: Callable[[], Awaitable], priority: int = PRIORITY_FEED,
+                     key: Optional[str] = None, channel=None):
+        """Queue a send and wait for it to complete, returning its result.
+
+        `send` is a zero-argument callable returning the coroutine to run.
+        Interactive sends run right away, one at a time per `channel`. All
+        sends run immediately when the queue has not been started.
+        """
+        name = PRIORITY_NAMES[priority]
+        if not self._workers:
+            return await send()
+        if priority == PRIORITY_INTERACTIVE:
+            return await self._send_now(send, channel)
+
+        if key is not None and key in self._pending:
+            self.counts[name]["coalesced"] += 1
+            return await asyncio.shield(self._pending[key])
+
+        self._blocked += 1
+        try:
+            await self._capacity.acquire()
+        finally:
+            self._blocked -= 1
+        if not self._workers:
+            raise RuntimeError("send queue stopped before the message was sent")
+
+        future = asyncio.get_running_loop().create_future()
+        if key is not None:
+            self._pending[key] = future
+        await self._queue.put((priority, next(self._sequence), time.perf_counter(), send, future, key))
+        self.counts[name]["enqueued"] += 1
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return await asyncio.shield(future)
+
+    async def _send_now(self, send: Callable[[], Awaitable], channel):
+        counts = self.counts[PRIORITY_NAMES[PRIORITY_INTERACTIVE]]
+        counts["enqueued"] += 1
+        lock = self._channel_locks.get(channel)
+        if lock is None:
+            lock = self._channel_locks[channel] = asyncio.Lock()
+        self._channel_users[channel] += 1
+        queued = time.perf_counter()
+        try:
+            async with lock:
+                self._record_wait("interactive", time.perf_counter() - queued)
+                try:
+                    result = await send()
+                except Exception:
+                    counts["failed"] += 1
+                    raise
+                counts["sent"] += 1
+                return result
+        finally:
+            self._channel_users[channel] -= 1
+            if not self._channel_users[channel]:
+                del self._channel_users[channel]
+                del self._channel_locks[channel]
+
+    def _record_wait(self, name: str, wait: float) -> None:
+        self.wait_times[name].append(wait)
+        SEND_WAIT.observe(wait, priority=name)
+
+    async def _worker(self) -> None:
+        while True:
+            priority, _, enqueued_at, send, future, key = await self._queue.get()
+            name = PRIORITY_NAMES[priority]
+            self._record_wait(name, time.perf_counter() - enqueued_at)
+            try:
+                result = await send()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:  # noqa: BLE001 - surface to the submitter, keep worker alive
+                self.counts[name]["failed"] += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self.counts[name]["sent"] += 1
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                if key is not None and self._pending.get(key) is future:
+                    del self._pending[key]
+                self._capacity.release()
+                self._queue.task_done()
+
+    def stats(self) -> Dict:
+        """Snapshot of queue depth, per-priority counts and wait times (seconds)."""
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "priorities": {
+                name: {
+                    **self.counts[name],
+                    "wait_p50": _percentile(self.wait_times[name], 0.50),
+                    "wait_p99": _percentile(self.wait_times[name], 0.99),
+                }
+                for name in PRIORITY_NAMES.values()
+            },
+        }
+
+
+class QueuedContext(commands.Context):
+    """Command context whose replies go through the bot's send queue at interactive priority, in channel order."""
+
+    @traced("send", "reply")
+    async def send(self, *args, **kwargs):
+        send_queue = getattr(self.bot, "send_queue", None)
+        send = functools.partial(commands.Context.send, self, *args, **kwargs)
+        if send_queue is None:
+            return await send()
+        return await send_queue.submit(send, PRIORITY_INTERACTIVE, channel=self.channel.id)
+
+
+class QueuedDelivery:
+    """Wraps a delivery backend so its sends go through the send queue."""
+
+    def __init__(self, backend, send_queue: SendQueue) -> None:
+        self.backend = backend
+        self.send_queue = send_queue
+
+    @traced("send", "announcement")
+    async def send(self, channel_id: int, content=None, embeds=None, identity: str = "herald",
+                   priority: int = PRIORITY_SCHEDULED, key: Optional[str] = None) -> bool:
+        send = functools.partial(self.backend.send, channel_id, content, embeds, identity)
+        return await self.send_queue.submit(send, priority, key=key)
+
+    async def close(self) -> None:
+        await self.backend.close()
@@ -0,0 +1,64 @@
+"""
+Startup timing for the Azeroth Herald bot.
+
+Records how long each startup phase takes (imports, extension loads, login,
+waiting for `on_ready`, the `on_ready` handler, and the first scheduler tick),
+plus the load time of every extension. bot.py prints the report once the first
+tick is done, and `python bot.py --profile-startup` writes it as JSON and exits
+so regressions can be tracked between runs.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class StartupTimer:
+    def __init__(self, started_at: Optional[float] = None) -> None:
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.phases: Dict[str, float] = {}  # phase -> seconds, in the order they finished
+        self.extensions: Dict[str, float] = {}  # extension -> seconds
+        self.errors: Dict[str, str] = {}  # extension -> error
+        self._mark = self.started_at
+
+    def mark(self, phase: str) -> float:
+        """Close a phase that ran from the previous mark until now; returns its duration."""
+        now = time.perf_counter()
+        self.phases[phase] = now - self._mark
+        self._mark = now
+        return self.phases[phase]
+
+    @contextmanager
+    def extension(self, name: str):
+        """Time one extension load. Extensions load concurrently, so these overlap."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.extensions[name] = time.perf_counter() - started
+
+    @property
+    def total(self) -> float:
+        return self._mark - self.started_at
+
+    def report(self) -> Dict:
+        return {
+            "total_ms": round(self.total * 1000, 1),
+            "phases_ms": {phase: round(seconds * 1000, 1) for phase, seconds in self.phases.items()},
+            "extensions_ms": {name: round(seconds * 1000, 1) for name, seconds in self.extensions.items()},
+            "extension_errors": dict(self.errors),
+        }
+
+    def summary(self) -> str:
+        """One-line report for the console."""
+        phases = " | ".join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds in self.phases.items())
+        return f"[STARTUP] {phases} | total {self.total * 1000:.0f}ms"
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """Write the report as JSON to `path` (or return it only) and return the JSON text."""
+        text = json.dumps(self.report(), indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        return text
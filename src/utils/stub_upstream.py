@@ -0,0 +1,193 @@
+"""
+Local stand-in for Raider.IO and Wowhead, for the Azeroth Herald bot.
+
+Serves the recorded responses in tests/fixtures/ on the same paths as the real
+services, so pointing RAIDERIO_BASE_URL and WOWHEAD_BASE_URL at it runs the bot,
+the benchmarks and the harnesses without the network:
+
+- /api/v1/mythic-plus/affixes and /api/v1/mythic-plus/season-cutoffs (JSON)
+- /blue-tracker?rss and /news/rss/all (RSS)
+
+Every body carries an ETag, and a request whose If-None-Match matches gets a
+304. Faults are drawn per request from a seeded random generator, so the same
+seed and request order always see the same faults:
+
+- `latency` (plus up to +/- `jitter`) seconds before the response starts
+- `error_rate` of requests answered with a 500
+- `rate_limit_rate` of requests answered with a 429 and `Retry-After`
+- `not_modified_rate` of requests answered with a bodiless 304, even when
+  the request was not conditional
+- `drip_bytes` > 0 writes the body in chunks of that size, `drip_interval`
+  seconds apart
+
+`/__stats` returns the request count by path and status as JSON. Started by
+`scripts/stub_server.py`, or in-process with `StubUpstream(...).start()`.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                        "tests", "fixtures")
+
+JSON_TYPE = "application/json; charset=utf-8"
+RSS_TYPE = "application/rss+xml; charset=utf-8"
+
+AFFIXES_PATH = "/api/v1/mythic-plus/affixes"
+CUTOFFS_PATH = "/api/v1/mythic-plus/season-cutoffs"
+BLUE_TRACKER_PATH = "/blue-tracker"
+NEWS_PATH = "/news/rss/all"
+
+
+class StubConfig:
+    """Fault-injection knobs; all off by default."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, retry_after: int = 1, not_modified_rate: float = 0.0,
+                 drip_bytes: int = 0, drip_interval: float = 0.0) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.not_modified_rate = not_modified_rate
+        self.drip_bytes = drip_bytes
+        self.drip_interval = drip_interval
+
+
+def _read_fixture(directory: str, name: str) -> bytes:
+    with open(os.path.join(directory, name), "rb") as f:
+        data = f.read()
+    return gzip.decompress(data) if name.endswith(".gz") else data
+
+
+class StubUpstream:
+    """A threaded HTTP server answering Raider.IO and Wowhead requests from recorded fixtures."""
+
+    def __init__(self, config: Optional[StubConfig] = None, seed: Optional[int] = None,
+                 fixtures: str = FIXTURES, feed_size: Optional[int] = None) -> None:
+        self.config = config or StubConfig()
+        self.random = random.Random(seed)
+        self.stats: Counter = Counter()  # (path, status) -> requests
+        self.server: Optional[ThreadingHTTPServer] = None
+        self._lock = threading.Lock()
+
+        feed = (lambda name: f"{name}_{feed_size}.xml.gz") if feed_size else (lambda name: f"{name}.xml")
+        self.bodies: Dict[str, Tuple[str, bytes]] = {}
+        self.set_body(AFFIXES_PATH, _read_fixture(fixtures, "affixes.json"), JSON_TYPE)
+        self.set_body(CUTOFFS_PATH, _read_fixture(fixtures, "cutoffs.json"), JSON_TYPE)
+        self.set_body(BLUE_TRACKER_PATH, _read_fixture(fixtures, feed("blue_tracker")), RSS_TYPE)
+        self.set_body(NEWS_PATH, _read_fixture(fixtures, feed("wowhead_news")), RSS_TYPE)
+
+    def set_body(self, path: str, body: bytes, content_type: str = RSS_TYPE) -> None:
+        """Serve `body` at `path` from now on, e.g. to publish a new version of a feed."""
+        self.bodies[path] = (content_type, body)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> "StubUpstream":
+        """Serve from a daemon thread; port 0 picks a free one (see `url`)."""
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="stub-upstream", daemon=True).start()
+        return self
+
+    def close(self) -> None:
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def _draw(self) -> Tuple[float, Optional[int]]:
+        """Delay and forced status for the next request, drawn in request order."""
+        config = self.config
+        with self._lock:
+            delay = max(0.0, config.latency + self.random.uniform(-config.jitter, config.jitter))
+            roll = self.random.random()
+        for rate, status in ((config.error_rate, 500), (config.rate_limit_rate, 429),
+                             (config.not_modified_rate, 304)):
+            if roll < rate:
+                return delay, status
+            roll -= rate
+        return delay, None
+
+    def _respond(self, path: str, query: Dict, if_none_match: Optional[str]):
+        """(status, headers, body) for a request, before faults."""
+        if path == "/__stats":
+            stats = {f"{p} {s}": n for (p, s), n in sorted(self.stats.items())}
+            return 200, {"Content-Type": JSON_TYPE}, json.dumps(stats).encode("utf-8")
+        if path not in self.bodies:
+            return 404, {"Content-Type": "text/plain; charset=utf-8"}, b"not found\n"
+
+        content_type, body = self.bodies[path]
+        if path == AFFIXES_PATH and "region" in query:
+            body = json.dumps(dict(json.loads(body), region=query["region"][0])).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if if_none_match == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"Content-Type": content_type, "ETag": etag}, body
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                delay, forced = stub._draw() if parts.path != "/__stats" else (0.0, None)
+                if delay:
+                    time.sleep(delay)
+
+                if forced == 500:
+                    status, headers, body = 500, {"Content-Type": "text/plain; charset=utf-8"}, b"injected error\n"
+                elif forced == 429:
+                    status, headers, body = 429, {"Retry-After": str(stub.config.retry_after)}, b""
+                elif forced == 304:
+                    status, headers, body = 304, {}, b""
+                else:
+                    status, headers, body = stub._respond(parts.path, parse_qs(parts.query),
+                                                          self.headers.get("If-None-Match"))
+                with stub._lock:
+                    stub.stats[(parts.path, status)] += 1
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self._write(body)
+
+            def _write(self, body: bytes) -> None:
+                chunk = stub.config.drip_bytes
+                if chunk <= 0:
+                    self.wfile.write(body)
+                    return
+                try:
+                    for start in range(0, len(body), chunk):
+                        self.wfile.write(body[start:start + chunk])
+                        self.wfile.flush()
+                        time.sleep(stub.config.drip_interval)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True  # the client gave up (e.g. its read timeout fired)
+
+            def log_message(self, format, *args):
+                logger.debug("%s %s", self.address_string(), format % args)
+
+        return Handler
@@ -0,0 +1,196 @@
+"""
+Background loop supervisor for the Azeroth Herald bot.
+
+Every `tasks.Loop` the bot runs is registered with one `LoopSupervisor`, which
+starts it and watches its task. An iteration that raises is logged and counted
+and the loop carries on with its next iteration. A loop whose task ends for
+any reason — an exception in `before_loop`, an exception `tasks.Loop` does not
+retry, or the task being cancelled from outside — is started again after an
+exponential backoff, which resets once an iteration succeeds.
+
+For each loop the supervisor keeps the last success, consecutive and total
+failures, restarts, and the duration and schedule drift of the last iteration.
+`health()` returns them as a dict, and `http_response()` serves them as JSON
+(`/loops` on the metrics server), with a 503 while any loop is down or failing.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from src.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Restart delay after a loop dies: doubles with each death in a row, up to the maximum.
+BASE_DELAY = 5.0
+MAX_DELAY = 300.0
+
+# A loop with this many failed iterations in a row counts as unhealthy.
+FAILURE_THRESHOLD = 3
+
+LOOP_RESTARTS = REGISTRY.counter(
+    "herald_loop_restarts_total", "Background loops restarted by the supervisor, by reason.", ("loop", "reason"))
+
+
+def _iso(moment: Optional[datetime]) -> Optional[str]:
+    return moment.isoformat() if moment else None
+
+
+class LoopHealth:
+    """What the supervisor knows about one loop."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.state = "stopped"  # running, restarting or stopped
+        self.ticks = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.consecutive_deaths = 0  # task endings since the last good iteration; drives the backoff
+        self.restarts = 0
+        self.last_success: Optional[datetime] = None
+        self.last_failure: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.last_duration: Optional[float] = None
+        self.last_drift: Optional[float] = None
+        self.max_drift = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return self.state == "running" and self.consecutive_failures < FAILURE_THRESHOLD
+
+    def as_dict(self) -> Dict:
+        return {
+            "state": self.state,
+            "healthy": self.healthy,
+            "ticks": self.ticks,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "restarts": self.restarts,
+            "last_success": _iso(self.last_success),
+            "last_failure": _iso(self.last_failure),
+            "last_error": self.last_error,
+            "last_duration_seconds": self.last_duration,
+            "last_drift_seconds": self.last_drift,
+            "max_drift_seconds": self.max_drift,
+        }
+
+
+class LoopSupervisor:
+    def __init__(self, base_delay: float = BASE_DELAY, max_delay: float = MAX_DELAY) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.loops: Dict[str, object] = {}  # name -> tasks.Loop
+        self.stats: Dict[str, LoopHealth] = {}
+        self._restarts: Dict[str, asyncio.Task] = {}
+        self._stopping = False
+
+    def add(self, name: str, loop) -> None:
+        """Supervise `loop` under `name`; its iterations are wrapped to record their outcome."""
+        self.loops[name] = loop
+        self.stats[name] = health = LoopHealth(name)
+        coro = loop.coro
+
+        @functools.wraps(coro)
+        async def supervised(*args, **kwargs):
+            # Loop sets _last_iteration to the time this iteration was scheduled for.
+            scheduled = getattr(loop, "_last_iteration", None)
+            if scheduled is not None:
+                health.last_drift = max((datetime.now(timezone.utc) - scheduled).total_seconds(), 0.0)
+                health.max_drift = max(health.max_drift, health.last_drift)
+            started = time.perf_counter()
+            try:
+                await coro(*args, **kwargs)
+            except Exception as e:  # noqa: BLE001 - one bad iteration must not end the loop
+                health.failures += 1
+                health.consecutive_failures += 1
+                health.last_failure = datetime.now(timezone.utc)
+                health.last_error = f"{type(e).__name__}: {e}"
+                logger.exception("Error in %s (%d in a row)", name, health.consecutive_failures)
+            else:
+                health.consecutive_failures = 0
+                health.consecutive_deaths = 0
+                health.last_success = datetime.now(timezone.utc)
+            finally:
+                health.ticks += 1
+                health.last_duration = time.perf_counter() - started
+
+        loop.coro = supervised
+
+    def start(self) -> None:
+        """Start every supervised loop that is not already running."""
+        self._stopping = False
+        for name, loop in self.loops.items():
+            if not loop.is_running() and name not in self._restarts:
+                self._launch(name)
+
+    async def stop(self) -> None:
+        """Cancel every loop and pending restart, and wait for them to finish."""
+        self._stopping = True
+        for task in self._restarts.values():
+            task.cancel()
+        tasks = list(self._restarts.values())
+        self._restarts.clear()
+        for name, loop in self.loops.items():
+            task = loop.get_task()
+            if task is not None and not task.done():
+                task.cancel()
+                tasks.append(task)
+            self.stats[name].state = "stopped"
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _launch(self, name: str) -> None:
+        task = self.loops[name].start()
+        self.stats[name].state = "running"
+        task.add_done_callback(functools.partial(self._on_done, name))
+
+    def _on_done(self, name: str, task: asyncio.Task) -> None:
+        if self._stopping:
+            return
+        health = self.stats[name]
+        if task.cancelled():
+            reason, error = "cancelled", "task was cancelled"
+        elif task.exception() is not None:
+            exc = task.exception()
+            reason, error = "error", f"{type(exc).__name__}: {exc}"
+        else:
+            reason, error = "exited", "loop returned"
+
+        health.state = "restarting"
+        health.consecutive_deaths += 1
+        health.last_failure = datetime.now(timezone.utc)
+        health.last_error = error
+        delay = min(self.max_delay, self.base_delay * 2 ** (health.consecutive_deaths - 1))
+        logger.error("Loop %s stopped (%s); restarting in %.0fs", name, error, delay,
+                     exc_info=None if reason != "error" else task.exception())
+        self._restarts[name] = asyncio.ensure_future(self._restart(name, reason, delay))
+
+    async def _restart(self, name: str, reason: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._restarts.pop(name, None)
+        if self._stopping:
+            return
+        self.stats[name].restarts += 1
+        LOOP_RESTARTS.inc(loop=name, reason=reason)
+        logger.info("Restarting loop %s", name)
+        self._launch(name)
+
+    @property
+    def healthy(self) -> bool:
+        return all(health.healthy for health in self.stats.values())
+
+    def health(self) -> Dict:
+        """Per-loop stats plus an overall flag; safe to call from another thread."""
+        return {
+            "healthy": self.healthy,
+            "loops": {name: health.as_dict() for name, health in list(self.stats.items())},
+        }
+
+    def http_response(self):
+        """(status, content type, body) for the metrics server's `/loops` route."""
+        health = self.health()
+        return 200 if health["healthy"] else 503, "application/json", json.dumps(health, indent=2) + "\n"
@@ -0,0 +1,242 @@
+"""
+Lightweight tracing for the Azeroth Herald bot.
+
+Each command invocation and scheduler tick is a root span; the fetch, parse,
+classify, render and send steps under it are child spans. The current span is
+held in a context variable, so children are linked to their parent across
+awaits and into `asyncio.to_thread` workers.
+
+Tracing is off unless TRACE_FILE is set. Finished spans are then written as
+one JSON object per line to that file by a background thread, rotating at
+TRACE_MAX_BYTES and keeping TRACE_BACKUPS old files. With tracing off,
+`span` and `traced` cost one global check.
+
+`scripts/trace_convert.py` turns the files into a Chrome trace
+(chrome://tracing, Perfetto) or OTLP JSON using the converters below.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueListener, RotatingFileHandler
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_exporter: Optional["SpanExporter"] = None
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attrs", "start_ns", "_started")
+
+    def __init__(self, name: str, parent: Optional["Span"], attrs: Dict) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attrs = attrs
+        self.start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def finish(self, error: Optional[str] = None) -> Dict:
+        record = {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_us": self.start_ns // 1000,
+            "duration_us": (time.perf_counter_ns() - self._started) // 1000,
+            "thread": threading.current_thread().name,
+            "attrs": self.attrs,
+        }
+        if error:
+            record["error"] = error
+        return record
+
+
+class SpanExporter:
+    """Writes finished spans to a rotating JSONL file from a listener thread."""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, backups: int = DEFAULT_BACKUPS) -> None:
+        self.path = path
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._queue = queue.SimpleQueue()
+        self._listener = QueueListener(self._queue, handler)
+        self._listener.start()
+
+    def export(self, record: Dict) -> None:
+        self._queue.put(logging.makeLogRecord({"msg": json.dumps(record, default=str)}))
+
+    def close(self) -> None:
+        if self._listener._thread is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+
+
+def start_tracing(path: Optional[str] = None, max_bytes: Optional[int] = None,
+                  backups: Optional[int] = None) -> Optional[SpanExporter]:
+    """Start exporting spans to `path` (default: TRACE_FILE). Returns None if no path is set."""
+    global _exporter
+    path = path or os.getenv("TRACE_FILE")
+    if not path:
+        return None
+    stop_tracing()
+    _exporter = SpanExporter(
+        path,
+        max_bytes if max_bytes is not None else int(os.getenv("TRACE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+        backups if backups is not None else int(os.getenv("TRACE_BACKUPS", DEFAULT_BACKUPS)),
+    )
+    return _exporter
+
+
+def stop_tracing() -> None:
+    """Flush and stop the exporter; spans become no-ops again."""
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+        _exporter = None
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Record the enclosed block as a span, a child of the current one if there is one."""
+    exporter = _exporter
+    if exporter is None:
+        yield None
+        return
+    current = Span(name, _current.get(), attrs)
+    token = _current.set(current)
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current.reset(token)
+        exporter.export(current.finish(error))
+
+
+def traced(kind: str, name: Optional[str] = None):
+    """Decorator recording each call of a function or coroutine function as a span.
+
+    The span is named `<kind>.<name>`, with the function's name as the default `name`.
+    """
+
+    def decorator(func):
+        span_name = f"{kind}.{name or func.__name__}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _exporter is None:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def read_spans(path: str) -> List[Dict]:
+    """Spans from `path` and its rotated backups (`path.1`, `path.2`, ...), oldest first."""
+    files = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        files.append(f"{path}.{index}")
+        index += 1
+    files = list(reversed(files))
+    if os.path.exists(path):
+        files.append(path)
+
+    spans = []
+    for file in files:
+        with open(file, encoding="utf-8") as f:
+            spans.extend(json.loads(line) for line in f if line.strip())
+    return spans
+
+
+def to_chrome_trace(spans: Iterable[Dict]) -> Dict:
+    """Chrome trace event format, one row per trace so concurrent invocations don't overlap."""
+    spans = sorted(spans, key=lambda s: s["start_us"])
+    rows: Dict[str, int] = {}
+    events = []
+    for item in spans:
+        row = rows.get(item["trace_id"])
+        if row is None:
+            row = rows[item["trace_id"]] = len(rows) + 1
+            events.append({"ph": "M", "name": "thread_name", "pid": 1, "tid": row,
+                           "args": {"name": item["name"] if item["parent_id"] is None else item["trace_id"][:8]}})
+        args = dict(item.get("attrs") or {}, thread=item.get("thread"))
+        if item.get("error"):
+            args["error"] = item["error"]
+        events.append({
+            "ph": "X",
+            "name": item["name"],
+            "cat": item["name"].split(".", 1)[0],
+            "ts": item["start_us"],
+            "dur": item["duration_us"],
+            "pid": 1,
+            "tid": row,
+            "args": args,
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otlp_value(value) -> Dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: Iterable[Dict], service_name: str = "azeroth-herald") -> Dict:
+    """OTLP/JSON `ExportTraceServiceRequest`, ready to POST to a collector's /v1/traces."""
+    otlp_spans = []
+    for item in spans:
+        start_ns = item["start_us"] * 1000
+        attrs = dict(item.get("attrs") or {}, thread=item.get("thread"))
+        otlp_span = {
+            "traceId": item["trace_id"],
+            "spanId": item["span_id"],
+            "name": item["name"],
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(start_ns + item["duration_us"] * 1000),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in attrs.items()],
+            "status": {"code": 2, "message": item["error"]} if item.get("error") else {"code": 1},
+        }
+        if item.get("parent_id"):
+            otlp_span["parentSpanId"] = item["parent_id"]
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{"scope": {"name": "src.utils.tracing"}, "spans": otlp_spans}],
+        }]
+    }
@@ -5,30 +5,50 @@ Uses Wowhead's public RSS feed (https://www.wowhead.com/news/rss/all), which is
 not behind Cloudflare bot protection, instead of scraping the HTML index page.
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+from datetime import datetime
 from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional
 
-import requests
+from src.utils.clock import utc_now
+from src.utils.metrics import fetch_hooks, record_fetch_error
+from src.utils.parse_pool import run_parse
+from src.utils.tracing import span, traced
 
 logger = logging.getLogger(__name__)
 
 MEDIA_NS = "{http://search.yahoo.com/mrss/}"
 
+# Seen article IDs kept in the cache. The feed holds 25 items, so anything
+# older than the last few hundred can never come back round.
+MAX_SEEN_IDS = 500
+
+# Overridden with WOWHEAD_BASE_URL, e.g. to point at the local stub server.
+DEFAULT_BASE_URL = "https://www.wowhead.com"
+
+# Response validator -> request header for conditional fetches.
+_VALIDATORS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
 
 class WowheadNewsScraper:
-    def __init__(self) -> None:
-        self.url = "https://www.wowhead.com/news/rss/all"
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        base_url = (base_url or os.getenv("WOWHEAD_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+        self.url = f"{base_url}/news/rss/all"
         self.cache_file = "wowhead_news_cache.json"
         self.headers = {
             "User-Agent": "AzerothHerald/1.0 (+https://github.com/Deetss/AzerothHerald)",
             "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
         }
+        # Items from the most recent successful fetch, shared with cluster followers.
+        self.snapshot: Optional[List[ET.Element]] = None
+        self.snapshot_at: Optional[datetime] = None
+        # Validators of the snapshot, sent back so an unchanged feed is a bodiless 304.
+        self.validators: Dict[str, str] = {}
 
     def load_cache(self) -> Dict:
         try:
@@ -46,24 +66,39 @@ class WowheadNewsScraper:
         except OSError as e:
             logger.warning("Error saving cache: %s", e)
 
+    @traced("fetch")
     def fetch_news_page(self) -> Optional[List[ET.Element]]:
         """Fetch the Wowhead news RSS feed and return its <item> elements."""
+        import requests  # deferred: only needed once a feed is fetched
+
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=10)
+            headers = dict(self.headers, **self.validators) if self.snapshot is not None else self.headers
+            response = requests.get(self.url, headers=headers, timeout=10, hooks=fetch_hooks("wowhead_news"))
             response.raise_for_status()
-            root = ET.fromstring(response.content)
-            return root.findall(".//item")
+            if response.status_code == 304 and self.snapshot is not None:
+                self.snapshot_at = utc_now()
+                return self.snapshot
+            with span("parse.xml", bytes=len(response.content)):
+                root = ET.fromstring(response.content)
+            items = root.findall(".//item")
+            self.snapshot, self.snapshot_at = items, utc_now()
+            self.validators = {
+                header: response.headers[name] for name, header in _VALIDATORS.items() if name in response.headers
+            }
+            return items
         except (requests.RequestException, ET.ParseError) as e:
+            record_fetch_error("wowhead_news", e)
             logger.error("Error fetching Wowhead news feed: %s", e)
             return None
 
+    @traced("parse")
     def parse_articles(self, items: Optional[List[ET.Element]]) -> List[Dict]:
         """Normalize RSS <item> elements into article dicts and filter for relevance."""
         if not items:
             return []
 
         articles: List[Dict] = []
-        now_iso = datetime.now(timezone.utc).isoformat()
+        now_iso = utc_now().isoformat()
 
         for item in items[:25]:
             try:
@@ -162,18 +197,31 @@ class WowheadNewsScraper:
         return any(keyword in title for keyword in reset_keywords)
 
     def get_new_articles(self) -> List[Dict]:
-        cache = self.load_cache()
-        seen_articles = set(cache.get("seen_articles", []))
-        is_first_run = len(seen_articles) == 0 and cache.get("last_check") is None
-
         items = self.fetch_news_page()
         if items is None:
             return []
+        return self.record_new_articles(self.parse_articles(items))
+
+    async def check_new_articles(self) -> List[Dict]:
+        """`get_new_articles` from the event loop: fetches in a worker thread and parses on the parse pool."""
+        items = await asyncio.to_thread(self.fetch_news_page)
+        if items is None:
+            return []
+        return self.record_new_articles(await run_parse(self.parse_articles, items))
+
+    def record_new_articles(self, all_articles: List[Dict]) -> List[Dict]:
+        """Mark freshly parsed articles as seen and return the ones not reported before."""
+        cache = self.load_cache()
+        seen_order = cache.get("seen_articles", [])
+        seen_articles = set(seen_order)
+        is_first_run = len(seen_articles) == 0 and cache.get("last_check") is None
 
-        all_articles = self.parse_articles(items)
         new_articles: List[Dict] = []
+        in_feed: Dict[str, None] = {}
         for article in all_articles:
             article_id = article.get("article_id", "")
+            if article_id:
+                in_feed[article_id] = None
             if article_id and article_id not in seen_articles:
                 new_articles.append(article)
                 seen_articles.add(article_id)
@@ -182,20 +230,37 @@ class WowheadNewsScraper:
             logger.info("First run detected - returning %d most recent articles", min(3, len(new_articles)))
             new_articles = new_articles[:3]
 
-        cache["seen_articles"] = list(seen_articles)
-        cache["last_check"] = datetime.now(timezone.utc).isoformat()
+        # Oldest first, with IDs still in the feed moved to the end so trimming
+        # never forgets an article that could be reported again.
+        seen_order = [i for i in seen_order if i not in in_feed] + list(in_feed)
+        cache["seen_articles"] = seen_order[-MAX_SEEN_IDS:]
+        cache["last_check"] = utc_now().isoformat()
         self.save_cache(cache)
 
         return new_articles
 
-    def get_reset_relevant_articles(self, days_back: int = 7) -> List[Dict]:
-        items = self.fetch_news_page()
+    @traced("classify")
+    def get_reset_relevant_articles(self, days_back: int = 7,
+                                    items: Optional[List[ET.Element]] = None) -> List[Dict]:
+        """Reset-relevant articles; fetches the feed unless `items` is given."""
+        if items is None:
+            items = self.fetch_news_page()
         if items is None:
             return []
 
         all_articles = self.parse_articles(items)
         return [a for a in all_articles if self.is_reset_relevant(a)][:10]
 
+    async def find_reset_relevant_articles(self, days_back: int = 7,
+                                           items: Optional[List[ET.Element]] = None) -> List[Dict]:
+        """`get_reset_relevant_articles` from the event loop, fetching in a worker thread if needed."""
+        if items is None:
+            items = await asyncio.to_thread(self.fetch_news_page)
+        if items is None:
+            return []
+        return await run_parse(self.get_reset_relevant_articles, days_back, items)
+
+    @traced("classify")
     def summarize_reset_info(self, articles: List[Dict]) -> Dict:
         if not articles:
             return {}
@@ -0,0 +1,65 @@
+"""Unit tests for the Raider.IO cache and request sharing.
+
+`requests.get` is replaced with a slow stand-in — no network access.
+"""
+
+import asyncio
+import time
+
+import pytest
+import requests
+
+from src.utils import api
+from src.utils.metrics import CACHE_LOOKUPS
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, region):
+        self.region = region
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"region": self.region, "affix_details": []}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+
+    def get(url, params=None, **kwargs):
+        calls.append(params["region"])
+        time.sleep(0.05)
+        return FakeResponse(params["region"])
+
+    monkeypatch.setenv("RAIDER_IO_API_KEY", "test")
+    monkeypatch.setattr(api, "_cache", {})
+    monkeypatch.setattr(requests, "get", get)
+    return calls
+
+
+def lookups():
+    return {result: CACHE_LOOKUPS.value(cache="raiderio", result=result) for result in ("hit", "miss")}
+
+
+def test_concurrent_misses_share_one_request(upstream):
+    async def scenario():
+        return await asyncio.gather(*(api.fetch_affixes(region) for region in ("eu", "eu", "eu", "us")))
+
+    results = asyncio.run(scenario())
+    assert sorted(upstream) == ["eu", "us"]
+    assert [data["region"] for data, error in results] == ["eu", "eu", "eu", "us"]
+    assert api._inflight == {}
+
+
+def test_peeking_at_the_cache_is_not_counted(upstream):
+    before = lookups()
+    assert api.get_cached_affixes("eu") is None
+    asyncio.run(api.fetch_affixes("eu"))
+    assert api.get_cached_affixes("eu") is not None
+    asyncio.run(api.fetch_affixes("eu"))
+    after = lookups()
+    assert (after["miss"] - before["miss"], after["hit"] - before["hit"]) == (1, 1)
@@ -0,0 +1,102 @@
+"""Unit tests for shard ownership and the cluster feed channel.
+
+The feed hub and subscriber talk over a real localhost socket; no Discord
+connection or feeds involved.
+"""
+
+import asyncio
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.cluster import (
+    FeedHub,
+    FeedSubscriber,
+    decode_items,
+    encode_items,
+    owned_channel_ids,
+    shard_for_guild,
+    shard_options,
+)
+
+
+def test_shard_options_from_env(monkeypatch):
+    monkeypatch.delenv("SHARD_COUNT", raising=False)
+    monkeypatch.delenv("SHARD_IDS", raising=False)
+    assert shard_options() == (False, {})
+
+    monkeypatch.setenv("SHARD_COUNT", "auto")
+    assert shard_options() == (True, {"shard_count": None})
+
+    monkeypatch.setenv("SHARD_COUNT", "4")
+    monkeypatch.setenv("SHARD_IDS", "2, 3")
+    assert shard_options() == (True, {"shard_count": 4, "shard_ids": [2, 3]})
+
+    monkeypatch.delenv("SHARD_COUNT")
+    with pytest.raises(ValueError):
+        shard_options()
+
+
+def _guild_on_shard(shard_id, shard_count=4):
+    guild_id = next(g << 22 for g in range(1, 100) if shard_for_guild(g << 22, shard_count) == shard_id)
+    return SimpleNamespace(id=guild_id)
+
+
+def test_owned_channels_follow_shard_ids():
+    channels = {
+        1: SimpleNamespace(guild=_guild_on_shard(0)),
+        2: SimpleNamespace(guild=_guild_on_shard(1)),
+        3: SimpleNamespace(guild=_guild_on_shard(2)),
+    }
+    bot = SimpleNamespace(shard_count=4, shard_ids=[0, 2], get_channel=channels.get)
+    assert owned_channel_ids(bot, [1, 2, 3, 4]) == [1, 3]
+
+
+def test_unsharded_bot_owns_every_channel():
+    bot = SimpleNamespace(shard_count=None, get_channel=lambda channel_id: None)
+    assert owned_channel_ids(bot, [1, 2]) == [1, 2]
+
+
+def test_snapshot_items_round_trip():
+    root = ET.fromstring(
+        '<rss xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+        '<item><title>Hotfixes</title><media:content url="https://example.com/a.png"/></item>'
+        '</channel></rss>'
+    )
+    items = decode_items(encode_items(root.findall(".//item")))
+    assert items[0].findtext("title") == "Hotfixes"
+    assert items[0].find("{http://search.yahoo.com/mrss/}content").get("url") == "https://example.com/a.png"
+
+
+def test_follower_gets_latest_snapshot_then_live_posts():
+    async def scenario():
+        hub = FeedHub("127.0.0.1", 0)
+        await hub.start()
+        await hub.publish({"type": "snapshot", "feed": "blue", "at": "old", "items": []})
+        await hub.publish({"type": "snapshot", "feed": "blue", "at": "new", "items": []})
+        await hub.publish({"type": "posts", "feed": "blue", "items": [{"title": "missed"}]})
+
+        received = []
+        done = asyncio.Event()
+
+        async def handler(message):
+            received.append(message)
+            if message["type"] == "posts":
+                done.set()
+
+        subscriber = FeedSubscriber("127.0.0.1", hub.port, handler, reconnect_delay=0.05)
+        subscriber.start()
+        await asyncio.wait_for(subscriber.connected.wait(), 2)
+        while hub.followers == 0:
+            await asyncio.sleep(0.01)
+
+        await hub.publish({"type": "posts", "feed": "blue", "items": [{"title": "live"}]})
+        await asyncio.wait_for(done.wait(), 2)
+        await subscriber.close()
+        await hub.close()
+        return received
+
+    received = asyncio.run(scenario())
+    assert [m.get("at") for m in received if m["type"] == "snapshot"] == ["new"]
+    assert [m["items"][0]["title"] for m in received if m["type"] == "posts"] == ["live"]
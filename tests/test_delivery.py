@@ -0,0 +1,104 @@
+"""Unit tests for embed batching and webhook delivery.
+
+Builds local embeds and stand-in channels and webhooks — no Discord connection needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+from src.utils.delivery import WEBHOOK_NAME, WebhookDelivery, batch_embeds, send_embed_batches
+
+
+def _embed(chars):
+    return discord.Embed(title="t", description="x" * (chars - 1))
+
+
+def test_batches_respect_embed_count_limit():
+    batches = batch_embeds([_embed(10) for _ in range(23)])
+    assert [len(b) for b in batches] == [10, 10, 3]
+
+
+def test_batches_respect_character_limit():
+    batches = batch_embeds([_embed(2500) for _ in range(5)])
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert all(sum(len(e) for e in b) <= 6000 for b in batches)
+
+
+def test_oversized_embed_gets_its_own_batch():
+    batches = batch_embeds([_embed(10), _embed(7000), _embed(10)])
+    assert [len(b) for b in batches] == [1, 1, 1]
+
+
+def test_send_attaches_content_to_first_message_only():
+    sent = []
+
+    class Destination:
+        async def send(self, content=None, *, embeds):
+            sent.append((content, len(embeds)))
+
+    asyncio.run(send_embed_batches(Destination(), [_embed(10) for _ in range(12)], content="hi"))
+    assert sent == [("hi", 10), (None, 2)]
+
+
+class FakeWebhook:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on  # index of the send that raises NotFound
+        self.sent = []
+
+    async def send(self, content=None, *, embeds=None, **kwargs):
+        if len(self.sent) == self.fail_on:
+            self.fail_on = None
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Webhook")
+        self.sent.append((content, len(embeds or [])))
+
+
+class FakeChannel:
+    def __init__(self, webhooks=(), forbidden=False):
+        self.existing = list(webhooks)
+        self.forbidden = forbidden
+        self.lookups = 0
+        self.sent = []
+
+    async def webhooks(self):
+        self.lookups += 1
+        if self.forbidden:
+            raise discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "Missing Permissions")
+        return self.existing
+
+    async def send(self, content=None, *, embeds=None):
+        self.sent.append((content, len(embeds or [])))
+
+
+def test_webhook_resend_resumes_after_the_batches_already_posted(tmp_path, monkeypatch):
+    first, second = FakeWebhook(fail_on=1), FakeWebhook()
+    bot = SimpleNamespace(user="herald")
+    existing = SimpleNamespace(name=WEBHOOK_NAME, user="herald", url="https://discord.com/api/webhooks/1/x")
+    channel = FakeChannel([existing])
+    bot.get_channel = lambda channel_id: channel
+    monkeypatch.setattr(discord.Webhook, "from_url", lambda url, session=None: second)
+
+    async def scenario():
+        delivery = WebhookDelivery(bot, cache_file=str(tmp_path / "webhooks.json"))
+        delivery.webhooks[1] = first
+        assert await delivery.send(1, "hi", [_embed(10) for _ in range(25)])
+        await delivery.close()
+
+    asyncio.run(scenario())
+    assert first.sent == [("hi", 10)]
+    assert second.sent == [(None, 10), (None, 5)]
+
+
+def test_failed_webhook_creation_falls_back_without_retrying_every_post(tmp_path):
+    channel = FakeChannel(forbidden=True)
+    bot = SimpleNamespace(user="herald", get_channel=lambda channel_id: channel)
+
+    async def scenario():
+        delivery = WebhookDelivery(bot, cache_file=str(tmp_path / "webhooks.json"))
+        for _ in range(3):
+            assert await delivery.send(1, "hi")
+
+    asyncio.run(scenario())
+    assert channel.lookups == 1
+    assert channel.sent == [("hi", 0)] * 3
@@ -0,0 +1,116 @@
+"""Unit tests for the dev runner's hot-reload planning and in-place reloads.
+
+Extensions are loaded into a bot that never logs in.
+"""
+
+import asyncio
+import os
+import sys
+
+import discord
+from discord.ext import commands
+
+from src.utils.dev_reload import apply_reload, module_for_path, plan_reload
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def path(*parts):
+    return os.path.join(ROOT, *parts)
+
+
+def test_module_for_path():
+    assert module_for_path(path("src", "commands", "affixes.py"), ROOT) == "src.commands.affixes"
+    assert module_for_path(path("src", "utils", "__init__.py"), ROOT) == "src.utils"
+    assert module_for_path(path("README.md"), ROOT) is None
+    assert module_for_path("/elsewhere/bot.py", ROOT) is None
+
+
+def test_command_changes_reload_in_place_with_helpers_first():
+    action, modules = plan_reload([
+        path("src", "commands", "time.py"),
+        path("src", "utils", "replies.py"),
+        path("src", "utils", "embeds.py"),
+    ], ROOT)
+    assert action == "reload"
+    assert modules == ["src.utils.embeds", "src.utils.replies", "src.commands.time"]
+
+
+def test_helper_change_also_reloads_its_dependents():
+    assert plan_reload([path("src", "utils", "embeds.py")], ROOT) == (
+        "reload", ["src.utils.embeds", "src.utils.replies"])
+    assert plan_reload([path("src", "utils", "replies.py")], ROOT) == ("reload", ["src.utils.replies"])
+
+
+def test_core_change_in_batch_forces_restart():
+    action, modules = plan_reload([path("src", "commands", "time.py"), path("bot.py"),
+                                   path("src", "tasks", "scheduler.py")], ROOT)
+    assert action == "restart"
+    assert modules == ["bot", "src.tasks.scheduler"]
+
+
+def test_tests_and_scripts_are_ignored():
+    assert plan_reload([path("tests", "test_embeds.py"), path("scripts", "gateway_memory.py")], ROOT) == ("ignore", [])
+
+
+def test_apply_reload_replaces_cog_and_reloads_all_extensions_for_helpers():
+    async def scenario():
+        bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+        async with bot:
+            await bot.load_extension("src.commands.time")
+            await bot.load_extension("src.commands.test")
+            before = bot.get_cog("TimeCommand")
+            await apply_reload(bot, ["src.commands.time"])
+            after_extension = bot.get_cog("TimeCommand")
+            test_before = bot.get_cog("TestCommand")
+            await apply_reload(bot, ["src.utils.embeds"])
+            return before, after_extension, test_before, bot.get_cog("TestCommand")
+
+    before, after_extension, test_before, test_after = asyncio.run(scenario())
+    assert after_extension is not before
+    assert test_after is not test_before
+
+
+def test_apply_reload_of_embeds_refreshes_replies_bindings():
+    import src.utils.embeds  # noqa: F401 - make sure both helpers are loaded
+    import src.utils.replies  # noqa: F401
+
+    async def scenario():
+        bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+        async with bot:
+            await apply_reload(bot, ["src.utils.embeds"])
+
+    asyncio.run(scenario())
+    embeds, replies = sys.modules["src.utils.embeds"], sys.modules["src.utils.replies"]
+    assert replies.create_time_embed is embeds.create_time_embed
+    assert replies.create_affixes_embed is embeds.create_affixes_embed
+
+
+def test_editing_an_embed_builder_changes_the_reset_digest_output():
+    import src.utils.embeds as embeds
+    from src.utils.reset_digest import get_reset_digest
+
+    digest = get_reset_digest()
+    digest.version = "test"
+    original = open(embeds.__file__, encoding="utf-8").read()
+
+    async def reload_embeds():
+        bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+        async with bot:
+            await apply_reload(bot, ["src.utils.embeds"])
+
+    before = digest.checklist_embed()
+    try:
+        with open(embeds.__file__, "a", encoding="utf-8") as f:
+            f.write("\n\ndef create_checklist_embed(summary=None):\n"
+                    "    return discord.Embed(title='Edited checklist')\n")
+        asyncio.run(reload_embeds())
+        after = digest.checklist_embed()
+    finally:
+        with open(embeds.__file__, "w", encoding="utf-8") as f:
+            f.write(original)
+        asyncio.run(reload_embeds())
+
+    assert before.title != "Edited checklist"
+    assert after.title == "Edited checklist"
+    assert digest.checklist_embed().title == before.title
@@ -0,0 +1,62 @@
+"""Unit tests for the gateway profiles and guild cache trimming.
+
+Guilds are built from small GUILD_CREATE-style payloads — no network access.
+"""
+
+import discord
+import pytest
+
+from src.utils.gateway_profile import gateway_options, trim_guild_cache
+
+GUILD_ID = 1000
+SELF_ID = 42
+
+
+def make_guild():
+    client = discord.Client(intents=discord.Intents.default())
+    state = client._connection
+    state.user = discord.ClientUser(state=state, data={"id": str(SELF_ID), "username": "herald",
+                                                       "discriminator": "0", "avatar": None})
+    roles = [{"id": str(role_id), "name": f"role-{role_id}", "position": i, "permissions": "0"}
+             for i, role_id in enumerate([GUILD_ID, 1001, 1002, 1003])]
+    channels = [
+        {"id": "2001", "type": 0, "name": "general", "position": 0},
+        {"id": "2002", "type": 2, "name": "voice", "position": 1, "bitrate": 64000, "user_limit": 0},
+        {"id": "2003", "type": 4, "name": "category", "position": 2},
+        {"id": "2004", "type": 2, "name": "raid-voice", "position": 3, "bitrate": 64000, "user_limit": 0},
+    ]
+    me = {"user": {"id": str(SELF_ID), "username": "herald", "discriminator": "0", "avatar": None},
+          "roles": ["1001"], "joined_at": None, "deaf": False, "mute": False, "flags": 0}
+    return discord.Guild(data={"id": str(GUILD_ID), "name": "Guild", "roles": roles,
+                               "channels": channels, "members": [me]}, state=state)
+
+
+def test_default_profile_keeps_discord_defaults():
+    options = gateway_options('default', message_content=False)
+    assert set(options) == {'intents'}
+    assert options['intents'].members is False
+    assert options['intents'].message_content is False
+
+
+def test_lowmem_profile_trims_intents_and_caches():
+    options = gateway_options('lowmem')
+    intents = options['intents']
+    assert intents.guilds and intents.guild_messages and intents.message_content
+    assert not (intents.voice_states or intents.emojis_and_stickers or intents.typing or intents.reactions)
+    assert options['max_messages'] is None
+    assert options['chunk_guilds_at_startup'] is False
+    assert options['member_cache_flags'].value == 0
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        gateway_options('tiny')
+
+
+def test_trim_guild_cache_keeps_text_channels_and_own_roles():
+    guild = make_guild()
+    trim_guild_cache(guild, keep_channel_ids={2004})
+
+    assert sorted(channel.id for channel in guild.channels) == [2001, 2004]
+    assert sorted(role.id for role in guild.roles) == [GUILD_ID, 1001]
+    assert [role.id for role in guild.me.roles] == [GUILD_ID, 1001]
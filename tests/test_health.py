@@ -0,0 +1,111 @@
+"""Unit tests for the liveness and readiness probes.
+
+A stub bot and scrapers stand in for the gateway and feeds; probes are read over real HTTP.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from src.utils import api, health
+from src.utils.clock import FakeClock, set_clock
+from src.utils.health import HealthCheck
+from src.utils.metrics import serve_routes
+
+NOW = datetime(2025, 9, 2, 12, 0, tzinfo=timezone.utc)
+
+
+class StubBot:
+    def __init__(self, ready=True, latency=0.05):
+        self.ready = ready
+        self.latency = latency
+
+    def is_ready(self):
+        return self.ready
+
+    def is_closed(self):
+        return False
+
+
+class StubScraper:
+    def __init__(self, snapshot_at=None):
+        self.snapshot_at = snapshot_at
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock(NOW)
+    set_clock(fake)
+    yield fake
+    set_clock(None)
+
+
+def ready_check(bot=None, blue_age=timedelta(minutes=10), news_age=timedelta(hours=1)):
+    check = HealthCheck(bot or StubBot(), blue_max_age=timedelta(minutes=75), news_max_age=timedelta(minutes=270))
+    check.feeds = {"blue_tracker": StubScraper(NOW - blue_age), "wowhead_news": StubScraper(NOW - news_age)}
+    return check
+
+
+def test_ready_when_connected_and_feeds_are_recent(clock, monkeypatch):
+    monkeypatch.setattr(api, "_cache", {("affixes", "us"): (time.monotonic() - 20 * 60, {})})
+    ready, body = ready_check().readiness()
+    assert ready and body["checks"]["gateway"]["latency_ms"] == 50.0
+    assert body["checks"]["blue_tracker"]["age_seconds"] == 600.0
+    # A stale Raider.IO entry is reported but is re-fetched on next use, so it doesn't gate readiness.
+    assert body["checks"]["raiderio_cache"] == {"affixes/us": {"age_seconds": pytest.approx(1200, abs=1),
+                                                              "fresh": False}}
+
+
+@pytest.mark.parametrize("bot, blue_age, news_age, failing", [
+    (StubBot(ready=False), timedelta(0), timedelta(0), "gateway"),
+    (StubBot(latency=float("inf")), timedelta(0), timedelta(0), "gateway"),
+    (StubBot(latency=float("nan")), timedelta(0), timedelta(0), "gateway"),
+    (StubBot(), timedelta(minutes=76), timedelta(0), "blue_tracker"),
+    (StubBot(), timedelta(0), timedelta(hours=5), "wowhead_news"),
+])
+def test_not_ready_when_a_check_fails(clock, bot, blue_age, news_age, failing):
+    ready, body = ready_check(bot, blue_age, news_age).readiness()
+    assert not ready
+    assert [name for name, check in body["checks"].items() if check.get("ok") is False] == [failing]
+
+
+def test_not_ready_before_the_first_fetch(clock):
+    check = HealthCheck(StubBot())
+    ready, body = check.readiness()
+    assert not ready and body["checks"]["blue_tracker"]["last_fetch"] is None
+
+
+def test_liveness_follows_the_event_loop_heartbeat(monkeypatch):
+    check = HealthCheck(StubBot())
+    assert not check.liveness()[0]  # no heartbeat yet
+
+    async def beat():
+        check.start()
+        await asyncio.sleep(0)
+        await check.stop()
+
+    asyncio.run(beat())
+    assert check.liveness()[0]
+    monkeypatch.setattr(health, "LIVENESS_TIMEOUT", 0.0)
+    assert not check.liveness()[0]
+
+
+def test_probes_are_served_over_http(clock):
+    check = ready_check(blue_age=timedelta(hours=2))
+    check.beat = time.monotonic()
+    server = serve_routes("127.0.0.1", 0, check.routes(), name="health-server")
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        live = requests.get(url + "/healthz", timeout=5)
+        assert live.status_code == 200 and live.json()["ok"]
+        ready = requests.get(url + "/readyz", timeout=5)
+        assert ready.status_code == 503 and ready.headers["Content-Type"] == "application/json"
+        assert json.loads(ready.text)["checks"]["blue_tracker"]["ok"] is False
+        assert requests.get(url + "/metrics", timeout=5).status_code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -11,11 +11,13 @@ import pytest
 MODULES = [
     "src",
     "src.commands",
+    "src.commands.admin",
     "src.commands.affixes",
     "src.commands.bluetrack",
     "src.commands.checklist",
     "src.commands.cutoffs",
     "src.commands.help",
+    "src.commands.slash",
     "src.commands.test",
     "src.commands.time",
     "src.commands.warning",
@@ -25,8 +27,28 @@ MODULES = [
     "src.utils",
     "src.utils.api",
     "src.utils.blue_tracker",
+    "src.utils.clock",
+    "src.utils.cluster",
+    "src.utils.delivery",
+    "src.utils.dev_reload",
     "src.utils.embeds",
     "src.utils.error_handler",
+    "src.utils.gateway_profile",
+    "src.utils.health",
+    "src.utils.interactions",
+    "src.utils.logs",
+    "src.utils.loop_monitor",
+    "src.utils.memory",
+    "src.utils.metrics",
+    "src.utils.parse_pool",
+    "src.utils.profiler",
+    "src.utils.replies",
+    "src.utils.reset_digest",
+    "src.utils.send_queue",
+    "src.utils.startup",
+    "src.utils.stub_upstream",
+    "src.utils.supervisor",
+    "src.utils.tracing",
     "src.utils.wowhead_news",
 ]
 
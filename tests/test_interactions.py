@@ -0,0 +1,134 @@
+"""Tests for the HTTP interactions endpoint.
+
+Signs payloads with a throwaway key, the same way Discord does, and drives the
+aiohttp app in-process. Deferred commands complete against a local stand-in
+for Discord's REST API, so nothing reaches Discord or the feeds.
+"""
+
+import asyncio
+import json
+import logging
+import socket
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+from nacl.signing import SigningKey
+
+from src.utils import interactions
+from src.utils.interactions import InteractionRouter, create_app
+from src.utils.logs import CorrelationFilter
+from src.utils.replies import make_reply
+
+SIGNING_KEY = SigningKey.generate()
+PUBLIC_KEY = SIGNING_KEY.verify_key.encode().hex()
+
+
+def _post(payload, signing_key=SIGNING_KEY, timestamp=None):
+    async def scenario():
+        body = json.dumps(payload).encode()
+        ts = timestamp or str(int(time.time()))
+        headers = {
+            "X-Signature-Ed25519": signing_key.sign(ts.encode() + body).signature.hex(),
+            "X-Signature-Timestamp": ts,
+        }
+        async with TestClient(TestServer(create_app(PUBLIC_KEY))) as client:
+            response = await client.post("/interactions", data=body, headers=headers)
+            text = await response.text()
+            return response.status, json.loads(text) if response.status == 200 else text
+
+    return asyncio.run(scenario())
+
+
+def _command(name, **options):
+    return {
+        "type": 2, "application_id": "1", "token": "t",
+        "data": {"name": name, "options": [{"name": k, "value": v} for k, v in options.items()]},
+    }
+
+
+def test_ping_is_ponged():
+    assert _post({"type": 1}) == (200, {"type": 1})
+
+
+def test_bad_signature_is_rejected():
+    status, _ = _post({"type": 1}, signing_key=SigningKey.generate())
+    assert status == 401
+
+
+def test_stale_timestamp_is_rejected():
+    status, _ = _post({"type": 1}, timestamp=str(int(time.time()) - 3600))
+    assert status == 401
+
+
+def test_time_command_answers_inline():
+    status, body = _post(_command("time"))
+    assert status == 200
+    assert body["type"] == 4
+    assert body["data"]["embeds"][0]["title"] == "🕐 Bot Schedule Information"
+
+
+def test_invalid_region_is_ephemeral():
+    status, body = _post(_command("affixes", region="mars"))
+    assert status == 200
+    assert body["data"]["flags"] == 64
+
+
+def test_region_autocomplete():
+    payload = {
+        "type": 4,
+        "data": {"name": "cutoffs", "options": [{"name": "region", "value": "e", "focused": True}]},
+    }
+    status, body = _post(payload)
+    assert status == 200
+    assert body == {"type": 8, "data": {"choices": [{"name": "EU", "value": "eu"}]}}
+
+
+async def _deferred_affixes(router):
+    response = await router.handle(_command("affixes", region="us"))
+    assert response == {"type": 5}
+    await asyncio.gather(*router._background)
+    await router.close()
+
+
+def _failing_completions(monkeypatch, caplog):
+    async def reply(region):
+        return make_reply("affixes")
+
+    monkeypatch.setattr(interactions, "get_cached_affixes", lambda region: None)
+    monkeypatch.setattr(interactions, "affixes_reply", reply)
+    caplog.handler.addFilter(CorrelationFilter())
+    caplog.set_level(logging.ERROR, logger=interactions.__name__)
+
+
+def test_deferred_completion_logs_a_rest_5xx(monkeypatch, caplog):
+    _failing_completions(monkeypatch, caplog)
+    requests = []
+
+    async def broken(request):
+        requests.append(request.method)
+        return web.Response(status=503)
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", broken)
+        async with TestServer(app) as server:
+            await _deferred_affixes(InteractionRouter(api_base=str(server.make_url(""))))
+
+    asyncio.run(scenario())
+    assert requests == ["PATCH"]
+    [record] = caplog.records
+    assert record.getMessage() == "Failed to complete /affixes interaction: HTTP 503"
+    assert record.correlation_id.startswith("affixes-")
+
+
+def test_deferred_completion_logs_an_unreachable_rest_api(monkeypatch, caplog):
+    _failing_completions(monkeypatch, caplog)
+    with socket.socket() as sock:  # a port nothing listens on
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    asyncio.run(_deferred_affixes(InteractionRouter(api_base=f"http://127.0.0.1:{port}")))
+    [record] = caplog.records
+    assert record.getMessage() == "Failed to complete /affixes interaction"
+    assert record.exc_info and record.correlation_id.startswith("affixes-")
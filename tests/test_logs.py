@@ -0,0 +1,111 @@
+"""Unit tests for the structured logging pipeline.
+
+Logs go through the real queue and listener into an in-memory stream.
+"""
+
+import asyncio
+import io
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.error_handler import handle_command_error
+from src.utils.logs import (
+    RateLimitFilter,
+    correlated,
+    new_correlation_id,
+    setup_logging,
+    stop_logging,
+)
+
+
+@pytest.fixture
+def captured():
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stream = io.StringIO()
+    listener = setup_logging(level="INFO", fmt="json", stream=stream)
+
+    def lines():
+        stop_logging(listener)
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield lines
+    stop_logging(listener)
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+def test_json_lines_carry_correlation_ids(captured):
+    log = logging.getLogger("test.logs")
+
+    @correlated("tick")
+    async def tick():
+        log.info("ticking %d", 1)
+        await asyncio.sleep(0)
+
+    async def command():
+        new_correlation_id("checklist")
+        log.info("handling", extra={"guild": 42})
+
+    async def scenario():
+        await tick()
+        await asyncio.create_task(command())
+        log.info("outside")
+
+    asyncio.run(scenario())
+    tick_line, command_line, outside_line = captured()
+
+    assert tick_line["message"] == "ticking 1"
+    assert tick_line["level"] == "INFO" and tick_line["logger"] == "test.logs"
+    assert tick_line["correlation_id"].startswith("tick-")
+    assert command_line["correlation_id"].startswith("checklist-")
+    assert command_line["guild"] == 42
+    assert "correlation_id" not in outside_line
+
+
+def test_exceptions_are_rendered_into_the_record(captured):
+    try:
+        raise ValueError("bad feed")
+    except ValueError:
+        logging.getLogger("test.logs").exception("parse failed")
+
+    (line,) = captured()
+    assert line["level"] == "ERROR"
+    assert "ValueError: bad feed" in line["exception"]
+
+
+def test_repeated_errors_are_rate_limited():
+    limiter = RateLimitFilter(window=60)
+
+    def record(message, level=logging.WARNING):
+        return logging.makeLogRecord({"name": "test", "levelno": level, "msg": message})
+
+    assert limiter.filter(record("Could not find channel with ID 1"))
+    assert not limiter.filter(record("Could not find channel with ID 1"))
+    assert not limiter.filter(record("Could not find channel with ID 1"))
+    assert limiter.filter(record("Could not find channel with ID 2"))
+    assert limiter.filter(record("Posted", logging.INFO))
+    assert limiter.filter(record("Posted", logging.INFO))
+
+    limiter._seen[("test", logging.WARNING, "Could not find channel with ID 1")][0] -= 61
+    passed = record("Could not find channel with ID 1")
+    assert limiter.filter(passed)
+    assert passed.suppressed == 2
+
+
+def test_handle_command_error_accepts_an_action(captured):
+    sent = []
+
+    async def send(**kwargs):
+        sent.append(kwargs)
+
+    ctx = SimpleNamespace(send=send, command="bluetrack", author="user#1", channel="general")
+    asyncio.run(handle_command_error(ctx, RuntimeError("feed down"), "checking blue tracker"))
+
+    (line,) = captured()
+    assert sent and sent[0]["embed"].title == "❗ Something Went Wrong"
+    assert line["message"] == "Unhandled command error while checking blue tracker: feed down"
+    assert line["command"] == "bluetrack"
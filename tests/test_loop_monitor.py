@@ -0,0 +1,55 @@
+"""Unit tests for the event-loop lag monitor.
+
+Blocks the loop with time.sleep and checks the watchdog names the caller.
+"""
+
+import asyncio
+import time
+import traceback
+
+from src.utils.loop_monitor import PROJECT_ROOT, LoopLagMonitor, culprit
+
+
+def blocking_parse():
+    time.sleep(0.3)
+
+
+def test_stall_reports_blocking_function_and_duration():
+    async def scenario():
+        monitor = LoopLagMonitor(threshold=0.05, interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        blocking_parse()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+        return monitor
+
+    monitor = asyncio.run(scenario())
+    report = monitor.report()
+    assert report["stalls"], "the watchdog should have caught the stall"
+    stall = report["stalls"][0]
+    assert stall["function"] == "blocking_parse"
+    assert "test_loop_monitor.py:" in stall["location"]
+    assert stall["blocked_ms"] >= 200
+    assert "blocking_parse" in monitor.stalls[0]["stack"]
+    assert report["max_lag_ms"] >= 200
+
+
+def test_idle_loop_reports_no_stalls():
+    async def scenario():
+        monitor = LoopLagMonitor(threshold=0.2, interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+        return monitor
+
+    assert asyncio.run(scenario()).report()["stalls"] == []
+
+
+def test_culprit_skips_library_frames():
+    stack = traceback.StackSummary.from_list([
+        (str(PROJECT_ROOT / "src/utils/blue_tracker.py"), 55, "fetch_blue_tracker_page", None),
+        ("/usr/lib/python3/site-packages/requests/api.py", 73, "get", None),
+        ("/usr/lib/python3/socket.py", 700, "readinto", None),
+    ])
+    assert culprit(stack).name == "fetch_blue_tracker_page"
@@ -0,0 +1,93 @@
+"""Unit tests for memory introspection and the capped seen-ID caches.
+
+Feeds are built from the recorded RSS in tests/fixtures; no network needed.
+"""
+
+import json
+import os
+import xml.etree.ElementTree as ET
+
+from src.utils import blue_tracker, wowhead_news
+from src.utils.memory import MemoryTracker
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def fixture_items(name):
+    return ET.parse(os.path.join(FIXTURES, name)).getroot().findall(".//item")
+
+
+def test_blue_tracker_seen_ids_are_capped_without_forgetting_live_posts(tmp_path, monkeypatch):
+    monkeypatch.setattr(blue_tracker, "MAX_SEEN_IDS", 10)
+    scraper = blue_tracker.BlueTrackerScraper(region_filter=None)
+    scraper.cache_file = str(tmp_path / "blue.json")
+    items = [item for item in fixture_items("blue_tracker.xml")
+             if scraper.is_relevant_post(scraper.parse_posts([item])[0])]
+    sticky, churn = items[0], items[1:31]
+
+    feed = {}
+    monkeypatch.setattr(scraper, "fetch_blue_tracker_page", lambda: feed["items"])
+    reported = []
+    for item in churn:
+        feed["items"] = [item, sticky]
+        reported.extend(post["title"] for post in scraper.get_new_posts())
+
+    with open(scraper.cache_file, encoding="utf-8") as f:
+        seen = json.load(f)["seen_posts"]
+    assert len(seen) == 10
+    # Posts still in the feed stay remembered however long they linger.
+    sticky_title = scraper.parse_posts([sticky])[0]["title"]
+    assert reported.count(sticky_title) == 1
+    assert seen[-1] == f"id_{scraper.parse_posts([sticky])[0]['post_id']}"
+
+
+def test_news_seen_ids_are_capped_without_forgetting_live_articles(tmp_path, monkeypatch):
+    monkeypatch.setattr(wowhead_news, "MAX_SEEN_IDS", 8)
+    scraper = wowhead_news.WowheadNewsScraper()
+    scraper.cache_file = str(tmp_path / "news.json")
+    items = fixture_items("wowhead_news.xml")
+    sticky, churn = items[0], items[1:]
+
+    feed = {}
+    monkeypatch.setattr(scraper, "fetch_news_page", lambda: feed["items"])
+    reported = []
+    for item in churn:
+        feed["items"] = [item, sticky]
+        reported.extend(article["article_id"] for article in scraper.get_new_articles())
+
+    with open(scraper.cache_file, encoding="utf-8") as f:
+        seen = json.load(f)["seen_articles"]
+    sticky_id = scraper.parse_articles([sticky])[0]["article_id"]
+    assert len(seen) == 8
+    assert seen[-1] == sticky_id
+    assert reported.count(sticky_id) == 1
+    assert len(reported) == len(set(reported))
+
+
+def allocate_leak(store):
+    store.extend(bytearray(1024) for _ in range(500))
+
+
+def test_tracker_reports_top_sites_and_growth():
+    tracker = MemoryTracker(keep=2)
+    started = tracker.start()
+    try:
+        store = []
+        tracker.snapshot("before")
+        allocate_leak(store)
+        tracker.snapshot("after")
+
+        growth = tracker.growth(5)
+        assert growth and growth[0].traceback[0].filename == __file__
+        assert growth[0].size_diff >= 500 * 1024
+
+        report = tracker.report(5)
+        assert "Top 5 allocation sites (after" in report
+        assert "growth since before" in report
+        assert "test_memory.py" in report
+
+        tracker.snapshot("again")
+        assert [label for label, _, _ in tracker.snapshots] == ["after", "again"]
+    finally:
+        if started:
+            tracker.stop()
@@ -0,0 +1,118 @@
+"""Unit tests for the Prometheus metrics registry and its hooks.
+
+Loops and the HTTP server run locally; fetches use stand-in response objects.
+"""
+
+import asyncio
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+
+from src.utils import metrics
+from src.utils.metrics import Registry
+from src.utils.send_queue import SendQueue
+
+
+def test_render_text_format():
+    registry = Registry()
+    counter = registry.counter("demo_total", "Demo counter.", ("kind",))
+    histogram = registry.histogram("demo_seconds", "Demo histogram.", ("kind",), buckets=(0.1, 1.0))
+    registry.gauge("demo_depth", "Demo gauge.", callback=lambda: 3)
+
+    counter.inc(kind='a "quoted" label')
+    histogram.observe(0.05, kind="x")
+    histogram.observe(0.5, kind="x")
+    histogram.observe(5, kind="x")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE demo_total counter" in lines
+    assert 'demo_total{kind="a \\"quoted\\" label"} 1' in lines
+    assert 'demo_seconds_bucket{kind="x",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{kind="x",le="1.0"} 2' in lines
+    assert 'demo_seconds_bucket{kind="x",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{kind="x"} 3' in lines
+    assert "demo_depth 3" in lines
+
+
+def test_fetch_hook_and_errors_are_counted_per_upstream():
+    before = metrics.FETCHES.value(upstream="test_upstream", status="200")
+    response = SimpleNamespace(status_code=200, elapsed=timedelta(milliseconds=120), content=b"x" * 64)
+    metrics.fetch_hooks("test_upstream")["response"](response)
+
+    assert metrics.FETCHES.value(upstream="test_upstream", status="200") == before + 1
+    assert metrics.FETCH_BYTES.value(upstream="test_upstream") >= 64
+    assert metrics.FETCH_LATENCY.count(upstream="test_upstream") >= 1
+
+    errors = metrics.FETCHES.value(upstream="test_upstream", status="error")
+    metrics.record_fetch_error("test_upstream", SimpleNamespace(request=object(), response=None))
+    metrics.record_fetch_error("test_upstream", SimpleNamespace(request=object(), response=response))
+    metrics.record_fetch_error("test_upstream", ValueError("not a fetch failure"))
+    assert metrics.FETCHES.value(upstream="test_upstream", status="error") == errors + 1
+
+
+def test_cache_hit_ratio():
+    for hit in (True, True, True, False):
+        metrics.record_cache("test_cache", hit)
+    assert "herald_cache_hit_ratio{cache=\"test_cache\"} 0.75" in metrics.REGISTRY.render()
+
+
+def test_instrument_loop_records_ticks_and_drift():
+    class Worker:
+        @tasks.loop(seconds=0.01, count=3)
+        async def tick(self):
+            pass
+
+    async def scenario():
+        worker = Worker()
+        metrics.instrument_loop(worker.tick, "test_loop")
+        metrics.instrument_loop(worker.tick, "test_loop")  # second call is a no-op
+        worker.tick.start()
+        await asyncio.wait_for(worker.tick.get_task(), timeout=5)
+
+    asyncio.run(scenario())
+    assert metrics.LOOP_TICKS.value(loop="test_loop", status="ok") == 3
+    assert metrics.LOOP_DURATION.count(loop="test_loop") == 3
+    assert metrics.LOOP_DRIFT.count(loop="test_loop") == 3
+
+
+def test_failing_slash_commands_are_counted():
+    async def failing(interaction: discord.Interaction):
+        pass
+
+    async def scenario():
+        bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+        bot.send_queue = SendQueue()
+        handled = []
+
+        async def on_error(interaction, error):
+            handled.append(error)
+
+        bot.tree.on_error = on_error
+        metrics.instrument_bot(bot)
+
+        command = app_commands.Command(name="test_failing", description="Always fails.", callback=failing)
+        interaction = SimpleNamespace(command=command, created_at=datetime.now(timezone.utc))
+        error = app_commands.CommandInvokeError(command, RuntimeError("boom"))
+        await bot.tree.on_error(interaction, error)
+        return handled, error
+
+    handled, error = asyncio.run(scenario())
+    assert handled == [error]  # the tree's own handler still runs
+    assert metrics.COMMANDS.value(command="test_failing", kind="slash", status="error") == 1
+    assert metrics.COMMAND_LATENCY.count(command="test_failing", kind="slash") == 1
+
+
+def test_server_serves_metrics_off_the_event_loop():
+    server = metrics.start_metrics_server("127.0.0.1", 0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert "# TYPE herald_commands_total counter" in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
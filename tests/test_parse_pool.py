@@ -0,0 +1,96 @@
+"""Unit tests for the feed parsing pool.
+
+Uses a private pool per test and the bundled blue tracker fixture — no network access.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from src.utils import blue_tracker as blue_tracker_module
+from src.utils.blue_tracker import BlueTrackerScraper
+from src.utils.parse_pool import ParsePool
+
+FIXTURE = Path(__file__).parent / "fixtures" / "blue_tracker.xml"
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_jobs_run_off_the_event_loop_in_the_callers_context():
+    pool = ParsePool(workers=1, queue_size=2)
+
+    def job(value):
+        return threading.current_thread().name, request_id.get(), value * 2
+
+    async def scenario():
+        request_id.set("abc")
+        return await pool.run(job, value=21)
+
+    thread, seen_id, result = asyncio.run(scenario())
+    pool.shutdown()
+    assert thread.startswith("parse") and thread != threading.main_thread().name
+    assert (seen_id, result) == ("abc", 42)
+
+
+def test_queue_is_bounded_and_waiters_do_not_block_the_loop():
+    pool = ParsePool(workers=2, queue_size=3)
+    release = threading.Event()
+
+    def job():
+        release.wait(2)
+        return True
+
+    async def scenario():
+        jobs = [asyncio.ensure_future(pool.run(job)) for _ in range(6)]
+        await asyncio.sleep(0.05)
+        assert pool.pending == 3  # two running, one waiting in the executor, three waiting for a slot
+        ticks = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < 0.05:
+            await asyncio.sleep(0.005)
+            ticks += 1
+        assert ticks > 3  # the event loop kept running while the pool was full
+        release.set()
+        return await asyncio.gather(*jobs)
+
+    assert asyncio.run(scenario()) == [True] * 6
+    assert pool.max_pending == 3 and pool.pending == 0
+    pool.shutdown()
+
+
+def test_pool_works_across_event_loops():
+    pool = ParsePool(workers=1, queue_size=1)
+    for _ in range(2):
+        assert asyncio.run(pool.run(sum, [1, 2])) == 3
+    pool.shutdown()
+
+
+def test_pool_rejects_a_queue_smaller_than_the_pool():
+    with pytest.raises(ValueError):
+        ParsePool(workers=4, queue_size=2)
+
+
+def test_check_new_posts_parses_on_the_pool(monkeypatch, tmp_path):
+    items = ET.fromstring(FIXTURE.read_bytes()).findall(".//item")
+    scraper = BlueTrackerScraper(region_filter=None)
+    scraper.cache_file = str(tmp_path / "cache.json")
+    monkeypatch.setattr(scraper, "fetch_blue_tracker_page", lambda: items)
+    pool = ParsePool(workers=1, queue_size=1)
+    monkeypatch.setattr(blue_tracker_module, "run_parse", pool.run)
+
+    parsed_on = []
+    relevant_posts = scraper.relevant_posts
+    monkeypatch.setattr(scraper, "relevant_posts",
+                        lambda i: parsed_on.append(threading.current_thread().name) or relevant_posts(i))
+
+    first = asyncio.run(scraper.check_new_posts())
+    again = asyncio.run(scraper.check_new_posts())
+    pool.shutdown()
+    assert parsed_on and all(name.startswith("parse") for name in parsed_on)
+    assert 0 < len(first) <= 3 and again == []
+    assert all(isinstance(post, dict) for post in first)
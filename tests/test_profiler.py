@@ -0,0 +1,76 @@
+"""Unit tests for the on-demand profiler.
+
+Profiles a small busy coroutine on the event loop; no Discord connection needed.
+"""
+
+import asyncio
+import pstats
+
+import pytest
+
+from src.utils.parse_pool import ParsePool
+from src.utils.profiler import ProfilerBusy, profile_for
+
+
+def keyword_scan(n):
+    return sum(1 for i in range(n) if "reset" in f"weekly reset {i}")
+
+
+async def busy(stop):
+    while not stop.is_set():
+        keyword_scan(2000)
+        await asyncio.sleep(0)
+
+
+def test_profile_captures_loop_work_and_saves_raw_profile(tmp_path):
+    async def scenario():
+        stop = asyncio.Event()
+        worker = asyncio.create_task(busy(stop))
+        result = await profile_for(0.2, top=10, directory=str(tmp_path))
+        stop.set()
+        await worker
+        return result
+
+    summary, path = asyncio.run(scenario())
+    assert "Top 10 by own time" in summary and "Top 10 by cumulative time" in summary
+    assert "keyword_scan" in summary
+    assert path.startswith(str(tmp_path)) and path.endswith(".prof")
+    assert any("keyword_scan" in func[2] for func in pstats.Stats(path).stats)
+
+
+def pool_keyword_scan(n):
+    return keyword_scan(n)
+
+
+def test_profile_includes_parse_pool_jobs(tmp_path):
+    pool = ParsePool(workers=1, queue_size=1)
+
+    async def scenario():
+        stop = asyncio.Event()
+
+        async def feed_parses():
+            while not stop.is_set():
+                await pool.run(pool_keyword_scan, 2000)
+                await asyncio.sleep(0.01)
+
+        worker = asyncio.create_task(feed_parses())
+        result = await profile_for(0.2, top=10, directory=str(tmp_path))
+        stop.set()
+        await worker
+        return result
+
+    summary, path = asyncio.run(scenario())
+    pool.shutdown()
+    assert any("pool_keyword_scan" in func[2] for func in pstats.Stats(path).stats)
+
+
+def test_only_one_profile_at_a_time(tmp_path):
+    async def scenario():
+        first = asyncio.create_task(profile_for(0.1, directory=str(tmp_path)))
+        await asyncio.sleep(0)
+        with pytest.raises(ProfilerBusy):
+            await profile_for(0.1, directory=str(tmp_path))
+        await first
+        await profile_for(0, directory=str(tmp_path))  # free again once the first finished
+
+    asyncio.run(scenario())
@@ -0,0 +1,89 @@
+"""Unit tests for the memoized reset digest.
+
+Uses a stand-in blue tracker with canned posts — no network access.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src.utils.blue_tracker import BlueTrackerScraper
+from src.utils.reset_digest import ResetDigest, reset_week
+
+
+class FakeBlueTracker(BlueTrackerScraper):
+    def __init__(self, posts):
+        super().__init__(region_filter="us")
+        self.posts = posts
+        self.fetches = 0
+
+    def fetch_blue_tracker_page(self):
+        self.fetches += 1
+        self.snapshot, self.snapshot_at = ["item"], datetime.now(timezone.utc)
+        return self.snapshot
+
+    def get_reset_relevant_posts(self, days_back=7, items=None):
+        return list(self.posts)
+
+
+POST = {"title": "Mythic+ affixes this week", "url": "https://example.com/1", "content_preview": ""}
+
+
+def test_repeated_refresh_serves_memoized_embed_without_fetching():
+    tracker = FakeBlueTracker([POST])
+    digest = ResetDigest(tracker)
+
+    async def scenario():
+        await digest.refresh()
+        first = digest.checklist_embed()
+        await digest.refresh()
+        return first, digest.checklist_embed()
+
+    first, second = asyncio.run(scenario())
+    assert tracker.fetches == 1
+    assert first is second
+
+
+def test_new_snapshot_with_changed_posts_rerenders():
+    tracker = FakeBlueTracker([POST])
+    digest = ResetDigest(tracker)
+
+    async def scenario():
+        await digest.refresh()
+        first = digest.warning_embed()
+        version = digest.version
+
+        # Same posts in a newer snapshot: summary unchanged, embed reused.
+        tracker.fetch_blue_tracker_page()
+        await digest.refresh()
+        assert digest.version == version
+        assert digest.warning_embed() is first
+
+        tracker.posts = [POST, dict(POST, title="Raid hotfixes", url="https://example.com/2")]
+        tracker.fetch_blue_tracker_page()
+        await digest.refresh()
+        return first, digest.warning_embed(), version
+
+    first, second, version = asyncio.run(scenario())
+    assert digest.version != version
+    assert first is not second
+
+
+def test_stale_snapshot_is_refetched():
+    tracker = FakeBlueTracker([])
+    digest = ResetDigest(tracker)
+
+    async def scenario():
+        await digest.refresh()
+        tracker.snapshot_at -= timedelta(hours=1)
+        await digest.refresh()
+
+    asyncio.run(scenario())
+    assert tracker.fetches == 2
+
+
+def test_reset_week_rolls_over_on_tuesday_reset():
+    before = datetime(2025, 9, 2, 14, 59, tzinfo=timezone.utc)  # Tuesday, just before reset
+    after = datetime(2025, 9, 2, 15, 0, tzinfo=timezone.utc)
+    monday = datetime(2025, 9, 8, 12, 0, tzinfo=timezone.utc)
+    assert reset_week(before) != reset_week(after)
+    assert reset_week(after) == reset_week(monday)
@@ -0,0 +1,129 @@
+"""Unit tests for the scheduler's slot arithmetic and exactly-once firing.
+
+Runs on a fake clock with stub announcements — no Discord connection or feeds involved.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from src.tasks.scheduler import (
+    ANNOUNCEMENT_SLOTS,
+    FIRE_GRACE,
+    ScheduledTasks,
+    last_slot_time,
+    next_slot_time,
+)
+from src.utils.clock import FakeClock, set_clock
+
+MONDAY_WARNING = ANNOUNCEMENT_SLOTS["monday_warning"]
+TUESDAY_CHECKLIST = ANNOUNCEMENT_SLOTS["tuesday_checklist"]
+
+
+def test_next_slot_later_same_week():
+    now = datetime(2025, 9, 1, 17, 50, tzinfo=timezone.utc)  # Monday
+    assert next_slot_time(now, MONDAY_WARNING) == datetime(2025, 9, 1, 18, 0, tzinfo=timezone.utc)
+    assert next_slot_time(now, TUESDAY_CHECKLIST) == datetime(2025, 9, 2, 16, 0, tzinfo=timezone.utc)
+
+
+def test_next_slot_is_inclusive_of_now():
+    now = datetime(2025, 9, 1, 18, 0, tzinfo=timezone.utc)
+    assert next_slot_time(now, MONDAY_WARNING) == now
+
+
+def test_next_slot_rolls_to_following_week():
+    now = datetime(2025, 9, 1, 18, 1, tzinfo=timezone.utc)
+    assert next_slot_time(now, MONDAY_WARNING) == datetime(2025, 9, 8, 18, 0, tzinfo=timezone.utc)
+
+
+def test_last_slot_is_inclusive_of_now_and_rolls_back_a_week():
+    now = datetime(2025, 9, 1, 18, 0, tzinfo=timezone.utc)
+    assert last_slot_time(now, MONDAY_WARNING) == now
+    assert last_slot_time(now - timedelta(minutes=1), MONDAY_WARNING) == now - timedelta(days=7)
+
+
+class StubChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+
+class StubBot:
+    send_queue = None
+
+    def __init__(self):
+        self.channel = StubChannel()
+
+    def get_channel(self, channel_id):
+        return self.channel
+
+
+@pytest.fixture
+def clock(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # the schedule state file is written to the working directory
+    monkeypatch.setenv("TARGET_CHANNEL_ID", "1")
+    monkeypatch.setenv("DELIVERY_MODE", "channel")
+    fake = FakeClock(datetime(2025, 9, 1, 17, 55, tzinfo=timezone.utc))  # Monday, before the warning
+    set_clock(fake)
+    yield fake
+    set_clock(None)
+
+
+def make_scheduler(bot):
+    scheduler = ScheduledTasks(bot)
+
+    async def build():
+        return "v1", [{"content": "warning", "embed": discord.Embed(title="Warning")}], ""
+
+    scheduler._announcement_builders = {"monday_warning": build, "tuesday_checklist": build}
+    return scheduler
+
+
+def run_ticks(scheduler, clock, *offsets):
+    async def ticks():
+        for offset in offsets:
+            clock.now = datetime(2025, 9, 1, 18, 0, tzinfo=timezone.utc) + offset
+            await scheduler.scheduled_posts()
+    asyncio.run(ticks())
+
+
+def test_slot_posts_once_despite_repeated_ticks_and_a_restart(clock):
+    bot = StubBot()
+    scheduler = make_scheduler(bot)
+    run_ticks(scheduler, clock, timedelta(minutes=-5), timedelta(seconds=1), timedelta(seconds=59))
+    assert bot.channel.sent == ["warning"]
+
+    # A new process in the same minute reads the slot back from the state file.
+    run_ticks(make_scheduler(bot), clock, timedelta(seconds=30), timedelta(minutes=5))
+    assert bot.channel.sent == ["warning"]
+
+
+def test_missed_slot_posts_late_within_the_grace_window_only(clock):
+    bot = StubBot()
+    run_ticks(make_scheduler(bot), clock, timedelta(minutes=-2), timedelta(minutes=12), timedelta(minutes=13))
+    assert bot.channel.sent == ["warning"]
+
+    bot = StubBot()
+    clock.now = datetime(2025, 9, 8, 18, 0, tzinfo=timezone.utc) + FIRE_GRACE + timedelta(minutes=1)
+    scheduler = make_scheduler(bot)
+    asyncio.run(scheduler.scheduled_posts())
+    assert bot.channel.sent == []
+
+
+def test_cluster_processes_keep_separate_schedule_state(clock):
+    first, second = StubBot(), StubBot()
+    first.shard_count = second.shard_count = 4
+    first.shard_ids, second.shard_ids = [1, 0], [2, 3]
+    first.channel.guild, second.channel.guild = SimpleNamespace(id=0), SimpleNamespace(id=2 << 22)  # shards 0 and 2
+    leader, follower = make_scheduler(first), make_scheduler(second)
+    assert (leader.state_file, follower.state_file) == ("schedule_state.0-1.json", "schedule_state.2-3.json")
+
+    # The first process posting its slot must not stop the second from posting its own.
+    run_ticks(leader, clock, timedelta(seconds=1))
+    run_ticks(follower, clock, timedelta(seconds=5))
+    assert first.channel.sent == ["warning"] and second.channel.sent == ["warning"]
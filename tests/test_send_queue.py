@@ -0,0 +1,151 @@
+"""Unit tests for the outbound send queue.
+
+Uses plain coroutines as stand-in sends — no Discord connection needed.
+"""
+
+import asyncio
+
+from src.utils.send_queue import (
+    PRIORITY_FEED,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SCHEDULED,
+    SEND_WAIT,
+    SendQueue,
+)
+
+
+def _recorder(sent, label, gate=None):
+    async def send():
+        if gate is not None:
+            await gate.wait()
+        sent.append(label)
+        return label
+    return send
+
+
+def test_scheduled_sends_before_feed_and_replies_skip_the_queue():
+    before = {name: SEND_WAIT.count(priority=name) for name in ("interactive", "scheduled", "feed")}
+
+    async def scenario():
+        queue = SendQueue(workers=1)
+        queue.start()
+        gate = asyncio.Event()
+        sent = []
+
+        # Occupy the single worker so everything else has to queue up.
+        blocker = asyncio.create_task(queue.submit(_recorder(sent, "blocker", gate), PRIORITY_FEED))
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(queue.submit(_recorder(sent, "feed"), PRIORITY_FEED)),
+            asyncio.create_task(queue.submit(_recorder(sent, "scheduled"), PRIORITY_SCHEDULED)),
+            asyncio.create_task(queue.submit(_recorder(sent, "reply"), PRIORITY_INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(blocker, *tasks)
+        await queue.stop()
+        return sent, queue.stats()
+
+    sent, stats = asyncio.run(scenario())
+    assert sent == ["reply", "blocker", "scheduled", "feed"]
+    assert stats["priorities"]["feed"]["sent"] == 2
+    # Every send's wait is exported as well, under its priority.
+    assert {name: SEND_WAIT.count(priority=name) - count for name, count in before.items()} == \
+        {"interactive": 1, "scheduled": 1, "feed": 2}
+
+
+def test_duplicate_feed_items_are_coalesced():
+    async def scenario():
+        queue = SendQueue(workers=1)
+        queue.start()
+        gate = asyncio.Event()
+        sent = []
+
+        blocker = asyncio.create_task(queue.submit(_recorder(sent, "blocker", gate), PRIORITY_FEED))
+        await asyncio.sleep(0)
+        first = asyncio.create_task(queue.submit(_recorder(sent, "post"), PRIORITY_FEED, key="blue:1"))
+        second = asyncio.create_task(queue.submit(_recorder(sent, "post"), PRIORITY_FEED, key="blue:1"))
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(blocker, first, second)
+        await queue.stop()
+        return sent, results, queue.stats()
+
+    sent, results, stats = asyncio.run(scenario())
+    assert sent == ["blocker", "post"]
+    assert results == ["blocker", "post", "post"]
+    assert stats["priorities"]["feed"]["coalesced"] == 1
+
+
+def test_background_sends_block_when_full_but_replies_do_not():
+    async def scenario():
+        queue = SendQueue(maxsize=1, workers=1)
+        queue.start()
+        gate = asyncio.Event()
+        sent = []
+
+        blocker = asyncio.create_task(queue.submit(_recorder(sent, "blocker", gate), PRIORITY_FEED))
+        await asyncio.sleep(0)
+        waiting_feed = asyncio.create_task(queue.submit(_recorder(sent, "feed"), PRIORITY_FEED))
+        reply = asyncio.create_task(queue.submit(_recorder(sent, "reply"), PRIORITY_INTERACTIVE))
+        await asyncio.sleep(0)
+        depth_while_full = queue.depth  # the feed send waits for room and the reply never queues
+        gate.set()
+        await asyncio.gather(blocker, waiting_feed, reply)
+        await queue.stop()
+        return sent, depth_while_full
+
+    sent, depth_while_full = asyncio.run(scenario())
+    assert depth_while_full == 0
+    assert sent == ["reply", "blocker", "feed"]
+
+
+def test_unstarted_queue_sends_directly():
+    sent = []
+    assert asyncio.run(SendQueue().submit(_recorder(sent, "x"), PRIORITY_FEED)) == "x"
+    assert sent == ["x"]
+
+
+def test_replies_are_ordered_per_channel_only():
+    async def scenario():
+        queue = SendQueue(workers=1)
+        queue.start()
+        gate = asyncio.Event()
+        sent = []
+
+        first = asyncio.create_task(queue.submit(_recorder(sent, "a1", gate), PRIORITY_INTERACTIVE, channel=1))
+        second = asyncio.create_task(queue.submit(_recorder(sent, "a2"), PRIORITY_INTERACTIVE, channel=1))
+        other = asyncio.create_task(queue.submit(_recorder(sent, "b1"), PRIORITY_INTERACTIVE, channel=2))
+        await asyncio.sleep(0.01)
+        before_gate = list(sent)
+        gate.set()
+        await asyncio.gather(first, second, other)
+        await queue.stop()
+        return before_gate, sent, queue.stats()
+
+    before_gate, sent, stats = asyncio.run(scenario())
+    assert before_gate == ["b1"]  # channel 2 is not held up by channel 1
+    assert sent == ["b1", "a1", "a2"]
+    assert stats["priorities"]["interactive"]["sent"] == 3
+
+
+def test_stop_fails_sends_still_waiting():
+    async def scenario():
+        queue = SendQueue(maxsize=2, workers=1)
+        queue.start()
+        gate = asyncio.Event()
+        sent = []
+
+        running = asyncio.create_task(queue.submit(_recorder(sent, "running", gate), PRIORITY_FEED))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(queue.submit(_recorder(sent, "queued"), PRIORITY_FEED))
+        blocked = asyncio.create_task(queue.submit(_recorder(sent, "blocked"), PRIORITY_FEED))
+        await asyncio.sleep(0.01)
+        await queue.stop()
+        results = await asyncio.wait_for(asyncio.gather(running, queued, blocked, return_exceptions=True), 1)
+        return sent, results
+
+    sent, (running, queued, blocked) = asyncio.run(scenario())
+    assert sent == []
+    assert isinstance(running, asyncio.CancelledError)
+    assert isinstance(queued, RuntimeError) and isinstance(blocked, RuntimeError)
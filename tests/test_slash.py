@@ -0,0 +1,95 @@
+"""Unit tests for the slash command handlers.
+
+Drives the cog callbacks with a stand-in interaction and blue tracker — no Discord connection.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from src.commands import slash
+from src.commands.slash import SlashCommands
+from src.utils.blue_tracker import BlueTrackerScraper
+from src.utils.reset_digest import ResetDigest
+
+
+class FakeResponse:
+    def __init__(self):
+        self.deferred = False
+        self.sent = []
+
+    def is_done(self):
+        return self.deferred or bool(self.sent)
+
+    async def defer(self, thinking=False):
+        self.deferred = True
+
+    async def send_message(self, content=None, embeds=None, ephemeral=False):
+        self.sent.append((content, embeds))
+
+
+class FakeFollowup:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, embeds=None, ephemeral=False):
+        self.sent.append((content, embeds))
+
+
+class FakeInteraction:
+    def __init__(self):
+        self.response = FakeResponse()
+        self.followup = FakeFollowup()
+
+
+class FakeBlueTracker(BlueTrackerScraper):
+    def __init__(self):
+        super().__init__(region_filter="us")
+        self.fetches = 0
+
+    def fetch_blue_tracker_page(self):
+        self.fetches += 1
+        self.snapshot, self.snapshot_at = [], datetime.now(timezone.utc)
+        return self.snapshot
+
+    def get_reset_relevant_posts(self, days_back=7, items=None):
+        return []
+
+
+def _cog(tracker):
+    cog = SlashCommands(bot=None)
+    cog.digest = ResetDigest(tracker)
+    return cog
+
+
+def test_checklist_answers_inline_when_the_snapshot_is_fresh():
+    tracker = FakeBlueTracker()
+    tracker.fetch_blue_tracker_page()
+    cog, interaction = _cog(tracker), FakeInteraction()
+
+    asyncio.run(cog.checklist.callback(cog, interaction))
+    assert not interaction.response.deferred
+    assert len(interaction.response.sent) == 1 and not interaction.followup.sent
+    assert tracker.fetches == 1
+
+
+def test_checklist_defers_when_the_snapshot_is_stale():
+    tracker = FakeBlueTracker()
+    cog, interaction = _cog(tracker), FakeInteraction()
+
+    asyncio.run(cog.checklist.callback(cog, interaction))
+    assert interaction.response.deferred
+    assert len(interaction.followup.sent) == 1
+    assert tracker.fetches == 1
+
+
+def test_failing_deferred_command_sends_an_error_followup(monkeypatch):
+    async def broken_news_reply(action, scraper):
+        raise RuntimeError("wowhead is down")
+
+    monkeypatch.setattr(slash, "news_reply", broken_news_reply)
+    cog, interaction = _cog(FakeBlueTracker()), FakeInteraction()
+
+    asyncio.run(cog.news.callback(cog, interaction, action="check"))
+    assert interaction.response.deferred
+    [(content, embeds)] = interaction.followup.sent
+    assert "wowhead is down" in embeds[0].fields[0].value
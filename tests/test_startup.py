@@ -0,0 +1,31 @@
+"""Unit tests for the startup timing report."""
+
+import json
+
+from src.utils.startup import StartupTimer
+
+
+def test_phases_are_consecutive_and_sum_to_total():
+    timer = StartupTimer(started_at=0.0)
+    timer.mark("imports")
+    timer.mark("extensions")
+
+    report = timer.report()
+    assert list(report["phases_ms"]) == ["imports", "extensions"]
+    assert abs(sum(report["phases_ms"].values()) - report["total_ms"]) < 0.5
+
+
+def test_extension_timing_and_errors_are_reported(tmp_path):
+    timer = StartupTimer()
+    with timer.extension("src.commands.time"):
+        pass
+    timer.errors["src.commands.broken"] = "boom"
+    timer.mark("extensions")
+
+    path = tmp_path / "startup.json"
+    text = timer.dump(str(path))
+    report = json.loads(path.read_text())
+    assert report == json.loads(text)
+    assert "src.commands.time" in report["extensions_ms"]
+    assert report["extension_errors"] == {"src.commands.broken": "boom"}
+    assert timer.summary().startswith("[STARTUP] extensions ")
@@ -0,0 +1,110 @@
+"""Unit tests for the local Raider.IO / Wowhead stand-in and the configurable base URLs.
+
+The stub runs in-process on a free port; nothing leaves the machine.
+"""
+
+import asyncio
+import time
+
+import pytest
+import requests
+
+from src.utils import api
+from src.utils.blue_tracker import BlueTrackerScraper
+from src.utils.metrics import FETCHES
+from src.utils.stub_upstream import BLUE_TRACKER_PATH, NEWS_PATH, StubConfig, StubUpstream
+from src.utils.wowhead_news import WowheadNewsScraper
+
+
+@pytest.fixture
+def stub():
+    server = StubUpstream(seed=1).start()
+    yield server
+    server.close()
+
+
+def test_scrapers_and_api_use_configured_base_urls(stub, monkeypatch):
+    monkeypatch.setenv("WOWHEAD_BASE_URL", stub.url + "/")
+    monkeypatch.setenv("RAIDERIO_BASE_URL", stub.url)
+    monkeypatch.setenv("RAIDER_IO_API_KEY", "stub")
+    monkeypatch.setattr(api, "_cache", {})
+
+    assert BlueTrackerScraper().url == f"{stub.url}/blue-tracker?rss"
+    assert len(BlueTrackerScraper().fetch_blue_tracker_page()) == 50
+    assert len(WowheadNewsScraper().fetch_news_page()) == 25
+
+    affixes, error = asyncio.run(api.fetch_affixes("eu"))
+    assert error is None and affixes["region"] == "eu" and affixes["affix_details"]
+    cutoffs, error = asyncio.run(api.fetch_season_cutoffs("us"))
+    assert error is None and cutoffs["cutoffs"]["p999"]
+
+
+def test_defaults_are_the_live_services(monkeypatch):
+    monkeypatch.delenv("WOWHEAD_BASE_URL", raising=False)
+    monkeypatch.delenv("RAIDERIO_BASE_URL", raising=False)
+    assert BlueTrackerScraper().url == "https://www.wowhead.com/blue-tracker?rss"
+    assert WowheadNewsScraper().url == "https://www.wowhead.com/news/rss/all"
+    assert api._api_url("mythic-plus/affixes") == "https://raider.io/api/v1/mythic-plus/affixes"
+
+
+def test_unchanged_feed_is_a_conditional_304_reusing_the_snapshot(stub):
+    scraper = BlueTrackerScraper(base_url=stub.url)
+    first = scraper.fetch_blue_tracker_page()
+    fetched_at = scraper.snapshot_at
+    assert "If-None-Match" in scraper.validators
+
+    assert scraper.fetch_blue_tracker_page() is first
+    assert scraper.snapshot_at > fetched_at
+    assert stub.stats[(BLUE_TRACKER_PATH, 200)] == 1
+    assert stub.stats[(BLUE_TRACKER_PATH, 304)] == 1
+
+    # A new version of the feed has a new ETag, so it is fetched in full.
+    stub.set_body(BLUE_TRACKER_PATH, b"<rss><channel><item><title>New</title></item></channel></rss>")
+    assert len(scraper.fetch_blue_tracker_page()) == 1
+    assert stub.stats[(BLUE_TRACKER_PATH, 200)] == 2
+
+
+def test_injected_errors_and_rate_limits_are_failed_fetches(stub):
+    before = FETCHES.samples().get(("wowhead_news", "429"), 0)
+    stub.config.rate_limit_rate = 1.0
+    stub.config.retry_after = 7
+    assert WowheadNewsScraper(base_url=stub.url).fetch_news_page() is None
+    assert FETCHES.samples()[("wowhead_news", "429")] == before + 1
+
+    response = requests.get(stub.url + NEWS_PATH, timeout=5)
+    assert response.status_code == 429 and response.headers["Retry-After"] == "7"
+
+    stub.config.rate_limit_rate, stub.config.error_rate = 0.0, 1.0
+    assert requests.get(stub.url + NEWS_PATH, timeout=5).status_code == 500
+    assert stub.stats[(NEWS_PATH, 500)] == 1
+
+
+def test_faults_are_reproducible_from_the_seed():
+    config = StubConfig(error_rate=0.3, rate_limit_rate=0.2, not_modified_rate=0.1, jitter=0.5, latency=0.5)
+    runs = []
+    for _ in range(2):
+        stub = StubUpstream(config, seed=42)
+        runs.append([stub._draw() for _ in range(50)])
+    assert runs[0] == runs[1]
+    statuses = {status for _, status in runs[0]}
+    assert statuses == {500, 429, 304, None}
+    assert all(0.0 <= delay <= 1.0 for delay, _ in runs[0])
+
+
+def test_latency_and_slow_drip_bodies(stub):
+    stub.config.latency = 0.2
+    started = time.perf_counter()
+    requests.get(stub.url + NEWS_PATH, timeout=5)
+    assert time.perf_counter() - started >= 0.2
+
+    stub.config.latency = 0.0
+    stub.config.drip_bytes, stub.config.drip_interval = 2048, 0.05
+    started = time.perf_counter()
+    body = requests.get(stub.url + NEWS_PATH, timeout=5).content
+    assert len(body) > 8 * 2048
+    assert time.perf_counter() - started >= 0.05 * (len(body) // 2048)
+
+    # The read timeout applies per chunk: a pause longer than it fails the fetch.
+    stub.config.drip_interval = 0.5
+    with pytest.raises(requests.RequestException):
+        requests.get(stub.url + NEWS_PATH, timeout=0.2)
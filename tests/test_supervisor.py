@@ -0,0 +1,109 @@
+"""Unit tests for the background loop supervisor.
+
+Runs real `tasks.Loop`s on short intervals with tiny restart delays.
+"""
+
+import asyncio
+import json
+
+from discord.ext import tasks
+
+from src.utils.supervisor import FAILURE_THRESHOLD, LOOP_RESTARTS, LoopSupervisor
+
+
+class Worker:
+    def __init__(self, fail_ticks=0, fail_before=0):
+        self.fail_ticks = fail_ticks  # iterations that raise
+        self.fail_before = fail_before  # loop starts whose before_loop raises
+        self.ticks = 0
+        self.starts = 0
+
+    @tasks.loop(seconds=0.01)
+    async def loop(self):
+        self.ticks += 1
+        if self.ticks <= self.fail_ticks:
+            raise RuntimeError(f"tick {self.ticks}")
+
+    @loop.before_loop
+    async def before(self):
+        self.starts += 1
+        if self.starts <= self.fail_before:
+            raise ConnectionError("gateway not ready")
+
+
+async def wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+def test_failed_iterations_are_counted_and_the_loop_keeps_going():
+    async def scenario():
+        worker = Worker(fail_ticks=FAILURE_THRESHOLD)
+        supervisor = LoopSupervisor(base_delay=0.01)
+        supervisor.add("worker", worker.loop)
+        supervisor.start()
+
+        health = supervisor.stats["worker"]
+        await wait_for(lambda: health.consecutive_failures == FAILURE_THRESHOLD)
+        assert not supervisor.healthy
+        assert health.last_error == f"RuntimeError: tick {FAILURE_THRESHOLD}"
+        assert supervisor.http_response()[0] == 503
+
+        await wait_for(lambda: health.last_success is not None)
+        assert supervisor.healthy and health.consecutive_failures == 0
+        assert health.failures == FAILURE_THRESHOLD and health.restarts == 0
+        assert health.last_duration is not None and health.last_drift is not None
+
+        status, content_type, body = supervisor.http_response()
+        assert status == 200 and content_type == "application/json"
+        assert json.loads(body)["loops"]["worker"]["ticks"] >= FAILURE_THRESHOLD + 1
+        await supervisor.stop()
+
+    asyncio.run(scenario())
+
+
+def test_a_failing_before_loop_is_restarted_with_backoff():
+    before = LOOP_RESTARTS.value(loop="worker", reason="error")
+
+    async def scenario():
+        worker = Worker(fail_before=2)
+        supervisor = LoopSupervisor(base_delay=0.02)
+        supervisor.add("worker", worker.loop)
+        started = asyncio.get_running_loop().time()
+        supervisor.start()
+
+        health = supervisor.stats["worker"]
+        await wait_for(lambda: health.state == "restarting")
+        assert "ConnectionError" in health.last_error
+        await wait_for(lambda: worker.ticks > 0)
+        # Two deaths in a row: 0.02s then 0.04s before the loop came back.
+        assert asyncio.get_running_loop().time() - started >= 0.06
+        assert health.restarts == 2 and worker.starts == 3
+        assert health.state == "running"
+        await supervisor.stop()
+
+    asyncio.run(scenario())
+    assert LOOP_RESTARTS.value(loop="worker", reason="error") == before + 2
+
+
+def test_a_cancelled_loop_is_restarted_but_stop_is_final():
+    async def scenario():
+        worker = Worker()
+        supervisor = LoopSupervisor(base_delay=0.01)
+        supervisor.add("worker", worker.loop)
+        supervisor.start()
+        await wait_for(lambda: worker.ticks > 0)
+
+        worker.loop.cancel()
+        health = supervisor.stats["worker"]
+        await wait_for(lambda: health.restarts == 1 and health.state == "running")
+        assert health.last_error == "task was cancelled"
+
+        await supervisor.stop()
+        await asyncio.sleep(0.05)
+        assert health.state == "stopped" and not worker.loop.is_running()
+        assert health.restarts == 1
+
+    asyncio.run(scenario())
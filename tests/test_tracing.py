@@ -0,0 +1,103 @@
+"""Unit tests for tracing spans and the trace file converters.
+
+Spans are written to a temporary file through the real exporter.
+"""
+
+import asyncio
+
+from src.utils import tracing
+from src.utils.tracing import (
+    read_spans,
+    span,
+    start_tracing,
+    stop_tracing,
+    to_chrome_trace,
+    to_otlp,
+    traced,
+)
+
+
+@traced("fetch")
+def fetch_feed():
+    with span("parse.xml", bytes=3):
+        return "<rss/>"
+
+
+@traced("render")
+async def render(text):
+    await asyncio.sleep(0)
+    return text.upper()
+
+
+def test_spans_nest_across_awaits_and_threads(tmp_path):
+    path = str(tmp_path / "traces.jsonl")
+    start_tracing(path)
+    try:
+        async def command():
+            with span("command.checklist", kind="prefix"):
+                text = await asyncio.to_thread(fetch_feed)
+                await render(text)
+
+        asyncio.run(command())
+    finally:
+        stop_tracing()
+
+    spans = {item["name"]: item for item in read_spans(path)}
+    root = spans["command.checklist"]
+    assert root["parent_id"] is None and root["attrs"] == {"kind": "prefix"}
+    assert spans["fetch.fetch_feed"]["parent_id"] == root["span_id"]
+    assert spans["fetch.fetch_feed"]["thread"] != root["thread"]
+    assert spans["parse.xml"]["parent_id"] == spans["fetch.fetch_feed"]["span_id"]
+    assert spans["render.render"]["parent_id"] == root["span_id"]
+    assert {item["trace_id"] for item in spans.values()} == {root["trace_id"]}
+
+
+def test_errors_are_recorded_and_reraised(tmp_path):
+    path = str(tmp_path / "traces.jsonl")
+    start_tracing(path)
+    try:
+        try:
+            with span("tick.news_monitor"):
+                raise RuntimeError("feed down")
+        except RuntimeError:
+            pass
+    finally:
+        stop_tracing()
+
+    (item,) = read_spans(path)
+    assert item["error"] == "RuntimeError: feed down"
+
+
+def test_disabled_tracing_is_a_no_op():
+    assert tracing._exporter is None
+    with span("command.time") as current:
+        assert current is None
+    assert fetch_feed() == "<rss/>"
+
+
+def test_rotated_files_are_read_and_converted(tmp_path):
+    path = str(tmp_path / "traces.jsonl")
+    start_tracing(path, max_bytes=2000, backups=5)
+    try:
+        for _ in range(10):
+            with span("tick.scheduled_posts"):
+                fetch_feed()
+    finally:
+        stop_tracing()
+
+    assert (tmp_path / "traces.jsonl.1").exists()
+    spans = read_spans(path)
+    assert len(spans) == 30
+    ticks = [item["start_us"] for item in spans if item["name"] == "tick.scheduled_posts"]
+    assert ticks == sorted(ticks)  # backups come first, oldest to newest
+
+    chrome = to_chrome_trace(spans)
+    complete = [event for event in chrome["traceEvents"] if event["ph"] == "X"]
+    assert len(complete) == 30
+    assert len({event["tid"] for event in complete}) == 10  # one row per tick
+
+    otlp_spans = to_otlp(spans)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    child = next(item for item in otlp_spans if item["name"] == "parse.xml")
+    assert len(child["traceId"]) == 32 and len(child["spanId"]) == 16
+    assert child["parentSpanId"]
+    assert {"key": "bytes", "value": {"intValue": "3"}} in child["attributes"]